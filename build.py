@@ -60,6 +60,9 @@ Remote Docker modunda Mutagen kritik rol oynar:
    - Kaynak dosyalar otomatik olarak container'a senkronize edilir
    - Derleme işlemi uzak sunucuda gerçekleşir
    - Sonuçlar (outputs/) yerel makineye .tar.gz arşivi olarak geri senkronize edilir
+   - Arşiv belleğe alınmadan doğrudan diske aktarılır
+   - docker.transfer = "delta" ile container çıktının hash manifestini üretir; sadece yerel
+     kopyadan farklı dosyalar aktarılır ve output_dir güncel tutulur
 
 Derleme Akışı:
 -------------
@@ -85,7 +88,7 @@ Derleme Akışı:
 
 Ana Fonksiyonlar:
 ----------------
-- check_vendor_dependencies(): Vendor dosyalarını kontrol eder ve gerekirse derler
+- check_vendor_dependencies(): Vendor dosyalarını vendor.lock ile doğrular, yalnızca değişen girdileri derler
 - clean_site_directory(): Önceki derleme çıktılarını temizler
 - build_documentation(): MkDocs ile dokümantasyonu derler
 - show_build_success(): Başarılı derleme sonrası bilgileri gösterir
@@ -97,13 +100,115 @@ Konfigürasyon (config.json):
 {
   "build": {
     "check_vendor_dependencies": true,  // Vendor kontrolü yapılsın mı?
-    "clean_before_build": true         // Derlemeden önce temizlik yapılsın mı?
+    "clean_before_build": true,        // Derlemeden önce temizlik yapılsın mı? (staged_output kapalıyken)
+    "staged_output": true,             // Kardeş staging dizinine derle ve atomik olarak değiştir
+    "incremental": false,              // Sadece değişen sayfalar yeniden derlensin mi? (CI'da varsayılan)
+    "jobs": 1,                         // Dilleri paralel derleyen worker process sayısı
+    "page_jobs": 1,                    // Bir dilin sayfalarını paralel işleyen worker process sayısı
+    "minify": true,                    // HTML, inline script ve özel JS/CSS dosyalarını küçült
+    "precompress": true,               // .gz ve .br kardeş dosyalarını yaz
+    "template_cache": true,            // Derlenmiş Jinja template'lerini diskte sakla
+    "highlight_cache_mb": 32,          // Renklendirilmiş kod blokları önbelleği sınırı (0: kapalı)
+    "markdown_cache": true,            // Değişmeyen sayfaların Markdown dönüşümünü önbellekten al
+    "icon_sprite": true,               // Satır içi SVG ikonlarını tek bir sprite dosyasında topla
+    "search_shards": true,             // Arama indeksini dillere böl, sayfa kendi dilini yüklesin
+    "import_budget_ms": 100            // lib import süresi bütçesi (--startup-profile)
   },
   "paths": {
-    "output_dir": "outputs/site"       // Derleme çıktı dizini
+    "output_dir": "outputs/site",      // Derleme çıktı dizini
+    "cache_dir": "outputs/.cache"      // Derleme manifesti ve önbellek dizini
   }
 }
 
+Artımlı Derleme (--incremental):
+-------------------------------
+docs/<dil>/*.md, overrides/**, mkdocs.yml ve config.json dosyalarının içerik hash'leri
+outputs/.cache/build-manifest.json dosyasında saklanır. Sonraki derlemede sadece kaynağı
+değişen sayfalar yeniden render edilip yazılır; global girdilerden biri değişirse tam derleme yapılır.
+
+Paralel Dil Derlemesi (--jobs N):
+--------------------------------
+mkdocs.yml içindeki her i18n dili ayrı bir worker process içinde, kendi geçici site_dir dizinine
+derlenir. Sonuçlar çıktı dizininde birleştirilir; sitemap.xml ve arama indeksi dillerden toplanır.
+
+Paralel Sayfa İşleme (--page-jobs N):
+------------------------------------
+Dosyalar, navigasyon ve config ana süreçte hazırlanır; Markdown dönüşümü ve template render'ı
+fork edilen worker process'lerde önceden yapılır. Plugin hook'ları ana süreçte sayfa sırasıyla
+çalışır ve worker sonucu yalnızca girdisi (markdown, sayfa içeriği) aynıysa kullanılır.
+Tam derlemelerde ve fork destekleyen sistemlerde (Windows hariç) geçerlidir.
+
+Aşamalı Çıktı (staged_output):
+-----------------------------
+Derleme outputs/.www.staging dizinine yapılır; önceki çıktıyla byte bazında aynı olan dosyalar
+yeniden yazılmak yerine hard-link ile bağlanır. Derleme başarılı olursa dizinler atomik olarak
+yer değiştirir; başarısız bir derleme outputs/www dizinini asla boş bırakmaz.
+
+Küçültme (minify):
+-----------------
+HTML sayfaları (overrides/main.html içindeki inline script'ler dahil) ve overrides/ ile docs/ altındaki
+özel JS/CSS dosyaları diske yazılırken küçültülür. Sonuçlar içerik hash'i ile outputs/.cache/minify
+altında saklanır; değişmeyen dosyalar tekrar işlenmez. Dosya başına kazanç debug log'una yazılır.
+
+Template Önbelleği (template_cache):
+-----------------------------------
+Tema template'lerinin derlenmiş Jinja bytecode'u outputs/.cache/templates altında saklanır. Anahtar
+Jinja sürümü, template adı ve kaynağının hash'idir; değişmeyen template'ler sonraki derlemelerde
+yeniden derlenmez. İsabet ve ıskalama sayıları derleme log'una yazılır.
+
+Markdown Önbelleği (markdown_cache):
+-----------------------------------
+Her sayfanın Markdown dönüşümü (HTML, içindekiler, başlık) outputs/.cache/markdown altında saklanır.
+Anahtar; sayfa kaynağı, sayfa adresi, mkdocs.yml içindeki markdown_extensions bloğunun tamamı ve
+bağlantıların gösterebileceği dosyaların adresleridir. Değişmeyen sayfalar build.py ve serve.py
+derlemelerinde Markdown'dan geçirilmez; template render her zaman çalışır, navigasyon doğru kalır.
+
+Kod Renklendirme Önbelleği (highlight_cache_mb):
+-----------------------------------------------
+pymdownx.highlight ve codehilite'ın Pygments ile ürettiği HTML; dil, kod, renklendirme seçenekleri
+ve Pygments sürümü ile anahtarlanarak outputs/.cache/highlight altında saklanır. Aynı kod blokları
+diller ve derlemeler arasında tekrar renklendirilmez. Önbellek boyutu sınırlıdır; sınır aşılınca en
+uzun süredir kullanılmayan bloklar silinir. İsabet oranı derleme log'una yazılır.
+
+İkon Sprite (icon_sprite):
+-------------------------
+pymdownx.emoji ve temanın her kullanımda sayfaya gömdüğü SVG ikonlar assets/images/icons.svg
+dosyasında (tüm diller için ortak) birer <symbol> olarak bir kez saklanır; sayfalardaki kopyalar
+<use href> referanslarıyla değiştirilir. İkon yoğun sayfaların HTML boyutu belirgin şekilde düşer.
+
+Arama Parçaları (search_shards):
+-------------------------------
+Tüm dillerin kayıtlarını içeren search/search_index.json, her dil için search_index.<dil>.json
+dosyalarına bölünür. Sayfalar sadece kendi dillerinin parçasını indirir ve tek dilli bir lunr indeksi
+kurar; diğer dillerin parçaları tarayıcı boştayken önceden yüklenir. Tam indeks file:// için kalır.
+
+Ön Sıkıştırma (precompress):
+---------------------------
+Derleme sonrası HTML, CSS, JS, JSON ve SVG dosyalarının .gz ve .br kopyaları bir process havuzunda
+yazılır. İçerik hash'leri ve sıkıştırma oranları outputs/.cache/compression-manifest.json dosyasında
+tutulur; içeriği değişmeyen dosyaların sıkıştırılmış kopyaları önceki çıktıdan alınır.
+
+Profil (--profile FILE):
+-----------------------
+Vendor kontrolü, temizlik, mkdocs config yükleme, plugin event'leri (on_config, on_files,
+on_page_context, ...), sayfa başına markdown dönüşümü, template render ve dosya yazma işlemlerinin
+duvar saati ve CPU süreleri Chrome trace / Perfetto JSON formatında yazılır. En yavaş N sayfa
+(--profile-top N) derleme sonunda loglanır.
+
+Başlangıç Profili (--startup-profile):
+-------------------------------------
+build.py yeni bir Python sürecinde -X importtime ile import edilir; doğrudan import edilen modüllerin
+kümülatif süreleri loglanır. lib paketinin import süresi build.import_budget_ms bütçesini aşarsa
+komut 1 ile çıkar (CI ve pre-commit kontrolü). lib dışa aktarımlarını ilk erişimde import eder,
+Docker SDK gibi ağır bağımlılıklar yalnızca kullanıldıklarında yüklenir.
+
+Derleme Daemon'u (--daemon / --via-daemon):
+------------------------------------------
+--daemon; mkdocs, Material, pymdownx ve pygments'i import eder, mkdocs.yml'i bir kez yükler ve
+outputs/.cache/build-daemon.sock üzerinde bekler. --via-daemon ile gelen her istek bu sıcak
+süreçten fork edilen bir çocuk süreçte çalışır, loglar istemciye aktarılır. Derlemeler sırayla
+çalışır; lib/ veya eklentiler güncellendiğinde daemon yeniden başlatılmalıdır.
+
 ========================================================
 EN: Phantom Documentation Kit Production Builder (build.py)
 =======================================================
@@ -157,6 +262,9 @@ Mutagen plays a critical role in Remote Docker mode:
    - Source files automatically synced to container
    - Build process executes on remote server
    - Results (outputs/) synced back to local machine as .tar.gz archive
+   - The archive is streamed straight to disk, never buffered in memory
+   - With docker.transfer = "delta" the container hashes its output and only files that
+     differ from the local copy are transferred, keeping output_dir up to date
 
 Build Flow:
 -----------
@@ -182,7 +290,7 @@ Build Flow:
 
 Main Functions:
 --------------
-- check_vendor_dependencies(): Checks vendor files and builds if needed
+- check_vendor_dependencies(): Verifies vendor files against vendor.lock, rebuilds only changed entries
 - clean_site_directory(): Cleans previous build outputs
 - build_documentation(): Builds documentation with MkDocs
 - show_build_success(): Shows information after successful build
@@ -194,31 +302,139 @@ Configuration (config.json):
 {
   "build": {
     "check_vendor_dependencies": true,  // Check vendor dependencies?
-    "clean_before_build": true         // Clean before build?
+    "clean_before_build": true,        // Clean before build? (when staged_output is off)
+    "staged_output": true,             // Build into a sibling staging dir and swap atomically
+    "incremental": false,              // Re-render only changed pages? (default in CI)
+    "jobs": 1,                         // Worker processes building locales in parallel
+    "page_jobs": 1,                    // Worker processes rendering the pages of a locale
+    "minify": true,                    // Minify HTML, inline scripts and custom JS/CSS
+    "precompress": true,               // Write .gz and .br siblings
+    "template_cache": true,            // Keep compiled Jinja templates on disk
+    "highlight_cache_mb": 32,          // Size limit of the highlighted code block cache (0: off)
+    "markdown_cache": true,            // Reuse the Markdown conversion of unchanged pages
+    "icon_sprite": true,               // Collect inline SVG icons into one sprite file
+    "search_shards": true,             // Split the search index per locale, pages load their own
+    "import_budget_ms": 100            // Import time budget of lib (--startup-profile)
   },
   "paths": {
-    "output_dir": "outputs/site"       // Build output directory
+    "output_dir": "outputs/site",      // Build output directory
+    "cache_dir": "outputs/.cache"      // Build manifest and cache directory
   }
 }
 
+Incremental Build (--incremental):
+---------------------------------
+Content hashes of docs/<lang>/*.md, overrides/**, mkdocs.yml and config.json are stored in
+outputs/.cache/build-manifest.json. The next build only re-renders and rewrites pages whose
+source changed; a change to any global input triggers a full rebuild.
+
+Parallel Locale Builds (--jobs N):
+---------------------------------
+Every i18n locale in mkdocs.yml is built in its own worker process into a private temp site_dir.
+The results are merged into the output directory; sitemap.xml and the search index are combined.
+
+Parallel Page Rendering (--page-jobs N):
+---------------------------------------
+Files, nav and config are prepared in the parent; the Markdown conversion and template render
+are prefetched in forked worker processes. Plugin hooks run in the parent in page order and a
+worker result is only used when its input (markdown, page content) matches.
+Applies to full builds on systems with fork (not Windows).
+
+Staged Output (staged_output):
+-----------------------------
+The build writes into outputs/.www.staging; files byte-identical to the previous output are
+hard-linked instead of being written again. On success the directories are swapped atomically,
+so a failed build never leaves outputs/www empty.
+
+Minification (minify):
+---------------------
+HTML pages (including the inline scripts of overrides/main.html) and the custom JS/CSS under
+overrides/ and docs/ are minified on their way to disk. Results are cached by content hash under
+outputs/.cache/minify, so unchanged files cost nothing. Per-file savings go to the debug log.
+
+Template Cache (template_cache):
+-------------------------------
+The compiled Jinja bytecode of the theme templates is kept under outputs/.cache/templates, keyed by
+the Jinja version, the template name and the hash of its source, so unchanged templates are not
+compiled again by later builds. Hits and misses are written to the build log.
+
+Markdown Cache (markdown_cache):
+-------------------------------
+The Markdown conversion of every page (HTML, table of contents, title) is kept under
+outputs/.cache/markdown, keyed by the page source, its URL, the whole markdown_extensions block
+of mkdocs.yml and the URLs of the files its links may point to. Unchanged pages skip the Markdown
+conversion in build.py and serve.py builds; templates are always rendered, so navigation stays right.
+
+Highlight Cache (highlight_cache_mb):
+------------------------------------
+The Pygments HTML of pymdownx.highlight and codehilite blocks is kept under outputs/.cache/highlight,
+keyed by language, code, highlight options and the Pygments version, so the same blocks are not
+highlighted again across locales and builds. The cache is size-bounded; the least recently used
+blocks are evicted beyond the limit. The hit rate is written to the build log.
+
+Icon Sprite (icon_sprite):
+-------------------------
+SVG icons that pymdownx.emoji and the theme inline on every use are stored once as <symbol>s in
+assets/images/icons.svg (shared by all locales); the copies in the pages become <use href> references.
+Icon-heavy pages get a lot smaller.
+
+Search Shards (search_shards):
+-----------------------------
+search/search_index.json, which holds the entries of every locale, is split into one
+search_index.<locale>.json per locale. Pages only download the shard of their locale and build a
+single-language lunr index; the other shards are prefetched once the browser is idle. The full
+index stays for file:// browsing.
+
+Precompression (precompress):
+----------------------------
+After the build, .gz and .br siblings of HTML, CSS, JS, JSON and SVG files are written in a process
+pool. Content hashes and ratios are kept in outputs/.cache/compression-manifest.json; files whose
+content did not change reuse the compressed siblings of the previous output.
+
+Profiling (--profile FILE):
+--------------------------
+Wall and CPU time of the vendor check, cleanup, mkdocs config loading, plugin event hooks
+(on_config, on_files, on_page_context, ...), per-page markdown conversion, template rendering
+and file writes are written as Chrome trace / Perfetto JSON. The N slowest pages (--profile-top N)
+are logged at the end of the build.
+
+Startup Profile (--startup-profile):
+-----------------------------------
+build.py is imported in a fresh Python process with -X importtime and the cumulative times of its
+direct imports are logged. The command exits with 1 when importing the lib package takes longer
+than build.import_budget_ms (a CI and pre-commit check). lib imports its exports on first access,
+so heavy dependencies such as the Docker SDK only load when they are used.
+
+Build Daemon (--daemon / --via-daemon):
+--------------------------------------
+--daemon imports mkdocs, Material, pymdownx and pygments, loads mkdocs.yml once and listens on
+outputs/.cache/build-daemon.sock. Every --via-daemon request runs in a child forked from this warm
+process and its logs are streamed back to the client. Builds run one at a time; restart the
+daemon after updating lib/ or the plugins.
+
 """
 
+import os
 import sys
+import time
 import shutil
 import argparse
 import platform
+from contextlib import ExitStack
 from pathlib import Path
+from typing import Optional
 
+# Only what every start needs, the build stages are imported once a build runs (build.import_budget_ms)
 from lib import (
     load_config,
-    check_mkdocs,
-    check_node,
-    check_docker_environment,
-    VendorManager,
     print_banner,
     get_logger,
     init_logging,
-    setup_mkdocs_logging
+    new_log_session,
+    BuildProfiler,
+    profile_phase,
+    profile_imports,
+    report_import_profile
 )
 
 # Disable Python tracebacks for cleaner error messages
@@ -227,6 +443,8 @@ sys.tracebacklimit = 0
 
 def check_vendor_dependencies():
     """Check and build vendor dependencies if needed"""
+    from lib import VendorManager
+    
     config_data = load_config()
     logger_ = get_logger(__name__)
     vendor_manager = VendorManager(config_data)
@@ -236,12 +454,12 @@ def check_vendor_dependencies():
     
     logger_.info("Checking vendor dependencies...")
     
-    vendor_files_exist = vendor_manager.check_dependencies()
+    stale_entries = vendor_manager.stale_entries()
     
-    if not vendor_files_exist:
+    if stale_entries:
         logger_.info("Building vendor dependencies...")
         
-        if vendor_manager.build_dependencies():
+        if vendor_manager.build_dependencies(list(stale_entries)):
             if vendor_manager.check_dependencies():
                 logger_.info("Vendor files built successfully")
             else:
@@ -271,8 +489,35 @@ def clean_site_directory():
             return False
     return True
 
-def build_documentation():
+def build_documentation(incremental: bool = False, jobs: int = 1, staged: bool = True, page_jobs: int = 1):
     """Build the documentation"""
+    from lib import (
+        setup_mkdocs_logging,
+        BuildManifest,
+        IncrementalBuild,
+        ParallelLocaleBuilder,
+        StagedOutput,
+        LinkUnchangedFiles,
+        report_staged_output,
+        Precompressor,
+        MinifyCache,
+        create_minify_output,
+        report_minify,
+        MarkdownRenderCache,
+        CachedMarkdownRender,
+        report_markdown_cache,
+        IconSprite,
+        report_icon_sprite,
+        ParallelPageRender,
+        report_page_pool,
+        enable_search_shards,
+        write_search_shards,
+        report_search_shards,
+        HighlightCache,
+        CachedHighlighting,
+        report_highlight_cache
+    )
+    
     config_data = load_config()
     logger_ = get_logger(__name__)
     logger_.info("Building documentation...")
@@ -282,23 +527,190 @@ def build_documentation():
     if not outputs_dir.exists():
         outputs_dir.mkdir(parents=True)
     
+    output_dir = config_data['paths']['output_dir']
+    staged_output = StagedOutput(output_dir) if staged else None
+    
     try:
         # Import MkDocs modules
         from mkdocs.commands.build import build
         from mkdocs.config import load_config as mkdocs_load_config
+        # Imports jinja2
+        from lib import SharedBytecodeCache, share_compiled_templates
         
         # Set up MkDocs logging integration
         setup_mkdocs_logging()
         
         # Load MkDocs configuration
-        mkdocs_config = mkdocs_load_config('mkdocs.yml')
+        with profile_phase('mkdocs_load_config'):
+            mkdocs_config = mkdocs_load_config('mkdocs.yml')
+        
+        # Override site_dir with our config, staged builds write next to it
+        site_dir = staged_output.prepare() if staged_output else output_dir
+        mkdocs_config.site_dir = site_dir
+        
+        # Pages load the search index shard of their locale
+        search_shards = config_data['build'].get('search_shards', True)
+        if search_shards:
+            enable_search_shards(mkdocs_config)
+        
+        # Compare build inputs with the manifest of the previous build
+        manifest = BuildManifest(config_data)
+        full_build = True
+        if incremental:
+            manifest.load()
+            manifest.compute_fingerprint(mkdocs_config.docs_dir, mkdocs_config.theme.custom_dir)
+            full_build = manifest.requires_full_build(output_dir)
+            if full_build:
+                logger_.info("Incremental build: global inputs changed, rebuilding every page")
+        # The manifest is rewritten only after a successful incremental build
+        manifest.invalidate()
         
-        # Override site_dir with our config
-        mkdocs_config.site_dir = config_data['paths']['output_dir']
+        # Compressed siblings of unchanged files are reused from the previous output
+        precompressor = None
+        if config_data['build'].get('precompress', True):
+            precompressor = Precompressor(config_data)
+            precompressor.load()
+            precompressor.invalidate()
         
-        # Build the documentation
-        build(mkdocs_config)
+        # Minify pages, inline scripts and custom assets on their way to disk
+        minify = None
+        if config_data['build'].get('minify', True):
+            minify = {
+                'cache_dir': config_data['paths'].get('cache_dir', 'outputs/.cache'),
+                'vendor_dir': config_data['paths']['vendor_dir']
+            }
+        minify_stats = None
         
+        # Load unchanged theme templates precompiled instead of compiling them in every build
+        template_cache = None
+        if config_data['build'].get('template_cache', True):
+            template_cache = config_data['paths'].get('cache_dir', 'outputs/.cache')
+        template_stats = None
+        
+        # Skip the Markdown conversion of unchanged pages
+        markdown_cache = None
+        if config_data['build'].get('markdown_cache', True):
+            markdown_cache = config_data['paths'].get('cache_dir', 'outputs/.cache')
+        markdown_stats = None
+        
+        # Reuse the Pygments HTML of code blocks across locales and builds
+        highlight = None
+        if config_data['build'].get('highlight_cache_mb', 32) > 0:
+            highlight = {
+                'cache_dir': config_data['paths'].get('cache_dir', 'outputs/.cache'),
+                'max_bytes': config_data['build'].get('highlight_cache_mb', 32) * 1024 * 1024
+            }
+        
+        # Convert and render the pages of a locale in worker processes (full builds only, incremental
+        # builds render few pages and need them in order to compare with the manifest)
+        if incremental and page_jobs > 1:
+            logger_.info("Incremental build: rendering pages sequentially, --page-jobs applies to full builds")
+            page_jobs = 1
+        
+        # Fan the locales out to worker processes when requested
+        parallel_builder = ParallelLocaleBuilder(mkdocs_config, jobs)
+        if parallel_builder.enabled:
+            minify_stats = parallel_builder.build(site_dir, manifest if incremental else None, full_build,
+                                                  output_dir, minify, template_cache, highlight,
+                                                  markdown_cache, config_data['build'].get('icon_sprite', True),
+                                                  search_shards, page_jobs)
+            if minify_stats is None:
+                if staged_output:
+                    staged_output.discard()
+                return False
+            template_stats = parallel_builder.template_stats
+            markdown_stats = parallel_builder.markdown_stats
+        else:
+            with ExitStack() as stack:
+                link_unchanged = None
+                if staged_output and Path(output_dir).exists():
+                    link_unchanged = stack.enter_context(LinkUnchangedFiles(site_dir, output_dir))
+                incremental_build = None
+                if incremental:
+                    incremental_build = stack.enter_context(
+                        IncrementalBuild(manifest, site_dir, full_build, output_dir)
+                    )
+                bytecode_cache = None
+                if template_cache:
+                    bytecode_cache = stack.enter_context(
+                        share_compiled_templates(SharedBytecodeCache(template_cache))
+                    )
+                # Entered before the Markdown cache so cached pages are not taken from the workers
+                page_pool = None
+                if page_jobs > 1:
+                    page_pool = stack.enter_context(ParallelPageRender(page_jobs))
+                markdown_render = None
+                if markdown_cache:
+                    markdown_render = stack.enter_context(
+                        CachedMarkdownRender(MarkdownRenderCache(markdown_cache))
+                    )
+                highlighting = None
+                if highlight:
+                    highlighting = stack.enter_context(
+                        CachedHighlighting(HighlightCache(highlight['cache_dir'], highlight['max_bytes']))
+                    )
+                # Entered last so the bytes passed on to LinkUnchangedFiles are minified
+                minify_output = None
+                if minify:
+                    minify_output = stack.enter_context(
+                        create_minify_output(mkdocs_config, minify['cache_dir'], minify['vendor_dir'])
+                    )
+                # Entered after minification so the icons are replaced in the original HTML
+                sprite = None
+                if config_data['build'].get('icon_sprite', True):
+                    sprite = stack.enter_context(
+                        IconSprite(site_dir, output_dir, keep_previous=incremental and not full_build)
+                    )
+                
+                # Build the documentation
+                build(mkdocs_config)
+            
+            if link_unchanged:
+                report_staged_output(link_unchanged.stats())
+            if incremental_build:
+                incremental_build.report()
+            if minify_output:
+                minify_stats = minify_output.stats()
+                report_minify(minify_stats)
+            if bytecode_cache:
+                template_stats = bytecode_cache.stats()
+                bytecode_cache.report()
+            if sprite:
+                report_icon_sprite(sprite.stats())
+            if page_pool:
+                report_page_pool(page_pool.stats(), page_jobs)
+            if markdown_render:
+                markdown_stats = markdown_render.cache.stats()
+                report_markdown_cache(markdown_stats)
+            if highlighting:
+                report_highlight_cache(highlighting.cache.stats())
+        
+        if search_shards:
+            with profile_phase('search_shards'):
+                report_search_shards(write_search_shards(mkdocs_config, site_dir,
+                                                         output_dir if staged_output else None))
+        
+        # Write .gz and .br siblings before the output goes live
+        if precompressor:
+            with profile_phase('precompress'):
+                precompressor.run(site_dir, output_dir)
+        
+        # Swap the finished build in, the previous output stays live until now
+        if staged_output:
+            staged_output.commit()
+        if incremental:
+            manifest.save()
+        if precompressor:
+            precompressor.save()
+        # Incremental builds skip unchanged pages, so only full builds know every live entry
+        if minify_stats and not incremental:
+            MinifyCache(minify['cache_dir']).prune(set(minify_stats['used']))
+        if template_stats and not incremental:
+            SharedBytecodeCache(template_cache).prune(set(template_stats['used']))
+        if markdown_stats and not incremental:
+            MarkdownRenderCache(markdown_cache).prune(set(markdown_stats['used']))
+        if highlight:
+            HighlightCache(highlight['cache_dir'], highlight['max_bytes']).prune()
         return True
         
     except ImportError as import_err:
@@ -306,25 +718,31 @@ def build_documentation():
         logger_.error("Please ensure MkDocs is installed: pip install mkdocs")
         return False
     except Exception as build_err:
+        if staged_output:
+            staged_output.discard()
         logger_.error(f"Build failed: {build_err}")
         return False
 
-def show_build_success():
+def show_build_success(duration: Optional[float] = None):
     """Show success message with next steps"""
     config_data = load_config()
     logger_ = get_logger(__name__)
-    logger_.info("Documentation built successfully!")
+    if duration is not None:
+        logger_.info(f"Documentation built successfully in {duration:.2f}s!")
+    else:
+        logger_.info("Documentation built successfully!")
     logger_.info(f"Output directory: ./{config_data['paths']['output_dir']}")
     logger_.info("To preview locally, run:")
     
-    port = config_data.get('serve', {}).get('port', 8000)
-    preview_cmd = f"python -m http.server {port} --directory {config_data['paths']['output_dir']}"
-    logger_.info(f"   {preview_cmd}")
+    logger_.info("   python serve.py --static")
 
-def native_build():
+def native_build(incremental: bool = False, jobs: int = 1, page_jobs: int = 1):
     """Run build in native mode"""
+    from lib import check_mkdocs, check_node, VendorManager
+    
     config_data = load_config()
     logger_ = get_logger(__name__)
+    started = time.perf_counter()
     
     # Check if MkDocs is installed
     if not check_mkdocs():
@@ -334,34 +752,49 @@ def native_build():
     
     # Build vendor dependencies if needed
     if config_data['build'].get('check_vendor_dependencies', True):
-        vendor_manager = VendorManager(config_data)
-        vendor_files_exist = vendor_manager.check_dependencies()
-        
-        if not vendor_files_exist:
-            # Check if Node.js is installed for building vendor files
-            if not check_node():
-                logger_.critical("Node.js is not installed. Please install Node.js to build vendor files.")
-                logger_.critical("Visit https://nodejs.org/ for installation instructions.")
-                logger_.warning("Cannot build vendor files without Node.js.")
-                logger_.warning("Continuing without vendor files...")
-            elif not check_vendor_dependencies():
-                logger_.warning("Continuing without vendor files...")
-    
-    # Clean previous build
-    if config_data['build'].get('clean_before_build', True) and not clean_site_directory():
-        logger_.warning("Warning: Could not clean previous build")
+        with profile_phase('check_vendor_dependencies'):
+            vendor_manager = VendorManager(config_data)
+            stale_entries = vendor_manager.stale_entries()
+            for entry, reason in stale_entries.items():
+                logger_.warning(f"Vendor entry {entry}: {reason}")
+            
+            if stale_entries:
+                # Check if Node.js is installed for building vendor files
+                if not check_node():
+                    logger_.critical("Node.js is not installed. Please install Node.js to build vendor files.")
+                    logger_.critical("Visit https://nodejs.org/ for installation instructions.")
+                    logger_.warning("Cannot build vendor files without Node.js.")
+                    logger_.warning("Continuing without vendor files...")
+                elif not check_vendor_dependencies():
+                    logger_.warning("Continuing without vendor files...")
+    
+    # Clean previous build (staged builds replace the output as a whole and
+    # incremental builds reuse the previous output)
+    staged = config_data['build'].get('staged_output', True)
+    if incremental:
+        logger_.info("Incremental build enabled")
+    elif not staged and config_data['build'].get('clean_before_build', True):
+        with profile_phase('clean_site_directory'):
+            cleaned = clean_site_directory()
+        if not cleaned:
+            logger_.warning("Warning: Could not clean previous build")
     
     # Build documentation
-    if build_documentation():
-        show_build_success()
+    with profile_phase('build_documentation'):
+        built = build_documentation(incremental=incremental, jobs=jobs, staged=staged, page_jobs=page_jobs)
+    if built:
+        show_build_success(time.perf_counter() - started)
     else:
         logger_.error("Build failed! Please check the errors above.")
         sys.exit(1)
 
 def docker_build():
     """Run build in Docker mode"""
+    from lib import check_docker_environment
+    
     # noinspection DuplicatedCode
     logger_ = get_logger(__name__)
+    started = time.perf_counter()
     
     # Check Docker environment (local or remote)
     docker_env = check_docker_environment()
@@ -399,7 +832,7 @@ def docker_build():
     
     # Run build in container
     if docker_manager.run_build():
-        show_build_success()
+        show_build_success(time.perf_counter() - started)
     else:
         logger_.error("Docker build failed! Please check the errors above.")
         sys.exit(1)
@@ -408,6 +841,41 @@ def docker_build():
     docker_manager.cleanup()
 
 # noinspection DuplicatedCode
+def warm_up_daemon():
+    """Import everything a build needs and load mkdocs.yml once, so forked builds start warm"""
+    logger_ = get_logger(__name__)
+    started = time.perf_counter()
+    import markdown
+    import pygments.formatters.html
+    import pygments.lexers
+    from mkdocs.commands import build as mkdocs_build
+    from mkdocs.config import load_config as mkdocs_load_config
+
+    # Instantiates the theme and plugins, imports the markdown extensions
+    mkdocs_config = mkdocs_load_config('mkdocs.yml')
+    markdown.Markdown(extensions=mkdocs_config['markdown_extensions'],
+                      extension_configs=mkdocs_config['mdx_configs'])
+    logger_.info(f"Build daemon warmed up in {time.perf_counter() - started:.2f}s")
+
+def run_daemon_build(argv):
+    """Run one build.py invocation inside a forked daemon child"""
+    sys.argv = [sys.argv[0], *argv]
+    new_log_session()
+    run()
+
+def strip_daemon_arguments(argv):
+    """Command line to forward to the daemon (without --via-daemon and --socket)"""
+    forwarded = []
+    skip_next = False
+    for arg in argv:
+        if skip_next:
+            skip_next = False
+        elif arg == '--socket':
+            skip_next = True
+        elif arg != '--via-daemon' and not arg.startswith('--socket='):
+            forwarded.append(arg)
+    return forwarded
+
 def main():
     """Main entry point"""
     # Parse command line arguments
@@ -421,6 +889,64 @@ def main():
         action='store_true',
         help='Run build in Docker container'
     )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        default=None,
+        help='Only re-render pages whose inputs changed (default: build.incremental, enabled in CI)'
+    )
+    parser.add_argument(
+        '--no-incremental',
+        action='store_false',
+        dest='incremental',
+        help='Force a full rebuild'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Build locales in N parallel worker processes (default: build.jobs)'
+    )
+    parser.add_argument(
+        '--page-jobs',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Convert and render the pages of a locale in N worker processes (default: build.page_jobs)'
+    )
+    parser.add_argument(
+        '--profile',
+        metavar='FILE',
+        help='Write a Chrome trace of every build phase to FILE (open in ui.perfetto.dev)'
+    )
+    parser.add_argument(
+        '--profile-top',
+        type=int,
+        default=10,
+        metavar='N',
+        help='Number of slowest pages listed after a profiled build (default: 10)'
+    )
+    parser.add_argument(
+        '--startup-profile',
+        action='store_true',
+        help='Report the import costs of build.py and check lib against build.import_budget_ms'
+    )
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Keep a warm build process running and serve build requests on a Unix socket'
+    )
+    parser.add_argument(
+        '--via-daemon',
+        action='store_true',
+        help='Submit this build to a running --daemon and stream its output'
+    )
+    parser.add_argument(
+        '--socket',
+        metavar='PATH',
+        help='Unix socket of the build daemon (default: <paths.cache_dir>/build-daemon.sock)'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -437,6 +963,22 @@ def main():
     # Load config
     config = load_config()
     
+    if args.daemon or args.via_daemon:
+        from lib import daemon_supported, get_socket_path, submit_build
+        
+        if not daemon_supported():
+            print("ERROR    The build daemon requires Unix sockets and fork() (not available on Windows)")
+            sys.exit(1)
+        socket_path = Path(args.socket) if args.socket else get_socket_path(config)
+    
+    # Thin client, the daemon prints the banner and logs of the build
+    if args.via_daemon:
+        try:
+            sys.exit(submit_build(socket_path, strip_daemon_arguments(sys.argv[1:])))
+        except ConnectionError as e:
+            print(f"ERROR    {e}")
+            sys.exit(1)
+    
     # Print banner first
     print_banner("build")
     
@@ -446,18 +988,33 @@ def main():
     # Apply verbosity settings
     logger_ = get_logger(__name__)
     if args.verbose:
-        import os
         os.environ['PHANTOM_LOG_LEVEL'] = 'DEBUG'
         # Re-initialize logging with new level
         init_logging(config)
     elif args.quiet:
-        import os
         os.environ['PHANTOM_LOG_LEVEL'] = 'WARNING'
         # Re-initialize logging with new level
         init_logging(config)
     
+    if args.startup_profile:
+        timings = profile_imports('build', cwd=os.path.dirname(os.path.abspath(__file__)))
+        within_budget = report_import_profile('build', timings, budget_ms=config['build']['import_budget_ms'])
+        sys.exit(0 if within_budget else 1)
+    
     # Run in appropriate mode
-    if args.docker:
+    if args.daemon:
+        if args.docker:
+            logger_.error("--daemon runs native builds, submit --docker builds directly")
+            sys.exit(1)
+        from lib import BuildDaemon
+        
+        warm_up_daemon()
+        try:
+            BuildDaemon(socket_path, run_daemon_build).serve_forever()
+        except RuntimeError as e:
+            logger_.error(str(e))
+            sys.exit(1)
+    elif args.docker:
         # Check if Windows
         if platform.system().lower() == 'windows':
             logger_.warning("Docker mode is not supported on Windows due to signal handling limitations")
@@ -465,11 +1022,30 @@ def main():
             sys.exit(1)
         else:
             logger_.info("Running in Docker mode")
+            if args.profile:
+                logger_.warning("--profile only covers native builds, ignoring it in Docker mode")
             docker_build()
     else:
-        native_build()
+        incremental = args.incremental
+        if incremental is None:
+            incremental = bool(config['build'].get('incremental', False) or os.environ.get('CI'))
+        jobs = args.jobs if args.jobs is not None else config['build'].get('jobs', 1)
+        page_jobs = args.page_jobs if args.page_jobs is not None else config['build'].get('page_jobs', 1)
+        if args.profile:
+            profiler = BuildProfiler()
+            try:
+                with profiler.instrument():
+                    native_build(incremental=incremental, jobs=max(1, jobs), page_jobs=max(1, page_jobs))
+            finally:
+                # Keep the trace of failed builds too, they are the interesting ones
+                profiler.write_trace(args.profile)
+                profiler.report(args.profile_top)
+                logger_.info(f"Build profile written to {args.profile}")
+        else:
+            native_build(incremental=incremental, jobs=max(1, jobs), page_jobs=max(1, page_jobs))
 
-if __name__ == "__main__":
+def run():
+    """Run main() with the command line error handling"""
     try:
         main()
     except KeyboardInterrupt:
@@ -479,4 +1055,7 @@ if __name__ == "__main__":
     except Exception as e:
         logger = get_logger(__name__)
         logger.critical(f"Unexpected error: {e}", exc_info=True)
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+
+if __name__ == "__main__":
+    run()
\ No newline at end of file
@@ -7,52 +7,136 @@
 ╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
 Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
 Phantom Documentation Kit Library
+
+Exports are imported on first access (PEP 562), so "from lib import get_logger"
+does not pay for the Docker SDK, MkDocs or asyncio.
 """
 
-from .main import (
-    load_config,
-    Colors,
-    run_command,
-    check_mkdocs,
-    check_node,
-    check_docker_environment,
-    check_docker_package,
-    VendorManager,
-    print_banner,
-    setup_mkdocs_logging
-)
-
-# Always try to import DockerManager if docker package is available
-# This allows remote Docker connections even without local Docker
-try:
-    from .docker import DockerManager
-except ImportError:
-    # Docker module not available (missing dependencies)
-    DockerManager = None
-
-from .logging import (
-    get_logger,
-    init_logging,
-    log_info
-)
-
-# Build __all__ dynamically based on what's available
-__all__ = [
-    'load_config',
-    'Colors',
-    'run_command',
-    'check_mkdocs',
-    'check_node',
-    'check_docker_environment',
-    'check_docker_package',
-    'VendorManager',
-    'print_banner',
-    'setup_mkdocs_logging',
-    'get_logger',
-    'init_logging',
-    'log_info'
-]
-
-# Only add DockerManager to __all__ if it's available
-if DockerManager is not None:
-    __all__.append('DockerManager')
\ No newline at end of file
+import importlib.util
+from typing import Any, List
+
+# Submodule of every exported name
+_EXPORTS = {
+    # lib.main
+    'load_config': 'main',
+    'Colors': 'main',
+    'run_command': 'main',
+    'check_mkdocs': 'main',
+    'check_node': 'main',
+    'check_docker_environment': 'main',
+    'check_docker_package': 'main',
+    'VendorManager': 'main',
+    'print_banner': 'main',
+    'setup_mkdocs_logging': 'main',
+    'patch_function': 'main',
+    'hash_bytes': 'main',
+    'ContentStore': 'main',
+    'hash_file': 'main',
+    # lib.config
+    'Config': 'config',
+    'ConfigError': 'config',
+    'CONFIG_SCHEMA': 'config',
+    # lib.transfer
+    'ArtifactTransfer': 'transfer',
+    # lib.docker, None when the docker package is missing
+    'DockerManager': 'docker',
+    # lib.incremental
+    'BuildManifest': 'incremental',
+    'IncrementalBuild': 'incremental',
+    # lib.staging
+    'StagedOutput': 'staging',
+    'LinkUnchangedFiles': 'staging',
+    'report_staged_output': 'staging',
+    # lib.parallel
+    'ParallelLocaleBuilder': 'parallel',
+    'get_build_locales': 'parallel',
+    # lib.minify
+    'MinifyCache': 'minify',
+    'MinifyOutput': 'minify',
+    'create_minify_output': 'minify',
+    'report_minify': 'minify',
+    # lib.rendercache
+    'MarkdownRenderCache': 'rendercache',
+    'CachedMarkdownRender': 'rendercache',
+    'report_markdown_cache': 'rendercache',
+    # lib.sprite
+    'IconSprite': 'sprite',
+    'report_icon_sprite': 'sprite',
+    # lib.pagepool
+    'ParallelPageRender': 'pagepool',
+    'report_page_pool': 'pagepool',
+    # lib.search
+    'enable_search_shards': 'search',
+    'write_search_shards': 'search',
+    'report_search_shards': 'search',
+    # lib.highlight
+    'HighlightCache': 'highlight',
+    'CachedHighlighting': 'highlight',
+    'report_highlight_cache': 'highlight',
+    # lib.compression
+    'Precompressor': 'compression',
+    # lib.profiler
+    'BuildProfiler': 'profiler',
+    'profile_phase': 'profiler',
+    'get_active_profiler': 'profiler',
+    'profile_imports': 'profiler',
+    'report_import_profile': 'profiler',
+    # lib.dependencies
+    'PageDependencyGraph': 'dependencies',
+    'DirtyPageBuild': 'dependencies',
+    'RebuildPlan': 'dependencies',
+    'RebuildCancelled': 'dependencies',
+    # lib.memsite
+    'MemorySite': 'memsite',
+    # lib.templates
+    'SharedBytecodeCache': 'templates',
+    'share_compiled_templates': 'templates',
+    # lib.metrics
+    'ServeMetrics': 'metrics',
+    # lib.liveserve
+    'DirtyReloadServer': 'liveserve',
+    'serve_site': 'liveserve',
+    'serve_projects': 'liveserve',
+    'parse_projects': 'liveserve',
+    # lib.preview
+    'StaticPreviewServer': 'preview',
+    'serve_static': 'preview',
+    # lib.daemon
+    'BuildDaemon': 'daemon',
+    'submit_build': 'daemon',
+    'get_socket_path': 'daemon',
+    'daemon_supported': 'daemon',
+    # lib.logging
+    'get_logger': 'logging',
+    'init_logging': 'logging',
+    'new_log_session': 'logging',
+    'log_info': 'logging'
+}
+
+# Only add DockerManager to __all__ if the docker package is available;
+# find_spec() locates it without importing it
+__all__ = [name for name in _EXPORTS
+           if name != 'DockerManager' or importlib.util.find_spec('docker') is not None]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        # __import__ instead of importlib.import_module, which -X importtime does not see
+        module = __import__(f'{__name__}.{module_name}', fromlist=[name])
+    except ImportError:
+        if name != 'DockerManager':
+            raise
+        # Docker module not available (missing dependencies)
+        value = None
+    else:
+        value = getattr(module, name)
+    # Cache it, later lookups do not come through here
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,218 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Precompression
+Writes .gz and .br siblings of the built site in a process pool, reusing unchanged ones
+"""
+
+import os
+import gzip
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+from .main import hash_file
+from .staging import link_or_copy
+from .logging import get_logger
+
+try:
+    import brotli
+except ImportError:
+    # Optional, only gzip siblings are written without it
+    brotli = None
+
+# Bump when the manifest layout or the compression settings change
+MANIFEST_VERSION = 1
+
+COMPRESSIBLE_EXTENSIONS = {'.html', '.css', '.js', '.json', '.svg'}
+
+# Smaller files gain nothing once HTTP framing is accounted for
+MIN_SIZE = 256
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# Sibling suffix per encoding
+ENCODINGS = {'gzip': '.gz', 'brotli': '.br'}
+
+
+def _write_sibling(path: str, data: bytes) -> None:
+    """Write a compressed sibling to a fresh inode (it may be a hard link)"""
+    if os.path.lexists(path):
+        os.unlink(path)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _remove_sibling(path: str) -> None:
+    if os.path.lexists(path):
+        os.unlink(path)
+
+
+def compress_file(file_path: str) -> Dict[str, Any]:
+    """Write the .gz and .br siblings of a file (runs in a worker process)
+
+    A sibling is only kept when it is smaller than the original.
+
+    Returns:
+        Original size and compressed size per encoding (None when not written)
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+
+    sizes = {'size': len(data)}
+    compressed = {'gzip': gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)}
+    if brotli is not None:
+        compressed['brotli'] = brotli.compress(data, quality=BROTLI_QUALITY)
+
+    for encoding, suffix in ENCODINGS.items():
+        output = compressed.get(encoding)
+        if output is not None and len(output) < len(data):
+            _write_sibling(file_path + suffix, output)
+            sizes[encoding] = len(output)
+        else:
+            _remove_sibling(file_path + suffix)
+            sizes[encoding] = None
+    return sizes
+
+
+class Precompressor:
+    """Precompresses the built site, recompressing only files whose content changed
+
+    The manifest maps every compressed file to its content hash and sizes. It
+    describes the siblings of the live output directory, so it is invalidated
+    before a build and saved only after the output has been committed.
+    """
+
+    def __init__(self, config: Dict, jobs: Optional[int] = None):
+        self.cache_dir = Path(config['paths'].get('cache_dir', 'outputs/.cache'))
+        self.manifest_file = self.cache_dir / 'compression-manifest.json'
+        self.jobs = jobs
+        self.previous: Dict[str, Dict[str, Any]] = {}
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.compressed = 0
+        self.reused = 0
+
+    def load(self) -> None:
+        """Load the manifest of the previous build"""
+        logger = get_logger(__name__)
+        if not self.manifest_file.exists():
+            return
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION and manifest.get('brotli') == (brotli is not None):
+                self.previous = manifest.get('files', {})
+        except (json.JSONDecodeError, IOError, OSError) as e:
+            logger.debug(f"Ignoring unreadable compression manifest: {e}")
+
+    def invalidate(self) -> None:
+        """Remove the manifest while the output directory is being replaced"""
+        try:
+            self.manifest_file.unlink()
+        except FileNotFoundError:
+            pass
+
+    def save(self) -> None:
+        """Write the manifest of the committed output"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'brotli': brotli is not None,
+            'files': self.files
+        }
+        tmp_file = self.manifest_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, self.manifest_file)
+
+    @staticmethod
+    def find_compressible(site_dir: str) -> List[str]:
+        """List the files worth precompressing, relative to site_dir"""
+        files = []
+        for root, _, names in os.walk(site_dir):
+            for name in names:
+                if os.path.splitext(name)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+                    continue
+                path = os.path.join(root, name)
+                if os.path.getsize(path) >= MIN_SIZE:
+                    files.append(Path(os.path.relpath(path, site_dir)).as_posix())
+        return sorted(files)
+
+    def _reuse(self, site_dir: str, previous_dir: str, rel_path: str, entry: Dict[str, Any]) -> bool:
+        """Bring the siblings of an unchanged file over from the previous output"""
+        for encoding, suffix in ENCODINGS.items():
+            if entry.get(encoding) is None:
+                continue
+            previous = os.path.join(previous_dir, rel_path + suffix)
+            if not os.path.isfile(previous):
+                return False
+            target = os.path.join(site_dir, rel_path + suffix)
+            if os.path.abspath(previous) != os.path.abspath(target):
+                link_or_copy(previous, target)
+        return True
+
+    def run(self, site_dir: str, previous_dir: Optional[str] = None) -> None:
+        """Precompress site_dir
+
+        Args:
+            site_dir: Directory that was just built
+            previous_dir: Live output of the previous build (defaults to site_dir)
+        """
+        logger = get_logger(__name__)
+        previous_dir = previous_dir or site_dir
+        if brotli is None:
+            logger.warning("brotli is not installed, writing gzip siblings only (pip install brotli)")
+
+        pending = []
+        for rel_path in self.find_compressible(site_dir):
+            content_hash = hash_file(Path(site_dir) / rel_path)
+            entry = self.previous.get(rel_path)
+            if entry and entry.get('hash') == content_hash and self._reuse(site_dir, previous_dir, rel_path, entry):
+                self.files[rel_path] = entry
+                self.reused += 1
+            else:
+                pending.append((rel_path, content_hash))
+
+        # In-place builds keep the siblings of pages that no longer exist
+        for rel_path in self.previous:
+            if rel_path not in self.files and not os.path.exists(os.path.join(site_dir, rel_path)):
+                for suffix in ENCODINGS.values():
+                    _remove_sibling(os.path.join(site_dir, rel_path + suffix))
+
+        if pending:
+            # Largest files first so one big bundle does not finish last on its own
+            pending.sort(key=lambda item: os.path.getsize(os.path.join(site_dir, item[0])), reverse=True)
+            paths = [os.path.join(site_dir, rel_path) for rel_path, _ in pending]
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                results = executor.map(compress_file, paths, chunksize=max(1, len(paths) // 64))
+                for (rel_path, content_hash), sizes in zip(pending, results):
+                    self.files[rel_path] = {'hash': content_hash, **sizes}
+            self.compressed = len(pending)
+
+        self.report()
+
+    def ratios(self) -> Dict[str, float]:
+        """Compressed size relative to the original size per encoding"""
+        total = sum(entry['size'] for entry in self.files.values())
+        ratios = {}
+        for encoding in ENCODINGS:
+            compressed = sum(entry[encoding] if entry.get(encoding) is not None else entry['size']
+                             for entry in self.files.values())
+            ratios[encoding] = compressed / total if total else 1.0
+        return ratios
+
+    def report(self) -> None:
+        """Log how many files were compressed and the overall ratios"""
+        logger = get_logger(__name__)
+        ratios = self.ratios()
+        encodings = [encoding for encoding in ENCODINGS if encoding != 'brotli' or brotli is not None]
+        summary = ', '.join(f"{encoding} {ratios[encoding] * 100:.1f}%" for encoding in encodings)
+        logger.info(f"Precompressed {self.compressed} changed files, reused {self.reused} unchanged "
+                    f"({summary} of original size)")
@@ -0,0 +1,317 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Configuration
+Schema-validated, read-only config.json with environment overrides and mtime-based reload
+"""
+
+import os
+import json
+import difflib
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterator, Tuple
+
+# Environment overrides use PHANTOM_<SECTION>__<KEY>, e.g. PHANTOM_SERVE__PORT=9000
+ENV_PREFIX = 'PHANTOM_'
+ENV_SEPARATOR = '__'
+
+TRUE_VALUES = {'1', 'true', 'yes', 'on'}
+FALSE_VALUES = {'0', 'false', 'no', 'off'}
+
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+
+class ConfigError(ValueError):
+    """Raised when config.json does not match the schema"""
+
+
+class ConfigField:
+    """Type, default and allowed values of a single config key"""
+
+    REQUIRED = object()
+
+    def __init__(self, field_type: type, default: Any = REQUIRED, choices: Optional[Tuple] = None,
+                 minimum: Optional[int] = None):
+        self.type = field_type
+        self.default = default
+        self.choices = choices
+        self.minimum = minimum
+
+    @property
+    def required(self) -> bool:
+        return self.default is ConfigField.REQUIRED
+
+    def validate(self, name: str, value: Any) -> Any:
+        """Check the type and range of a value, returns it unchanged"""
+        # bool is an int subclass, never accept one for the other
+        if not isinstance(value, self.type) or (self.type is int and isinstance(value, bool)):
+            raise ConfigError(f"'{name}' must be of type {self.type.__name__}, got {type(value).__name__}")
+        if self.choices is not None and value not in self.choices:
+            raise ConfigError(f"'{name}' must be one of {', '.join(map(str, self.choices))}, got {value!r}")
+        if self.minimum is not None and value < self.minimum:
+            raise ConfigError(f"'{name}' must be at least {self.minimum}, got {value}")
+        return value
+
+    def parse(self, name: str, text: str) -> Any:
+        """Convert an environment variable string to the field type"""
+        if self.type is bool:
+            if text.lower() in TRUE_VALUES:
+                return True
+            if text.lower() in FALSE_VALUES:
+                return False
+            raise ConfigError(f"'{name}' expects a boolean (true/false), got {text!r}")
+        if self.type is int:
+            try:
+                return int(text)
+            except ValueError:
+                raise ConfigError(f"'{name}' expects an integer, got {text!r}") from None
+        return text
+
+
+# Sections and keys of config.json
+CONFIG_SCHEMA: Dict[str, Dict[str, ConfigField]] = {
+    'paths': {
+        'output_dir': ConfigField(str),
+        'vendor_dir': ConfigField(str),
+        'vendor_builder_dir': ConfigField(str),
+        'cache_dir': ConfigField(str, 'outputs/.cache'),
+    },
+    'build': {
+        'clean_before_build': ConfigField(bool, True),
+        'staged_output': ConfigField(bool, True),
+        'check_vendor_dependencies': ConfigField(bool, True),
+        'incremental': ConfigField(bool, False),
+        'jobs': ConfigField(int, 1, minimum=1),
+        'page_jobs': ConfigField(int, 1, minimum=1),
+        'minify': ConfigField(bool, True),
+        'precompress': ConfigField(bool, True),
+        'template_cache': ConfigField(bool, True),
+        'highlight_cache_mb': ConfigField(int, 32, minimum=0),
+        'markdown_cache': ConfigField(bool, True),
+        'icon_sprite': ConfigField(bool, True),
+        'search_shards': ConfigField(bool, True),
+        'import_budget_ms': ConfigField(int, 100, minimum=1),
+    },
+    'serve': {
+        'port': ConfigField(int, 8000, minimum=1),
+        'host': ConfigField(str, 'localhost'),
+        'check_vendor_dependencies': ConfigField(bool, True),
+        'dirty_rebuild': ConfigField(bool, True),
+        'lang': ConfigField(str, ''),
+        'quiet_period_ms': ConfigField(int, 600, minimum=0),
+        'in_memory': ConfigField(bool, False),
+        'page_cache_mb': ConfigField(int, 64, minimum=1),
+        'lazy': ConfigField(bool, False),
+    },
+    'docker': {
+        'image_name': ConfigField(str, 'phantom-docs-kit'),
+        'build_tag': ConfigField(str, 'latest'),
+        'container_prefix': ConfigField(str, 'phantom-docs'),
+        'transfer': ConfigField(str, 'archive', choices=('archive', 'delta')),
+    },
+    'logging': {
+        'enabled': ConfigField(bool, True),
+        'console_level': ConfigField(str, 'INFO', choices=LOG_LEVELS),
+        'file_level': ConfigField(str, 'DEBUG', choices=LOG_LEVELS),
+        'log_directory': ConfigField(str, 'logs'),
+        'max_file_size': ConfigField(str, '10MB'),
+        'backup_count': ConfigField(int, 5, minimum=0),
+        'timestamp_format': ConfigField(str, '%Y-%m-%d %H:%M:%S'),
+        'log_filename_pattern': ConfigField(str, 'phantom-{mode}-{date}-{time}.log'),
+    },
+}
+
+
+class ConfigSection(Mapping):
+    """Read-only mapping with attribute access (config['build']['jobs'] or config.build.jobs)"""
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data: Dict[str, Any]):
+        object.__setattr__(self, '_data', {key: _freeze(value) for key, value in data.items()})
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getattr__(self, key: str) -> Any:
+        try:
+            return self._data[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise TypeError("Configuration is read-only")
+
+    def __reduce__(self):
+        return self.__class__, (self.to_dict(),)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mutable deep copy as plain dicts and lists"""
+        return {key: _thaw(value) for key, value in self._data.items()}
+
+
+class Config(ConfigSection):
+    """Validated config.json with its source path and modification time"""
+
+    __slots__ = ('source', 'mtime_ns')
+
+    def __init__(self, data: Dict[str, Any], source: Optional[Path] = None, mtime_ns: int = 0):
+        super().__init__(data)
+        object.__setattr__(self, 'source', source)
+        object.__setattr__(self, 'mtime_ns', mtime_ns)
+
+    def __reduce__(self):
+        return self.__class__, (self.to_dict(), self.source, self.mtime_ns)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return ConfigSection(value)
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, ConfigSection):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _unknown_key_error(kind: str, name: str, known: List[str]) -> ConfigError:
+    suggestion = difflib.get_close_matches(name, known, n=1)
+    hint = f" (did you mean '{suggestion[0]}'?)" if suggestion else ''
+    return ConfigError(f"Unknown {kind} '{name}'{hint}")
+
+
+def get_env_overrides(environ: Optional[Mapping] = None) -> Dict[Tuple[str, str], str]:
+    """Collect PHANTOM_<SECTION>__<KEY> environment variables"""
+    environ = os.environ if environ is None else environ
+    overrides = {}
+    for name in environ:
+        if not name.startswith(ENV_PREFIX) or ENV_SEPARATOR not in name:
+            continue
+        section, _, key = name[len(ENV_PREFIX):].lower().partition(ENV_SEPARATOR)
+        overrides[(section, key)] = environ[name]
+    return overrides
+
+
+def validate_config(raw: Dict[str, Any], overrides: Optional[Dict[Tuple[str, str], str]] = None) -> Dict[str, Any]:
+    """Validate raw config.json data against CONFIG_SCHEMA
+
+    Fills in defaults and applies environment overrides. Every problem is
+    collected so a broken config.json reports all of them at once.
+
+    Returns:
+        Validated configuration as plain dicts
+
+    Raises:
+        ConfigError: When a section or key is unknown, missing or has the wrong type
+    """
+    if not isinstance(raw, dict):
+        raise ConfigError("config.json must contain a JSON object")
+
+    errors = []
+    config = {}
+    for section in raw:
+        if section not in CONFIG_SCHEMA:
+            errors.append(str(_unknown_key_error('section', section, list(CONFIG_SCHEMA))))
+
+    for section, fields in CONFIG_SCHEMA.items():
+        values = raw.get(section, {})
+        if not isinstance(values, dict):
+            errors.append(f"'{section}' must be an object")
+            continue
+        for key in values:
+            if key not in fields:
+                errors.append(str(_unknown_key_error('key', f"{section}.{key}", [f"{section}.{name}" for name in fields])))
+
+        config[section] = {}
+        for key, field in fields.items():
+            name = f"{section}.{key}"
+            try:
+                if key in values:
+                    config[section][key] = field.validate(name, values[key])
+                elif field.required:
+                    errors.append(f"Missing required key '{name}'")
+                else:
+                    config[section][key] = field.default
+            except ConfigError as e:
+                errors.append(str(e))
+
+    for (section, key), text in (overrides or {}).items():
+        variable = f"{ENV_PREFIX}{section.upper()}{ENV_SEPARATOR}{key.upper()}"
+        field = CONFIG_SCHEMA.get(section, {}).get(key)
+        if field is None:
+            errors.append(f"{variable} does not match any config key")
+            continue
+        try:
+            name = f"{section}.{key}"
+            config[section][key] = field.validate(name, field.parse(name, text))
+        except ConfigError as e:
+            errors.append(f"{variable}: {e}")
+
+    if errors:
+        raise ConfigError('\n'.join(errors))
+    return config
+
+
+_cache: Dict[Path, Tuple[Tuple, Config]] = {}
+_cache_lock = threading.Lock()
+
+
+def read_config(config_file: str = 'config.json', reload: bool = False) -> Config:
+    """Load, validate and cache config.json
+
+    The parsed object is cached per file. Later calls only stat the file and
+    return the cached object until its mtime or size changes, so long-running
+    serve sessions pick up edits on the next call without re-parsing on every
+    access. Environment overrides are applied when the file is (re)loaded;
+    pass reload=True after changing them in-process.
+
+    Raises:
+        FileNotFoundError: When the config file does not exist
+        ConfigError: When the file is not valid JSON or fails validation
+    """
+    config_path = Path(os.path.abspath(config_file))
+    stat = os.stat(config_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        cached = _cache.get(config_path)
+        if cached and cached[0] == signature and not reload:
+            return cached[1]
+
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ConfigError(f"Invalid JSON in {config_file}: {e}") from None
+
+        config = Config(validate_config(raw, get_env_overrides()), config_path, stat.st_mtime_ns)
+        _cache[config_path] = (signature, config)
+        return config
+
+
+def clear_config_cache() -> None:
+    """Forget every cached configuration"""
+    with _cache_lock:
+        _cache.clear()
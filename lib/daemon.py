@@ -0,0 +1,232 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Build Daemon
+Keeps a warm build process on a Unix socket and forks it per build request
+"""
+
+import os
+import sys
+import json
+import signal
+import socket
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .config import clear_config_cache, get_env_overrides
+from .logging import get_logger
+
+SOCKET_NAME = 'build-daemon.sock'
+
+# Requests and replies are single JSON lines
+MAX_REQUEST_SIZE = 1024 * 1024
+
+
+def get_socket_path(config: Dict) -> Path:
+    """Default daemon socket below the cache directory"""
+    return Path(config['paths'].get('cache_dir', 'outputs/.cache')) / SOCKET_NAME
+
+
+def daemon_supported() -> bool:
+    """Unix sockets and fork() are required"""
+    return hasattr(socket, 'AF_UNIX') and hasattr(os, 'fork')
+
+
+def _send(conn: socket.socket, message: Dict) -> None:
+    conn.sendall(json.dumps(message).encode('utf-8') + b'\n')
+
+
+def _read_line(conn: socket.socket) -> bytes:
+    data = b''
+    while not data.endswith(b'\n'):
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+        if len(data) > MAX_REQUEST_SIZE:
+            raise ValueError("Request too large")
+    return data
+
+
+class BuildDaemon:
+    """Serves build requests on a Unix socket
+
+    Every request runs in a child forked from the warm daemon, so imports,
+    plugin entry points and the parsed config.json are already in memory
+    while each build still starts from a clean state. Builds run one at a
+    time since they share the output directory; the child's stdout and
+    stderr are streamed back to the client line by line.
+    """
+
+    def __init__(self, socket_path: Path, handler: Callable[[List[str]], None]):
+        self.socket_path = Path(socket_path)
+        self.handler = handler
+        self.root = os.getcwd()
+        self.builds = 0
+        self._server: Optional[socket.socket] = None
+
+    def _check_stale_socket(self) -> None:
+        """Remove a socket left behind by a daemon that is gone, refuse to start twice"""
+        if not self.socket_path.exists():
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            self.socket_path.unlink()
+        else:
+            raise RuntimeError(f"A build daemon is already listening on {self.socket_path}")
+        finally:
+            probe.close()
+
+    def serve_forever(self) -> None:
+        """Accept build requests until SIGINT/SIGTERM"""
+        logger = get_logger(__name__)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._check_stale_socket()
+
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        previous_umask = os.umask(0o077)
+        try:
+            self._server.bind(str(self.socket_path))
+        finally:
+            os.umask(previous_umask)
+        self._server.listen(16)
+
+        def stop(signum, frame):
+            raise KeyboardInterrupt
+        previous_handler = signal.signal(signal.SIGTERM, stop)
+
+        logger.info(f"Build daemon listening on {self.socket_path} (pid {os.getpid()})")
+        logger.info("Submit builds with: python build.py --via-daemon")
+        try:
+            while True:
+                conn, _ = self._server.accept()
+                with conn:
+                    self._handle(conn)
+        except KeyboardInterrupt:
+            logger.info(f"Build daemon stopped after {self.builds} builds")
+        finally:
+            signal.signal(signal.SIGTERM, previous_handler)
+            self._server.close()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+
+    def _handle(self, conn: socket.socket) -> None:
+        logger = get_logger(__name__)
+        try:
+            request = json.loads(_read_line(conn) or b'{}')
+        except ValueError as e:
+            _send(conn, {'error': f"Invalid request: {e}"})
+            return
+
+        argv = [str(arg) for arg in request.get('argv', [])]
+        if request.get('cwd') != self.root:
+            _send(conn, {'error': f"Daemon serves {self.root}, request came from {request.get('cwd')}"})
+            return
+        if '--daemon' in argv:
+            _send(conn, {'error': "--daemon cannot be submitted to a running daemon"})
+            return
+
+        self.builds += 1
+        logger.info(f"Build #{self.builds}: build.py {' '.join(argv)}".rstrip())
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            self._run_child(argv, request.get('env'), write_fd, conn)
+
+        os.close(write_fd)
+        client_gone = False
+        with os.fdopen(read_fd, 'rb') as output:
+            for line in output:
+                if client_gone:
+                    continue
+                try:
+                    _send(conn, {'output': line.decode('utf-8', errors='replace')})
+                except OSError:
+                    # Client went away (e.g. Ctrl+C), cancel its build
+                    client_gone = True
+                    os.kill(pid, signal.SIGINT)
+        _, status = os.waitpid(pid, 0)
+        exit_code = os.waitstatus_to_exitcode(status) if hasattr(os, 'waitstatus_to_exitcode') else status >> 8
+        logger.info(f"Build #{self.builds} finished with exit code {exit_code}")
+        if not client_gone:
+            try:
+                _send(conn, {'exit': exit_code})
+            except OSError:
+                pass
+
+    def _run_child(self, argv: List[str], env: Optional[Dict[str, str]], write_fd: int,
+                   conn: socket.socket) -> None:
+        """Run one build in the forked child, never returns"""
+        exit_code = 0
+        try:
+            conn.close()
+            self._server.close()
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(write_fd, 1)
+            os.dup2(write_fd, 2)
+            os.close(write_fd)
+            sys.stdout.reconfigure(line_buffering=True)
+            sys.stderr.reconfigure(line_buffering=True)
+
+            if env is not None:
+                # Environment overrides are applied when config.json is parsed
+                if get_env_overrides(env) != get_env_overrides():
+                    clear_config_cache()
+                os.environ.clear()
+                os.environ.update(env)
+
+            self.handler(argv)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except BaseException as e:
+            print(f"CRITICAL Unexpected error: {e}", flush=True)
+            exit_code = 1
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(exit_code)
+
+
+def submit_build(socket_path: Path, argv: List[str]) -> int:
+    """Send a build request to the daemon and stream its output
+
+    Returns:
+        Exit code of the build
+
+    Raises:
+        ConnectionError: When no daemon is listening on socket_path
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(socket_path))
+    except (FileNotFoundError, ConnectionRefusedError):
+        client.close()
+        raise ConnectionError(f"No build daemon on {socket_path}, start one with: python build.py --daemon") from None
+
+    with client:
+        _send(client, {'argv': argv, 'cwd': os.getcwd(), 'env': dict(os.environ)})
+        with client.makefile('rb') as replies:
+            for line in replies:
+                reply = json.loads(line)
+                if 'output' in reply:
+                    sys.stdout.write(reply['output'])
+                    sys.stdout.flush()
+                elif 'exit' in reply:
+                    return reply['exit']
+                elif 'error' in reply:
+                    print(f"ERROR    {reply['error']}", file=sys.stderr)
+                    return 1
+    print("ERROR    Build daemon closed the connection", file=sys.stderr)
+    return 1
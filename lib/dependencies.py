@@ -0,0 +1,272 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Page Dependency Graph
+Maps changed files to the pages they affect so serve only re-renders those pages
+"""
+
+import os
+import logging
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Any
+
+from .main import patch_function
+from .incremental import fire_page_context
+from .logging import get_logger
+
+# Theme files with these extensions are Jinja templates, everything else is a static asset
+TEMPLATE_EXTENSIONS = {'.html', '.xml', '.j2', '.jinja'}
+
+# Page attributes produced by _populate_page (read_source, markdown conversion)
+RENDER_ATTRIBUTES = ('markdown', 'meta', 'content', 'toc', '_title_from_render')
+
+
+class RebuildCancelled(Exception):
+    """Raised inside a dirty build when newer file changes make it obsolete"""
+
+
+class RebuildPlan:
+    """Pages to convert and render again after a set of file changes
+
+    Args:
+        sources: Markdown sources whose pages must be converted again
+        pages: Pages (site relative output paths) whose HTML must be rendered again
+        full: Rebuild everything, the graph cannot tell what a change affects
+        reload_all: Reload every browser, e.g. after a stylesheet changed
+    """
+
+    def __init__(self, sources: Optional[Set[str]] = None, pages: Optional[Set[str]] = None,
+                 full: bool = False, reload_all: bool = False, reason: str = ''):
+        self.sources = sources or set()
+        self.pages = pages or set()
+        self.full = full
+        self.reload_all = reload_all or full
+        self.reason = reason
+
+    @classmethod
+    def full_rebuild(cls, reason: str) -> 'RebuildPlan':
+        return cls(full=True, reason=reason)
+
+
+class PageDependencyGraph:
+    """Dependencies between source files and the pages of the last build
+
+    Recorded while building:
+
+    - markdown source -> pages (one per locale that renders it, including
+      fallback pages of untranslated locales)
+    - template / partial -> every page
+    - navigation -> every page of the same locale, because Material renders
+      the complete navigation tree and the previous/next links into each page
+
+    The converted markdown of every page is kept as well, so pages that are
+    not affected skip the conversion on the next rebuild.
+    """
+
+    def __init__(self, site_dir: str, docs_dir: str, template_dirs: List[str], config_files: List[str]):
+        self.site_dir = os.path.abspath(site_dir)
+        self.docs_dir = os.path.abspath(docs_dir)
+        self.template_dirs = [os.path.abspath(path) for path in template_dirs if path]
+        self.config_files = {os.path.abspath(path) for path in config_files if path}
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.sources: Dict[str, Set[str]] = {}
+        self.renders: Dict[str, Dict[str, Any]] = {}
+        # False until a build completed, every plan is a full rebuild until then
+        self.valid = False
+
+    def reset(self) -> None:
+        self.pages.clear()
+        self.sources.clear()
+        self.renders.clear()
+        self.valid = False
+
+    def page_key(self, page) -> str:
+        """Graph key of a page: its output path relative to the served site"""
+        return Path(os.path.relpath(page.file.abs_dest_path, self.site_dir)).as_posix()
+
+    def record_page(self, page, locale: str) -> None:
+        key = self.page_key(page)
+        source = os.path.abspath(page.file.abs_src_path)
+        self.pages[key] = {'source': source, 'locale': locale, 'title': page.title or ''}
+        self.sources.setdefault(source, set()).add(key)
+
+    def store_render(self, page, signature: Optional[tuple] = None) -> None:
+        """Keep the converted markdown of a page for the next rebuild"""
+        if signature is None:
+            signature = _source_signature(os.path.abspath(page.file.abs_src_path))
+        self.renders[self.page_key(page)] = {'signature': signature,
+                                             **{name: getattr(page, name, None) for name in RENDER_ATTRIBUTES}}
+
+    def locale_pages(self, locale: str) -> Set[str]:
+        return {key for key, entry in self.pages.items() if entry['locale'] == locale}
+
+    def _in_dir(self, path: str, directory: str) -> bool:
+        return path == directory or path.startswith(directory + os.sep)
+
+    def plan(self, changed_paths: Iterable[str]) -> RebuildPlan:
+        """Work out what a set of changed files requires"""
+        changed_paths = sorted({os.path.abspath(path) for path in changed_paths})
+        if not self.valid:
+            return RebuildPlan.full_rebuild('no previous build')
+        if not changed_paths:
+            return RebuildPlan.full_rebuild('unknown change')
+
+        plan = RebuildPlan()
+        for path in changed_paths:
+            name = os.path.relpath(path)
+            if path in self.config_files:
+                return RebuildPlan.full_rebuild(f"{name} changed")
+
+            if self._in_dir(path, self.docs_dir) and path.endswith('.md'):
+                if path not in self.sources or not os.path.exists(path):
+                    # Adding or removing a page changes the navigation and the links
+                    return RebuildPlan.full_rebuild(f"{name} was added or removed")
+                plan.sources.add(path)
+                plan.pages |= self.sources[path]
+            elif any(self._in_dir(path, directory) for directory in self.template_dirs):
+                if os.path.splitext(path)[1] in TEMPLATE_EXTENSIONS:
+                    plan.pages |= set(self.pages)
+                plan.reload_all = True
+            elif self._in_dir(path, self.docs_dir):
+                # Static asset of the docs, copied again without rendering pages
+                plan.reload_all = True
+            else:
+                return RebuildPlan.full_rebuild(f"{name} changed")
+        return plan
+
+
+class DirtyPageBuild:
+    """Build that only converts and renders the pages a RebuildPlan names
+
+    The previous output is kept (clean_directory is skipped), unaffected
+    pages reuse their converted markdown and output file, and static files
+    are only copied when they are newer. A page whose title changed marks
+    every page of its locale dirty, since the navigation changed.
+
+    Every build, full or not, records the dependency graph for the next one.
+    cancelled is polled before each page is converted or rendered; once it
+    returns True the build stops with RebuildCancelled. The graph stays
+    valid then, but dirty_pages must be carried into the next plan.
+    output_exists tells whether a page's previous output can be kept.
+    """
+
+    def __init__(self, graph: PageDependencyGraph, plan: RebuildPlan,
+                 cancelled: Optional[Callable[[], bool]] = None,
+                 output_exists: Callable[[str], bool] = os.path.isfile):
+        self.graph = graph
+        self.plan = plan
+        self.cancelled = cancelled
+        self.output_exists = output_exists
+        self.dirty_pages: Set[str] = set(plan.pages)
+        self.converted = 0
+        self.rendered: Set[str] = set()
+        self.reused = 0
+        self._stack: Optional[ExitStack] = None
+        self._saved_state = None
+
+    def __enter__(self) -> 'DirtyPageBuild':
+        from mkdocs import utils
+        from mkdocs.commands import build as mkdocs_build
+        from mkdocs.structure.files import Files
+
+        if self.plan.full:
+            self.graph.reset()
+        self.graph.valid = False
+        # The i18n plugin swaps clean_directory and adds a log filter while it
+        # builds the other locales, without restoring them when a build fails
+        build_logger = logging.getLogger('mkdocs.commands.build')
+        self._saved_state = (utils.clean_directory, list(build_logger.filters))
+
+        self._stack = ExitStack()
+        self._stack.enter_context(patch_function(mkdocs_build, '_populate_page', self._populate_page))
+        self._stack.enter_context(patch_function(mkdocs_build, '_build_page', self._build_page))
+        if not self.plan.full:
+            self._stack.enter_context(patch_function(utils, 'clean_directory', lambda original, directory: None))
+            self._stack.enter_context(patch_function(Files, 'copy_static_files', self._copy_static_files))
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        from mkdocs import utils
+
+        self._stack.close()
+        clean_directory, filters = self._saved_state
+        utils.clean_directory = clean_directory
+        logging.getLogger('mkdocs.commands.build').filters[:] = filters
+        # A failed build leaves the output half written, the next one starts over.
+        # A cancelled dirty build only left some of its dirty pages stale.
+        cancelled = exc_type is not None and issubclass(exc_type, RebuildCancelled)
+        self.graph.valid = exc_type is None or (cancelled and not self.plan.full)
+
+    def _check_cancelled(self) -> None:
+        if self.cancelled is not None and self.cancelled():
+            raise RebuildCancelled(f"{len(self.rendered)} of {len(self.dirty_pages)} dirty pages rendered")
+
+    @staticmethod
+    def _copy_static_files(original, files, dirty: bool = False, **kwargs) -> None:
+        # dirty=True copies only files newer than their output
+        original(files, dirty=True, **kwargs)
+
+    @staticmethod
+    def _locale(config) -> str:
+        i18n = config.plugins.get('i18n')
+        if i18n is None:
+            return ''
+        return getattr(i18n, 'current_language', None) or ''
+
+    def _populate_page(self, original, page, config, files, dirty: bool = False) -> None:
+        self._check_cancelled()
+        key = self.graph.page_key(page)
+        source = os.path.abspath(page.file.abs_src_path)
+        cached = self.graph.renders.get(key)
+        signature = _source_signature(source)
+
+        if (not self.plan.full and source not in self.plan.sources and cached
+                and cached['signature'] == signature):
+            for name in RENDER_ATTRIBUTES:
+                setattr(page, name, cached[name])
+        else:
+            original(page, config, files, dirty)
+            self.converted += 1
+            self.graph.store_render(page, signature)
+
+        locale = self._locale(config)
+        previous = self.graph.pages.get(key)
+        self.graph.record_page(page, locale)
+        if previous is not None and previous['title'] != (page.title or ''):
+            # Navigation labels and previous/next links of the whole locale changed
+            self.dirty_pages |= self.graph.locale_pages(locale)
+
+    def _build_page(self, original, page, config, doc_files, nav, env, dirty: bool = False,
+                    excluded: bool = False) -> None:
+        key = self.graph.page_key(page)
+        if self.plan.full or key in self.dirty_pages or not self.output_exists(page.file.abs_dest_path):
+            self._check_cancelled()
+            original(page, config, doc_files, nav, env, dirty, excluded)
+            self.rendered.add(key)
+            return
+        fire_page_context(page, config, doc_files, nav)
+        self.reused += 1
+
+    def report(self) -> None:
+        """Log what the rebuild converted and rendered"""
+        logger = get_logger(__name__)
+        if self.plan.full:
+            logger.info(f"Full rebuild ({self.plan.reason}): {len(self.rendered)} pages")
+            return
+        pages = ', '.join(sorted(self.rendered)[:5]) + (', ...' if len(self.rendered) > 5 else '')
+        logger.info(f"Rebuilt {len(self.rendered)} of {len(self.rendered) + self.reused} pages "
+                    f"({self.converted} converted){': ' + pages if pages else ''}")
+
+
+def _source_signature(path: str) -> Optional[tuple]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
@@ -17,13 +17,21 @@ import subprocess
 import time
 import threading
 import re
+import io
+import json
+import tarfile
 from datetime import datetime
 import docker
 from docker.models.images import Image
 from docker.errors import DockerException, BuildError, APIError, NotFound
 
+from .transfer import ArtifactTransfer
+from .metrics import MUTAGEN_STATUS_ENV
 from .logging import get_logger
 
+# Where the host publishes the Mutagen sync status for /__phantom/status inside the container
+MUTAGEN_STATUS_FILE = '/tmp/phantom-mutagen-status.json'
+
 class DockerManager:
     """Handles Docker container lifecycle and operations"""
     
@@ -357,63 +365,10 @@ class DockerManager:
                         logger.info(line)
             
             if build_success:
-                # Create tar.gz archive in container
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                zip_name = f"phantom-docs-build-docker-remote-{timestamp}.tar.gz"
-                
-                logger.info("Creating build archive...")
-                
-                # Use tar with gzip
-                zip_result = container.exec_run(
-                    ["sh", "-c", f"cd /app && tar -czf /tmp/{zip_name} outputs/"]
-                )
-                
-                if zip_result.exit_code == 0:
-                    # Copy ZIP to local outputs directory
-                    logger.info("Copying build archive from container...")
-                    
-                    # Ensure local outputs directory exists
-                    local_outputs = Path("outputs")
-                    local_outputs.mkdir(exist_ok=True)
-                    
-                    # Use Docker SDK to get the archive
-                    try:
-                        # Get the archive as a tar stream
-                        bits, stat = container.get_archive(f'/tmp/{zip_name}')
-                        
-                        # Write the archive locally
-                        import tarfile
-                        import io
-                        
-                        # Create a BytesIO object from the bits generator
-                        tar_data = io.BytesIO()
-                        for chunk in bits:
-                            tar_data.write(chunk)
-                        tar_data.seek(0)
-                        
-                        # Extract the ZIP file from the tar archive
-                        with tarfile.open(fileobj=tar_data, mode='r') as tar:
-                            # Find and extract the ZIP file
-                            for member in tar.getmembers():
-                                if member.name == zip_name:
-                                    # Extract directly to outputs directory
-                                    tar.extract(member, path=str(local_outputs))
-                                    logger.info(f"✓ Build archive saved: outputs/{zip_name}")
-                                    build_success = True
-                                    break
-                            else:
-                                logger.error("ZIP file not found in tar archive")
-                                build_success = False
-                                
-                    except APIError as e:
-                        logger.error(f"Failed to copy build archive: {e}")
-                        build_success = False
+                if self.docker_config.get('transfer', 'archive') == 'delta':
+                    build_success = self._transfer_delta(container)
                 else:
-                    logger.error(f"Failed to create build archive: {zip_result.output.decode() if zip_result.output else 'No output'}")
-                    # Check if outputs directory exists and has content
-                    check_outputs = container.exec_run(["ls", "-la", "/app/outputs/"])
-                    logger.error(f"outputs directory content: {check_outputs.output.decode() if check_outputs.output else 'No output'}")
-                    build_success = False
+                    build_success = self._transfer_archive(container)
             
             # Terminate mutagen session
             sync_manager.terminate_session()
@@ -437,8 +392,61 @@ class DockerManager:
             return False
     
             
-    def run_serve(self, working_dir: str = ".", port: int = 8000) -> None:
-        """Run serve in Docker container with hot reload"""
+    def _transfer_archive(self, container) -> bool:
+        """Pack outputs/ into a tar.gz in the container and stream it to outputs/"""
+        logger = get_logger(__name__)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        zip_name = f"phantom-docs-build-docker-remote-{timestamp}.tar.gz"
+        
+        logger.info("Creating build archive...")
+        
+        # Use tar with gzip, the build cache is not part of the artifact
+        zip_result = container.exec_run(
+            ["sh", "-c", f"cd /app && tar -czf /tmp/{zip_name} --exclude=outputs/.cache outputs/"]
+        )
+        
+        if zip_result.exit_code != 0:
+            logger.error(f"Failed to create build archive: {zip_result.output.decode() if zip_result.output else 'No output'}")
+            # Check if outputs directory exists and has content
+            check_outputs = container.exec_run(["ls", "-la", "/app/outputs/"])
+            logger.error(f"outputs directory content: {check_outputs.output.decode() if check_outputs.output else 'No output'}")
+            return False
+        
+        logger.info("Copying build archive from container...")
+        
+        # Ensure local outputs directory exists
+        local_outputs = Path("outputs")
+        local_outputs.mkdir(exist_ok=True)
+        
+        try:
+            # Streamed chunk by chunk, the archive is never held in memory
+            size = ArtifactTransfer(container).fetch_file(f"/tmp/{zip_name}", local_outputs / zip_name)
+            logger.info(f"✓ Build archive saved: outputs/{zip_name} ({size / (1024 * 1024):.1f} MB)")
+            return True
+        except (APIError, FileNotFoundError) as e:
+            logger.error(f"Failed to copy build archive: {e}")
+            return False
+        finally:
+            container.exec_run(["rm", "-f", f"/tmp/{zip_name}"])
+    
+    def _transfer_delta(self, container) -> bool:
+        """Mirror the container output directory locally, copying only changed files"""
+        logger = get_logger(__name__)
+        output_dir = self.config['paths']['output_dir']
+        
+        logger.info("Comparing build output with the local copy...")
+        try:
+            stats = ArtifactTransfer(container).sync_delta(output_dir, Path(output_dir))
+            logger.info(f"✓ Build output synced to {output_dir}: {stats['transferred']} files "
+                        f"({stats['bytes'] / (1024 * 1024):.1f} MB) transferred, "
+                        f"{stats['unchanged']} unchanged, {stats['deleted']} removed")
+            return True
+        except (APIError, RuntimeError, ValueError, OSError) as e:
+            logger.error(f"Failed to transfer build output: {e}")
+            return False
+    
+    def run_serve(self, working_dir: str = ".", port: int = 8000, lang: str = "") -> None:
+        """Run serve in Docker container with hot reload (lang limits it to one locale)"""
         logger = get_logger(__name__)
         
         # Detect environment and choose strategy
@@ -446,18 +454,18 @@ class DockerManager:
         
         if env['sync_strategy'] == 'volumes':
             # Existing local Docker implementation
-            self._run_serve_with_volumes(working_dir, port)
+            self._run_serve_with_volumes(working_dir, port, lang)
         elif env['sync_strategy'] == 'mutagen':
             logger.info("Remote Docker detected - using Mutagen synchronization")
             logger.info(f"Mutagen version: {env['mutagen_version']}")
-            self._run_serve_with_mutagen(working_dir, port)
+            self._run_serve_with_mutagen(working_dir, port, lang)
         else:
             logger.error("Remote Docker detected but Mutagen not installed")
             logger.error("Please install Mutagen to enable file synchronization")
             logger.error("  macOS: brew install mutagen-io/mutagen/mutagen")
             logger.error("  Linux: Download from https://github.com/mutagen-io/mutagen/releases")
     
-    def _run_serve_with_volumes(self, working_dir: str = ".", port: int = 8000) -> None:
+    def _run_serve_with_volumes(self, working_dir: str = ".", port: int = 8000, lang: str = "") -> None:
         """Original run_serve implementation with volume mappings"""
         logger = get_logger(__name__)
         if not self.client:
@@ -485,7 +493,7 @@ class DockerManager:
                 name=container_name,
                 volumes=volumes,
                 ports=ports,
-                command=["python", "serve.py"],
+                command=["python", "serve.py"] + (["--lang", lang] if lang else []),
                 detach=True,
                 remove=False,
                 working_dir="/app",
@@ -509,7 +517,7 @@ class DockerManager:
                 self.container.stop()
                 self.container.remove()
     
-    def _run_serve_with_mutagen(self, working_dir: str = ".", port: int = 8000) -> None:
+    def _run_serve_with_mutagen(self, working_dir: str = ".", port: int = 8000, lang: str = "") -> None:
         """Run container with Mutagen synchronization for remote Docker"""
         logger = get_logger(__name__)
         container_name = f"{self.docker_config['container_prefix']}-serve"
@@ -552,17 +560,20 @@ class DockerManager:
             # Start monitor
             sync_manager.start_monitor(logger_integration=True)
             
+            sync_manager.start_status_export(container)
+
             logger.debug("Monitor started, preparing to start development server...")
             # Now that files are synced, start the actual serve process
             logger.info("Starting development server...")
             exec_result = container.exec_run(
-                ["python", "serve.py"],
+                ["python", "serve.py"] + (["--lang", lang] if lang else []),
                 stream=True,
                 demux=True,
                 environment={
                     "PYTHONUNBUFFERED": "1",
                     "DOCKER_MODE": "1",
-                    "DOCKER_REMOTE_SERVE": "1"
+                    "DOCKER_REMOTE_SERVE": "1",
+                    MUTAGEN_STATUS_ENV: MUTAGEN_STATUS_FILE
                 }
             )
             
@@ -728,6 +739,8 @@ class MutagenSessionManager:
         self.session_name = f"phantom-{container_name}-{int(time.time())}"
         self.forward_session_prefix = f"phantom-forward-{container_name}"
         self.monitor_thread = None
+        self.status_thread = None
+        self._stop_status_export = threading.Event()
         self.port_mappings = port_mappings or {}  # {container_port: local_port}
         self.active_forward_sessions = []  # Track created forward sessions
     
@@ -974,6 +987,72 @@ class MutagenSessionManager:
         self.monitor_thread = threading.Thread(target=monitor_output, daemon=True)
         self.monitor_thread.start()
     
+    def sync_status(self) -> Optional[Dict[str, Any]]:
+        """Status, conflict and problem counts parsed from 'mutagen sync list -l'"""
+        result = subprocess.run(
+            ['mutagen', 'sync', 'list', self.session_name, '-l'],
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            errors='replace'
+        )
+        if result.returncode != 0:
+            return None
+
+        status_match = re.search(r'Status:\s*(.+)', result.stdout)
+        description = status_match.group(1).strip() if status_match else 'Unknown'
+        counts = {'conflicts': 0, 'problems': 0}
+        section = None
+        for line in result.stdout.splitlines():
+            stripped = line.strip()
+            header = stripped.lower()
+            if header.endswith(':') and ('conflicts' in header or 'problems' in header):
+                # Entries follow the header, one per indented line
+                section = 'conflicts' if 'conflicts' in header else 'problems'
+                section_indent = len(line) - len(line.lstrip())
+            elif section and stripped and len(line) - len(line.lstrip()) > section_indent:
+                counts[section] += 1
+            else:
+                section = None
+                if 'conflicts:' in header or 'problems:' in header:
+                    # Inline form, e.g. "Conflicts: None"
+                    name = 'conflicts' if 'conflicts:' in header else 'problems'
+                    count_match = re.search(r':\s*(\d+)', stripped)
+                    counts[name] += int(count_match.group(1)) if count_match else 0
+        return {
+            'session': self.session_name,
+            'status': description.split()[0].lower(),
+            'description': description,
+            **counts,
+            'updated': round(time.time(), 3)
+        }
+
+    def start_status_export(self, container, interval: float = 5.0):
+        """Copy sync_status() into the container every interval seconds (read by /__phantom/status)"""
+        directory, name = os.path.split(MUTAGEN_STATUS_FILE)
+
+        def export_status():
+            logger = get_logger(__name__)
+            while not self._stop_status_export.wait(interval):
+                status = self.sync_status()
+                if status is None:
+                    continue
+                content = json.dumps(status).encode('utf-8')
+                archive = io.BytesIO()
+                with tarfile.open(fileobj=archive, mode='w') as tar:
+                    info = tarfile.TarInfo(name)
+                    info.size = len(content)
+                    info.mtime = int(time.time())
+                    tar.addfile(info, io.BytesIO(content))
+                try:
+                    container.put_archive(directory, archive.getvalue())
+                except (APIError, NotFound) as e:
+                    logger.debug(f"Could not export Mutagen status: {e}")
+                    return
+
+        self.status_thread = threading.Thread(target=export_status, daemon=True)
+        self.status_thread.start()
+
     def create_port_forward(self) -> bool:
         """Create Mutagen forward session for port forwarding"""
         logger = get_logger(__name__)
@@ -1068,6 +1147,7 @@ class MutagenSessionManager:
     def terminate_session(self):
         """Terminate Mutagen sync and forward sessions"""
         logger = get_logger(__name__)
+        self._stop_status_export.set()
         
         # Terminate sync session
         subprocess.run(
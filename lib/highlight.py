@@ -0,0 +1,160 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Highlight Cache
+Reuses the Pygments HTML of code blocks across locales and builds, size-bounded with LRU eviction
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from .main import ContentStore, hash_bytes, patch_function
+from .logging import get_logger
+
+# Part of every cache key, bump when the key layout changes
+HIGHLIGHT_VERSION = '1'
+
+
+def _highlighter_versions() -> str:
+    from importlib.metadata import version
+    return '|'.join(f"{package}={version(package)}" for package in ('pygments', 'pymdown-extensions', 'markdown'))
+
+
+class HighlightCache:
+    """Content-addressed store of highlighted code blocks under <cache_dir>/highlight
+
+    Keys cover the language, the code, every highlighter option and the
+    Pygments, pymdown-extensions and Markdown versions. Entries live in
+    memory (bounded by max_bytes, least recently used first out) and on
+    disk, where each hit refreshes the entry's mtime so prune() can evict
+    the least recently used entries once the directory outgrows max_bytes.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.store = ContentStore(Path(cache_dir) / 'highlight')
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.used: Set[str] = set()
+        self._lock = threading.Lock()
+        self._memory: 'OrderedDict[str, str]' = OrderedDict()
+        self._memory_bytes = 0
+        self._versions = _highlighter_versions()
+
+    def key(self, kind: str, *parts: Any) -> str:
+        return hash_bytes('\0'.join([HIGHLIGHT_VERSION, self._versions, kind, *map(repr, parts)]).encode('utf-8'))
+
+    def _remember(self, key: str, html: str) -> None:
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = html
+        self._memory_bytes += len(html)
+        while self._memory_bytes > self.max_bytes and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            html = self._memory.get(key)
+            if html is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.used.add(key)
+                return html
+
+        # Touched as the last use of the entry, prune() evicts the oldest
+        data = self.store.read(key, touch=True)
+        if data is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        html = data.decode('utf-8')
+        with self._lock:
+            self._remember(key, html)
+            self.hits += 1
+            self.used.add(key)
+        return html
+
+    def put(self, key: str, html: str) -> None:
+        with self._lock:
+            self._remember(key, html)
+            self.used.add(key)
+        self.store.write(key, html.encode('utf-8'))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+    def prune(self) -> int:
+        """Evict the least recently used entries on disk beyond max_bytes"""
+        removed = self.store.evict(self.max_bytes)
+        if removed:
+            get_logger(__name__).debug(f"Highlight cache: evicted {removed} least recently used code blocks")
+        return removed
+
+
+def _options_key(options: Dict[str, Any]) -> tuple:
+    # Callables (formatters, custom lexers) by name, their repr holds an address
+    return tuple(sorted((name, getattr(value, '__qualname__', value) if callable(value) else value)
+                        for name, value in options.items()))
+
+
+class CachedHighlighting:
+    """Serve pymdownx.highlight and codehilite blocks from a HighlightCache
+
+    Patches pymdownx.highlight.Highlight.highlight (fenced blocks through
+    superfences) and markdown's CodeHilite.hilite (indented blocks). Inline
+    code returns an element instead of a string and is not cached.
+    """
+
+    def __init__(self, cache: HighlightCache):
+        self.cache = cache
+        self._stack: Optional[ExitStack] = None
+
+    def __enter__(self) -> 'CachedHighlighting':
+        from pymdownx.highlight import Highlight
+        from markdown.extensions.codehilite import CodeHilite
+
+        self._stack = ExitStack()
+        self._stack.enter_context(patch_function(Highlight, 'highlight', self._highlight))
+        self._stack.enter_context(patch_function(CodeHilite, 'hilite', self._hilite))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stack.close()
+
+    def _highlight(self, original, highlighter, src, language, *args, **kwargs):
+        if kwargs.get('inline') or (len(args) > 5 and args[5]):
+            return original(highlighter, src, language, *args, **kwargs)
+        key = self.cache.key('highlight', src, language, args, _options_key(kwargs),
+                             _options_key(vars(highlighter)))
+        html = self.cache.get(key)
+        if html is None:
+            html = original(highlighter, src, language, *args, **kwargs)
+            self.cache.put(key, html)
+        return html
+
+    def _hilite(self, original, code_hilite, shebang: bool = True):
+        key = self.cache.key('codehilite', code_hilite.src, shebang, _options_key(vars(code_hilite)))
+        html = self.cache.get(key)
+        if html is None:
+            html = original(code_hilite, shebang)
+            self.cache.put(key, html)
+        return html
+
+
+def report_highlight_cache(stats: Dict[str, Any]) -> None:
+    """Log the hit rate of the highlight cache"""
+    total = stats['hits'] + stats['misses']
+    if total:
+        get_logger(__name__).info(f"Highlight cache: {stats['hits']} of {total} code blocks reused "
+                                  f"({stats['hits'] / total:.0%} hit rate)")
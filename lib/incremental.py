@@ -0,0 +1,237 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Incremental Build
+Persistent page-level build manifest used to skip re-rendering unchanged pages
+"""
+
+import os
+import json
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Dict, Optional, Any
+
+from .main import hash_bytes, hash_file, patch_function
+from .staging import link_or_copy
+from .logging import get_logger
+
+# Bump when the manifest layout changes so old manifests force a full build
+MANIFEST_VERSION = 1
+
+# Packages whose upgrade changes the rendered output
+FINGERPRINT_PACKAGES = [
+    'mkdocs',
+    'mkdocs-material',
+    'mkdocs-static-i18n',
+    'pymdown-extensions',
+    'pygments',
+]
+
+
+class BuildManifest:
+    """Content hashes of the build inputs and of every rendered page"""
+
+    def __init__(self, config: Dict, mkdocs_file: str = 'mkdocs.yml', config_file: str = 'config.json'):
+        self.config = config
+        self.cache_dir = Path(config['paths'].get('cache_dir', 'outputs/.cache'))
+        self.manifest_file = self.cache_dir / 'build-manifest.json'
+        self.mkdocs_file = Path(mkdocs_file)
+        self.config_file = Path(config_file)
+        self.previous: Dict[str, Any] = {}
+        self.fingerprint: Optional[str] = None
+        self.pages: Dict[str, Dict[str, str]] = {}
+
+    def load(self) -> None:
+        """Load the manifest written by the previous successful build"""
+        logger = get_logger(__name__)
+        if not self.manifest_file.exists():
+            return
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION:
+                self.previous = manifest
+        except (json.JSONDecodeError, IOError, OSError) as e:
+            logger.debug(f"Ignoring unreadable build manifest: {e}")
+
+    def compute_fingerprint(self, docs_dir: str, theme_dir: Optional[str]) -> str:
+        """Hash every input that affects all pages at once
+
+        Covers mkdocs.yml, config.json, every theme override file, the list of
+        documentation files (adding or removing a page changes the navigation)
+        and the versions of the rendering packages.
+        """
+        from importlib.metadata import version, PackageNotFoundError
+
+        parts = []
+        for file_path in [self.mkdocs_file, self.config_file]:
+            if file_path.exists():
+                parts.append(f"{file_path.as_posix()}:{hash_file(file_path)}")
+
+        if theme_dir and Path(theme_dir).exists():
+            for file_path in sorted(Path(theme_dir).rglob('*')):
+                if file_path.is_file():
+                    parts.append(f"{file_path.as_posix()}:{hash_file(file_path)}")
+
+        docs_path = Path(docs_dir)
+        if docs_path.exists():
+            for file_path in sorted(docs_path.rglob('*')):
+                if file_path.is_file():
+                    parts.append(file_path.relative_to(docs_path).as_posix())
+
+        for package in FINGERPRINT_PACKAGES:
+            try:
+                parts.append(f"{package}=={version(package)}")
+            except PackageNotFoundError:
+                parts.append(f"{package}==missing")
+
+        self.fingerprint = hash_bytes('\n'.join(parts).encode('utf-8'))
+        return self.fingerprint
+
+    def requires_full_build(self, site_dir: str) -> bool:
+        """Check whether global inputs changed since the previous build"""
+        if not self.previous or not Path(site_dir).exists():
+            return True
+        return self.previous.get('fingerprint') != self.fingerprint
+
+    def previous_page(self, dest: str) -> Optional[Dict[str, str]]:
+        """Get the manifest entry of a page from the previous build"""
+        if not self.previous:
+            return None
+        return self.previous.get('pages', {}).get(dest)
+
+    def invalidate(self) -> None:
+        """Remove the manifest so an interrupted build is never trusted"""
+        try:
+            self.manifest_file.unlink()
+        except FileNotFoundError:
+            pass
+
+    def save(self) -> None:
+        """Write the manifest of the current build"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'fingerprint': self.fingerprint,
+            'pages': self.pages
+        }
+        tmp_file = self.manifest_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, self.manifest_file)
+
+
+class IncrementalBuild:
+    """Skip template rendering and writing of pages whose inputs did not change
+
+    Markdown is still converted for every page so the search index, the
+    table of contents and the navigation titles stay complete. Only pages
+    with a changed source (or any page, once a title change alters the
+    navigation) are rendered and written again.
+    """
+
+    def __init__(self, manifest: BuildManifest, site_dir: str, full_build: bool,
+                 previous_dir: Optional[str] = None):
+        self.manifest = manifest
+        self.site_dir = site_dir
+        self.full_build = full_build
+        # Output of the previous build, defaults to building in place
+        self.previous_dir = previous_dir or site_dir
+        self.nav_changed = False
+        self.changed_pages = set()
+        self.rendered = 0
+        self.reused = 0
+        self._stack: Optional[ExitStack] = None
+
+    def __enter__(self) -> 'IncrementalBuild':
+        from mkdocs import utils
+        from mkdocs.commands import build as mkdocs_build
+
+        self._stack = ExitStack()
+        self._stack.enter_context(patch_function(mkdocs_build, '_populate_page', self._populate_page))
+        self._stack.enter_context(patch_function(mkdocs_build, '_build_page', self._build_page))
+        if not self.full_build:
+            # Keep the previous output, unchanged pages are served from it
+            self._stack.enter_context(patch_function(utils, 'clean_directory', lambda original, directory: None))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stack.close()
+
+    def _page_key(self, page) -> str:
+        """Manifest key of a page: its output path relative to site_dir"""
+        return Path(os.path.relpath(page.file.abs_dest_path, self.site_dir)).as_posix()
+
+    def _populate_page(self, original, page, config, files, dirty: bool = False) -> None:
+        original(page, config, files, dirty)
+
+        key = self._page_key(page)
+        entry = {
+            'source': hash_file(Path(page.file.abs_src_path)),
+            'title': page.title or ''
+        }
+        self.manifest.pages[key] = entry
+
+        previous = self.manifest.previous_page(key)
+        if previous != entry:
+            self.changed_pages.add(key)
+            if previous and previous.get('title') != entry['title']:
+                self.nav_changed = True
+
+    def _build_page(self, original, page, config, doc_files, nav, env, dirty: bool = False,
+                    excluded: bool = False) -> None:
+        key = self._page_key(page)
+        previous_output = os.path.join(self.previous_dir, key)
+        reusable = (
+            not self.full_build
+            and not self.nav_changed
+            and not excluded
+            and key not in self.changed_pages
+            and os.path.isfile(previous_output)
+        )
+        if not reusable:
+            self.rendered += 1
+            return original(page, config, doc_files, nav, env, dirty, excluded)
+
+        if os.path.abspath(previous_output) != os.path.abspath(page.file.abs_dest_path):
+            link_or_copy(previous_output, page.file.abs_dest_path)
+
+        fire_page_context(page, config, doc_files, nav)
+        self.reused += 1
+
+    def report(self) -> None:
+        """Log how many pages were rendered and reused"""
+        report_incremental_build(self.full_build, self.rendered, self.reused)
+
+
+def fire_page_context(page, config, doc_files, nav) -> None:
+    """Run the page_context event for a page whose rendering is skipped
+
+    Plugins such as search collect their data in page_context, so it has to
+    keep firing for pages that are served from a previous output.
+    """
+    from mkdocs.commands.build import get_context
+
+    config._current_page = page
+    try:
+        page.active = True
+        context = get_context(nav, doc_files, config, page)
+        config.plugins.on_page_context(context, page=page, config=config, nav=nav)
+    finally:
+        page.active = False
+        config._current_page = None
+
+
+def report_incremental_build(full_build: bool, rendered: int, reused: int) -> None:
+    """Log the page counts of an incremental build"""
+    logger = get_logger(__name__)
+    if full_build:
+        logger.info(f"Incremental build: full rebuild of {rendered} pages")
+    else:
+        logger.info(f"Incremental build: rendered {rendered} changed pages, "
+                    f"reused {reused} unchanged pages")
@@ -0,0 +1,758 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Live Server
+MkDocs development server that rebuilds only affected pages and reloads only their browsers
+"""
+
+import os
+import re
+import sys
+import html
+import json
+import shutil
+import time
+import tempfile
+import threading
+import posixpath
+import traceback
+import socketserver
+import wsgiref.simple_server
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from urllib.parse import quote, unquote, urljoin, urlsplit
+
+import watchdog.events
+from mkdocs.livereload import LiveReloadServer, _Handler, _timestamp
+
+from .dependencies import PageDependencyGraph, DirtyPageBuild, RebuildPlan, RebuildCancelled
+from .memsite import MemorySite, DEFAULT_MAX_PAGE_BYTES
+from .metrics import ServeMetrics, METRICS_PATH, STATUS_PATH
+from .templates import SharedBytecodeCache, share_compiled_templates
+from .rendercache import MarkdownRenderCache, CachedMarkdownRender
+from .highlight import HighlightCache, CachedHighlighting
+from .parallel import get_i18n_plugin, get_build_locales
+from .logging import get_logger
+
+LIVERELOAD_PATTERN = re.compile(r"/livereload/([0-9]+)/[0-9]+")
+
+
+class DirtyReloadServer(LiveReloadServer):
+    """LiveReloadServer that records which files changed and reloads per page
+
+    Browsers poll /livereload/<epoch>/<id>; the page they poll from comes
+    with the Referer header. A page only reloads when it was rendered again
+    (or when a change affects every page, e.g. a stylesheet).
+
+    Rebuilds are scheduled for bursts of changes (a git checkout, a Mutagen
+    sync batch): events are coalesced until none arrived for quiet_period
+    seconds, a change during a rebuild cancels it (see cancel_requested) and
+    at most one rebuild is queued, covering every change seen meanwhile.
+
+    With a MemorySite, files are served from memory instead of root. With
+    locale_root set (serving a single non-default locale, nothing is built
+    at the site root), the root redirects to that locale.
+
+    /__phantom/metrics (Prometheus) and /__phantom/status (JSON) expose the
+    ServeMetrics of the session.
+    """
+
+    def __init__(self, *args, quiet_period: float = 0.1, site: Optional[MemorySite] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.build_delay = quiet_period
+        self.site = site
+        self.locale_root: Optional[str] = None
+        self._changed_paths: Set[str] = set()
+        self._recorders: Dict[str, Any] = {}
+        self._page_epochs: Dict[str, int] = {}
+        self._reload_all_epoch = 0
+        self._pending_events = 0
+        self._building = False
+        self._cancel_requested = False
+        # Monotonic time of the first file event not yet shown in the browser
+        self._first_event_time: Optional[float] = None
+        self.metrics = ServeMetrics(gauges=self._metric_gauges)
+
+    def watch(self, path: str, func=None, recursive: bool = True) -> None:
+        """Watch a path like LiveReloadServer and remember the paths that changed"""
+        super().watch(path, func, recursive)
+        path = os.path.abspath(path)
+        if path in self._recorders:
+            return
+
+        def record(event):
+            if event.is_directory:
+                return
+            with self._rebuild_cond:
+                self._changed_paths.update(
+                    changed for changed in (event.src_path, getattr(event, 'dest_path', None)) if changed
+                )
+                self._pending_events += 1
+                if self._first_event_time is None:
+                    self._first_event_time = time.monotonic()
+                if self._building:
+                    self._cancel_requested = True
+                self._to_rebuild[self.builder] = True
+                self._rebuild_cond.notify_all()
+
+        handler = watchdog.events.FileSystemEventHandler()
+        handler.on_any_event = record
+        self._recorders[path] = self.observer.schedule(handler, path, recursive=recursive)
+
+    def unwatch(self, path: str) -> None:
+        super().unwatch(path)
+        path = os.path.abspath(path)
+        if path not in self._watched_paths and path in self._recorders:
+            self.observer.unschedule(self._recorders.pop(path))
+
+    def take_changed_paths(self) -> Set[str]:
+        """Paths changed since the previous call"""
+        with self._rebuild_cond:
+            changed = set(self._changed_paths)
+            self._changed_paths.clear()
+        return changed
+
+    def request_rebuild(self) -> None:
+        """Queue a rebuild that is not caused by file changes"""
+        with self._rebuild_cond:
+            self._to_rebuild[self.builder] = True
+            self._rebuild_cond.notify_all()
+
+    def _metric_gauges(self) -> Dict[str, float]:
+        gauges = {
+            'pending_change_events': self._pending_events,
+            'pending_changed_paths': len(self._changed_paths),
+            'rebuild_in_progress': int(self._building),
+        }
+        if self.site is not None:
+            gauges.update({
+                'memory_site_pages': len(self.site.renderers),
+                'memory_site_cached_pages': len(self.site.pages),
+                'memory_site_cached_bytes': self.site.page_bytes,
+                'memory_site_evictions': self.site.evictions,
+            })
+        return gauges
+
+    def cancel_requested(self) -> bool:
+        """True when files changed after the running rebuild started"""
+        return self._cancel_requested
+
+    def _build_loop(self) -> None:
+        """LiveReloadServer._build_loop with a quiet period, cancellation and event counts"""
+        logger = get_logger(__name__)
+        while True:
+            with self._rebuild_cond:
+                while not self._rebuild_cond.wait_for(lambda: self._to_rebuild or self._shutdown,
+                                                      timeout=self.shutdown_delay):
+                    # Periodic wake-ups keep KeyboardInterrupt deliverable
+                    pass
+                if self._shutdown:
+                    break
+                # Quiet period: every event until the changes stop goes into this rebuild
+                while self._rebuild_cond.wait(timeout=self.build_delay) and not self._shutdown:
+                    pass
+                if self._shutdown:
+                    break
+
+                self._wanted_epoch = _timestamp()
+                funcs = list(self._to_rebuild)
+                self._to_rebuild.clear()
+                events, self._pending_events = self._pending_events, 0
+                first_event, self._first_event_time = self._first_event_time, None
+                self._building = True
+                self._cancel_requested = False
+
+            started = time.perf_counter()
+            if events:
+                logger.info(f"Detected file changes: rebuilding for {events} event{'s' if events != 1 else ''}")
+            try:
+                for func in funcs:
+                    func()
+            except Exception as e:
+                if isinstance(e, SystemExit):
+                    print(e, file=sys.stderr)
+                else:
+                    traceback.print_exc()
+                logger.error("An error happened during the rebuild. "
+                             "The server will appear stuck until build errors are resolved.")
+                self.metrics.record_rebuild('failed', time.perf_counter() - started, reason=str(e))
+                continue
+            finally:
+                with self._rebuild_cond:
+                    self._building = False
+                    cancelled = self._cancel_requested
+                    if cancelled and first_event is not None:
+                        # Edit-to-reload time counts from the oldest change
+                        self._first_event_time = first_event
+
+            if cancelled:
+                # The queued rebuild picks up both the old and the new changes
+                continue
+            with self._epoch_cond:
+                logger.info("Reloading browsers")
+                self._visible_epoch = self._wanted_epoch
+                self._epoch_cond.notify_all()
+            if first_event is not None:
+                self.metrics.record_reload(time.monotonic() - first_event)
+
+    def publish(self, pages: Optional[Iterable[str]]) -> None:
+        """Mark pages (site relative paths) as changed by the running build, None for all"""
+        with self._epoch_cond:
+            if pages is None:
+                self._reload_all_epoch = self._wanted_epoch
+            else:
+                for page in pages:
+                    self._page_epochs[page] = self._wanted_epoch
+
+    def _referer_page(self, referer: Optional[str]) -> Optional[str]:
+        """Site relative output path of the page a poll request came from"""
+        if not referer:
+            return None
+        path = unquote(urlsplit(referer).path)
+        if not (path + '/').startswith(self.mount_path):
+            return None
+        rel_path = path[len(self.mount_path):]
+        if not rel_path or rel_path.endswith('/'):
+            rel_path += 'index.html'
+        return posixpath.normpath('/' + rel_path).lstrip('/')
+
+    def _page_epoch(self, page: Optional[str]) -> int:
+        if page is None:
+            return self._visible_epoch
+        return max(self._reload_all_epoch, self._page_epochs.get(page, 0))
+
+    def serve_request(self, environ, start_response):
+        """LiveReloadServer.serve_request, timed per path class"""
+        started = time.perf_counter()
+        status = []
+
+        def record_status(status_line, headers, *args):
+            status.append(int(status_line.split(' ', 1)[0]))
+            return start_response(status_line, headers, *args)
+
+        try:
+            return super().serve_request(environ, record_status)
+        finally:
+            path = environ['PATH_INFO'].encode('latin-1').decode('utf-8', 'ignore')
+            self.metrics.record_request(path, status[-1] if status else 500, time.perf_counter() - started)
+
+    def _serve_request(self, environ, start_response):
+        path = environ['PATH_INFO'].encode('latin-1').decode('utf-8', 'ignore')
+        if path in (METRICS_PATH, STATUS_PATH):
+            return self._serve_metrics(path, start_response)
+        if self.locale_root and path in (self.mount_path, self.mount_path + 'index.html'):
+            start_response('302 Found', [('Location', quote(self.mount_path + self.locale_root))])
+            return []
+        match = LIVERELOAD_PATTERN.fullmatch(path)
+        if not match:
+            if self.site is not None:
+                return self._serve_site_request(path, environ, start_response)
+            return super()._serve_request(environ, start_response)
+
+        epoch = int(match[1])
+        page = self._referer_page(environ.get('HTTP_REFERER'))
+        start_response('200 OK', [('Content-Type', 'text/plain')])
+        with self._epoch_cond:
+            if not self._page_epoch(page) > epoch:
+                self._log_poll_request(environ.get('HTTP_REFERER'), request_id=path)
+                self._epoch_cond.wait_for(lambda: self._page_epoch(page) > epoch, timeout=self.poll_response_timeout)
+            return [b"%d" % self._page_epoch(page)]
+
+    def _serve_metrics(self, path: str, start_response):
+        if path == METRICS_PATH:
+            content = self.metrics.prometheus().encode('utf-8')
+            content_type = 'text/plain; version=0.0.4; charset=utf-8'
+        else:
+            content = json.dumps(self.metrics.status(), indent=2).encode('utf-8')
+            content_type = 'application/json'
+        start_response('200 OK', [('Content-Type', content_type), ('Content-Length', str(len(content))),
+                                  ('Cache-Control', 'no-store')])
+        return [content]
+
+    def _serve_site_request(self, path: str, environ, start_response):
+        """LiveReloadServer._serve_request for files of the in-memory site"""
+        if not (path + '/').startswith(self.mount_path):
+            if path == '/':
+                start_response('302 Found', [('Location', quote(self.mount_path))])
+                return []
+            return None
+        rel_path = path[len(self.mount_path):]
+        if not rel_path or path.endswith('/'):
+            rel_path += 'index.html'
+        rel_path = posixpath.normpath('/' + rel_path).lstrip('/')
+
+        # Wait until the ongoing rebuild (if any) finishes, so we're not serving a half-built site
+        with self._epoch_cond:
+            self._epoch_cond.wait_for(lambda: self._visible_epoch == self._wanted_epoch)
+            epoch = self._visible_epoch
+
+        content = self.site.read(rel_path)
+        if content is None:
+            if not path.endswith('/') and self.site.read(f'{rel_path}/index.html') is not None:
+                start_response('302 Found', [('Location', quote(path) + '/')])
+                return []
+            return None
+        if self._watched_paths and rel_path.endswith('.html'):
+            content = self._inject_js_into_html(content, epoch)
+        start_response('200 OK', [('Content-Type', self._guess_type(rel_path)),
+                                  ('Content-Length', str(len(content)))])
+        return [content]
+
+
+def restrict_locale(config: Any, lang: str, published_url: Optional[str] = None) -> str:
+    """Make the i18n plugin of a loaded mkdocs config build only one locale
+
+    Like a parallel build worker, the plugin is told which locale to build
+    and flagged as already building, so its on_post_build does not chain
+    the other locales. Every locale stays configured: navigation and the
+    language switcher are computed exactly as in a full build, only the
+    switcher links to locales that are not served point to the published
+    site (site_url of mkdocs.yml) instead of a page missing locally.
+
+    Returns:
+        Path of the locale below the site root (e.g. 'tr/'), empty for the
+        default locale
+
+    Raises:
+        ValueError: When lang is not one of the built locales
+    """
+    i18n = get_i18n_plugin(config)
+    locales = get_build_locales(config)
+    if i18n is None or lang not in locales:
+        available = ', '.join(locales) or 'none, the i18n plugin is not configured'
+        raise ValueError(f"Unknown locale '{lang}' (available: {available})")
+
+    i18n.current_language = lang
+    i18n.building = True
+    locale_root = ''
+    if lang != locales[0]:
+        locale_root = (i18n.get_language_config(lang).link.strip('/') or lang) + '/'
+    if not published_url:
+        return locale_root
+
+    reconfigure_page_context = i18n.reconfigure_page_context
+
+    def published_alternates(context, page, config, nav):
+        context = reconfigure_page_context(context, page, config, nav)
+        # The plugin sets per-page links as an attribute of config.extra, which
+        # templates read before the item set by the theme reconfiguration
+        for alternates in (getattr(config.extra, 'alternate', None), config.extra.get('alternate')):
+            for alternate in alternates or []:
+                if alternate.get('lang') != lang and not alternate.get('link', '').startswith('http'):
+                    alternate['link'] = urljoin(published_url, alternate['link'].lstrip('/'))
+        return context
+
+    i18n.reconfigure_page_context = published_alternates
+    return locale_root
+
+
+class ServedProject:
+    """One mkdocs project of a serve process (see setup_project)
+
+    Holds its DirtyReloadServer (requests, watchers and rebuilds of the
+    project), the loaded config and the temporary site_dir.
+    """
+
+    def __init__(self, name: str, server: DirtyReloadServer, config: Any, builder: Callable[..., None],
+                 site_dir: str):
+        self.name = name
+        self.server = server
+        self.config = config
+        self.builder = builder
+        self.site_dir = site_dir
+
+    def start(self, livereload: bool = True) -> None:
+        """Run the initial build and watch the project's files"""
+        config = self.config
+        self.builder(config)
+        if not livereload:
+            return
+        self.server.watch(config.docs_dir)
+        if config.config_file_path:
+            self.server.watch(config.config_file_path)
+        if config.theme.custom_dir:
+            self.server.watch(config.theme.custom_dir)
+        self.server = config.plugins.on_serve(self.server, config=config, builder=self.builder)
+        for item in config.watch:
+            self.server.watch(item)
+
+    def close(self) -> None:
+        self.config.plugins.on_shutdown()
+        if os.path.isdir(self.site_dir):
+            shutil.rmtree(self.site_dir)
+
+
+def setup_project(config_file: str = 'mkdocs.yml', dev_addr: Optional[str] = None, lang: Optional[str] = None,
+                  quiet_period: float = 0.1, page_cache_size: Optional[int] = None, lazy: bool = False,
+                  name: str = '', build_lock: Optional[threading.RLock] = None) -> ServedProject:
+    """Load a project and create its server and builder (see serve_site)
+
+    With name set, the project is mounted below /<name>/. build_lock
+    serializes builds and on-demand renders of projects sharing a process,
+    since mkdocs builds are patched through module globals.
+
+    Raises:
+        Abort: When the config cannot be loaded
+    """
+    from mkdocs.commands.build import build
+    from mkdocs.config import load_config as mkdocs_load_config
+    from mkdocs.exceptions import Abort
+
+    logger = get_logger(__name__)
+    site_dir = tempfile.mkdtemp(prefix='mkdocs_')
+    build_lock = build_lock or threading.RLock()
+    locale_root = ''
+
+    def mount_path(config) -> str:
+        return urlsplit(config.site_url or '/').path
+
+    def get_config():
+        nonlocal locale_root
+        config = mkdocs_load_config(config_file=config_file, site_dir=site_dir, dev_addr=dev_addr)
+        published_url = config.site_url
+        path = mount_path(config)
+        if name:
+            path = posixpath.join('/', name, path.lstrip('/'))
+        config.site_url = f'http://{config.dev_addr}{path}'
+        if lang:
+            locale_root = restrict_locale(config, lang, published_url)
+        return config
+
+    try:
+        config = get_config()
+    except (ValueError, OSError) as e:
+        shutil.rmtree(site_dir)
+        raise Abort(f"{config_file}: {e}" if name else str(e))
+    if lang:
+        logger.info(f"Serving only the '{lang}' locale")
+    config.plugins.on_startup(command='serve', dirty=False)
+    graph = PageDependencyGraph(site_dir, config.docs_dir, config.theme.dirs, [config.config_file_path])
+    if lazy and not page_cache_size:
+        page_cache_size = DEFAULT_MAX_PAGE_BYTES
+    site = MemorySite(site_dir, page_cache_size, lock=build_lock) if page_cache_size else None
+    if site is not None:
+        # Pages converted on demand are not converted again by the next rebuild
+        site.on_populate = lambda key, page: graph.store_render(page)
+    warmed_up = threading.Event()
+
+    def warm_up(generation: int) -> None:
+        try:
+            if not site.warm_up(generation):
+                return
+        except Exception as e:
+            logger.warning(f"Warm-up stopped, remaining pages render when requested: {e}")
+            return
+        logger.info("Warm-up finished: every page is rendered")
+        warmed_up.set()
+        server.request_rebuild()
+
+    # Changes and dirty pages of a cancelled rebuild, carried into the next one
+    pending_paths: Set[str] = set()
+    pending_pages: Set[str] = set()
+
+    def builder(config=None):
+        with build_lock:
+            _build(config)
+
+    def _build(config=None):
+        if config is None:
+            pending_paths.update(server.take_changed_paths())
+            if lazy and not graph.valid and not pending_paths and warmed_up.is_set():
+                # Every page is converted: reuse them all to record the graph and the search index
+                plan = RebuildPlan(reason='warm-up finished')
+            else:
+                plan = graph.plan(pending_paths)
+            plan.pages |= pending_pages
+        else:
+            plan = RebuildPlan.full_rebuild('initial build')
+        deferred = lazy and plan.full
+        started = time.perf_counter()
+        logger.info(f"Building {name}..." if name else "Building documentation...")
+        if config is None:
+            config = get_config()
+        try:
+            with ExitStack() as stack:
+                dirty_build = stack.enter_context(DirtyPageBuild(
+                    graph, plan, cancelled=server.cancel_requested,
+                    output_exists=site.exists if site is not None else os.path.isfile))
+                if site is not None:
+                    if plan.full:
+                        site.clear()
+                    # Entered last so it sees every page, including the ones the dirty build reuses
+                    stack.enter_context(site.capture(lazy=deferred))
+                build(config, live_server=server, dirty=False)
+        except RebuildCancelled as e:
+            pending_pages.update(dirty_build.dirty_pages)
+            logger.info(f"Rebuild cancelled by newer changes ({e})")
+            server.metrics.record_rebuild('cancelled', time.perf_counter() - started,
+                                          len(dirty_build.rendered), reason=plan.reason)
+            return
+        pending_paths.clear()
+        pending_pages.clear()
+        if deferred:
+            # The lazy capture hid every page from the dirty build, nothing was recorded
+            graph.valid = False
+            warmed_up.clear()
+            threading.Thread(target=warm_up, args=(site.generation,), name='phantom-warm-up', daemon=True).start()
+        else:
+            dirty_build.report()
+        if site is not None:
+            site.report()
+        kind = 'lazy' if deferred else 'full' if plan.full else 'dirty'
+        server.metrics.record_rebuild(kind, time.perf_counter() - started, len(dirty_build.rendered),
+                                      reason=plan.reason)
+        server.publish(None if plan.reload_all else dirty_build.rendered)
+
+    host, port = config.dev_addr
+    server = DirtyReloadServer(builder=builder, host=host, port=port, root=site_dir, mount_path=mount_path(config),
+                               quiet_period=quiet_period, site=site)
+
+    def error_handler(code) -> Optional[bytes]:
+        if code in (404, 500) and site is not None:
+            return site.read(f'{code}.html')
+        if code in (404, 500):
+            error_page = os.path.join(site_dir, f'{code}.html')
+            if os.path.isfile(error_page):
+                with open(error_page, 'rb') as f:
+                    return f.read()
+        return None
+
+    server.error_handler = error_handler
+    server.locale_root = locale_root
+    return ServedProject(name, server, config, builder, site_dir)
+
+
+def enter_build_caches(stack: ExitStack, template_cache: Optional[str] = None,
+                       markdown_cache: Optional[str] = None,
+                       highlight: Optional[Dict[str, Any]] = None) -> SharedBytecodeCache:
+    """Share compiled templates, converted pages and highlighted code between the builds of a serve session"""
+    cache = stack.enter_context(share_compiled_templates(SharedBytecodeCache(template_cache)))
+    if markdown_cache:
+        stack.enter_context(CachedMarkdownRender(MarkdownRenderCache(markdown_cache)))
+    if highlight:
+        highlight_cache = HighlightCache(highlight['cache_dir'], highlight['max_bytes'])
+        stack.enter_context(CachedHighlighting(highlight_cache))
+        # Keep the disk entries within max_bytes once the session ends
+        stack.callback(highlight_cache.prune)
+    return cache
+
+
+def serve_site(config_file: str = 'mkdocs.yml', dev_addr: Optional[str] = None, livereload: bool = True,
+               lang: Optional[str] = None, quiet_period: float = 0.1,
+               page_cache_size: Optional[int] = None, lazy: bool = False,
+               template_cache: Optional[str] = None, markdown_cache: Optional[str] = None,
+               highlight: Optional[Dict[str, Any]] = None) -> None:
+    """Serve the documentation with dirty-page rebuilds
+
+    Same flow as mkdocs.commands.serve.serve(), except that every rebuild
+    consults the page dependency graph of the previous build: editing one
+    page re-renders that page (in every locale that uses it), a template
+    change re-renders all pages without converting markdown again and
+    mkdocs.yml or added/removed pages trigger a full rebuild. The project's
+    theme overrides (custom_dir) are watched as well. With lang set, only
+    that locale is built (see restrict_locale). quiet_period is the time in
+    seconds without file events before a rebuild starts. With page_cache_size
+    (bytes) the output stays in memory (see MemorySite) instead of site_dir.
+
+    lazy (implies the in-memory output) makes full builds compute only the
+    navigation and the file list: each page is converted and rendered when
+    it is first requested, while a background thread warms up the rest. Once
+    the warm-up finished, a rebuild that renders nothing records the
+    dependency graph and the search index; until then every change is a
+    full (lazy) rebuild.
+
+    Compiled theme templates are kept between rebuilds (SharedBytecodeCache)
+    and, with template_cache (cache_dir) set, between serve sessions as well.
+    With markdown_cache (cache_dir) set, full rebuilds and new sessions reuse
+    the Markdown conversion of unchanged pages (MarkdownRenderCache). With
+    highlight ({'cache_dir', 'max_bytes'}) set, code blocks reuse their
+    Pygments output (HighlightCache).
+    """
+    import jinja2.exceptions
+    from mkdocs.exceptions import Abort
+
+    logger = get_logger(__name__)
+    project = setup_project(config_file, dev_addr, lang, quiet_period, page_cache_size, lazy)
+
+    try:
+        with ExitStack() as caches:
+            cache = enter_build_caches(caches, template_cache, markdown_cache, highlight)
+            project.start(livereload)
+            cache.report()
+            try:
+                project.server.serve()
+            except KeyboardInterrupt:
+                logger.info("Shutting down...")
+            finally:
+                project.server.shutdown()
+    except jinja2.exceptions.TemplateError:
+        raise
+    except OSError as e:
+        raise Abort(f'{type(e).__name__}: {e}')
+    finally:
+        project.close()
+
+
+def parse_projects(specs: Iterable[str]) -> Dict[str, str]:
+    """Map project names to mkdocs.yml paths from [name=]path entries
+
+    The name defaults to the directory containing the config file.
+
+    Raises:
+        ValueError: When a config file does not exist or two projects share a name
+    """
+    projects: Dict[str, str] = {}
+    for spec in specs:
+        spec = spec.strip()
+        if not spec:
+            continue
+        name, _, path = spec.rpartition('=')
+        path = os.path.abspath(path)
+        if os.path.isdir(path):
+            path = os.path.join(path, 'mkdocs.yml')
+        if not os.path.isfile(path):
+            raise ValueError(f"No mkdocs config at {path}")
+        name = name or os.path.basename(os.path.dirname(path))
+        if not re.fullmatch(r'[A-Za-z0-9._-]+', name) or name.startswith('__'):
+            raise ValueError(f"Invalid project name '{name}' (use letters, digits, '.', '_' and '-')")
+        if name in projects:
+            raise ValueError(f"Two projects are named '{name}', name them explicitly (name=path)")
+        projects[name] = path
+    if not projects:
+        raise ValueError("No projects given")
+    return projects
+
+
+class ProjectHostServer(socketserver.ThreadingMixIn, wsgiref.simple_server.WSGIServer):
+    """HTTP server that routes every project of a serve process by its path prefix
+
+    Project servers are never bound, this server calls their WSGI app:
+    /<name>/... goes to the project mounted there, livereload polls (always
+    /livereload/...) go to the project of the page they come from (Referer),
+    / lists the projects and /__phantom/status reports all of them.
+    /<name>/__phantom/metrics and /<name>/__phantom/status are the
+    project's own endpoints.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, projects: List[ServedProject], host: str, port: int):
+        self.projects = projects
+        self.server_name = host
+        self.server_port = port
+        super().__init__((host, port), _Handler)
+        self.set_app(self.serve_request)
+
+    def _project(self, path: str) -> Optional[ServedProject]:
+        for project in self.projects:
+            if (path + '/').startswith(project.server.mount_path):
+                return project
+        return None
+
+    def serve_request(self, environ, start_response):
+        path = environ['PATH_INFO'].encode('latin-1').decode('utf-8', 'ignore')
+        if path == '/':
+            return self._serve_index(start_response)
+        if path == STATUS_PATH:
+            content = json.dumps({project.name: project.server.metrics.status() for project in self.projects},
+                                 indent=2).encode('utf-8')
+            start_response('200 OK', [('Content-Type', 'application/json'), ('Content-Length', str(len(content))),
+                                      ('Cache-Control', 'no-store')])
+            return [content]
+
+        if LIVERELOAD_PATTERN.fullmatch(path):
+            referer = environ.get('HTTP_REFERER')
+            project = self._project(unquote(urlsplit(referer).path)) if referer else None
+        else:
+            project = self._project(path)
+        if project is None:
+            start_response('404 Not Found', [('Content-Type', 'text/plain')])
+            return [b'404 Not Found']
+
+        mount_path = project.server.mount_path
+        if path == mount_path.rstrip('/'):
+            start_response('302 Found', [('Location', quote(mount_path))])
+            return []
+        internal_path = '/' + path[len(mount_path):]
+        if internal_path in (METRICS_PATH, STATUS_PATH):
+            environ = dict(environ, PATH_INFO=internal_path)
+        return project.server.serve_request(environ, start_response)
+
+    def _serve_index(self, start_response):
+        items = ''.join(f'<li><a href="{quote(project.server.mount_path)}">{html.escape(project.name)}</a> '
+                        f'<small>{html.escape(project.config.site_name)}</small></li>'
+                        for project in self.projects)
+        content = f'<!doctype html><title>Projects</title><h1>Projects</h1><ul>{items}</ul>'.encode('utf-8')
+        start_response('200 OK', [('Content-Type', 'text/html; charset=utf-8'),
+                                  ('Content-Length', str(len(content)))])
+        return [content]
+
+
+def serve_projects(config_files: Dict[str, str], dev_addr: Optional[str] = None, livereload: bool = True,
+                   lang: Optional[str] = None, quiet_period: float = 0.1,
+                   page_cache_size: Optional[int] = None, lazy: bool = False,
+                   template_cache: Optional[str] = None, markdown_cache: Optional[str] = None,
+                   highlight: Optional[Dict[str, Any]] = None) -> None:
+    """Serve several projects from one process, each below /<name>/
+
+    Every project gets what serve_site gives a single one: its own config,
+    watchers, dependency graph, rebuild queue and (in-memory) output, so a
+    change in one project only rebuilds that one. Imported modules and the
+    build caches of enter_build_caches (compiled templates, converted pages,
+    highlighted code) are shared. Builds run one at a time.
+
+    Args:
+        config_files: Project name -> mkdocs.yml (see parse_projects)
+        template_cache: cache_dir keeping the compiled templates between sessions
+        markdown_cache: cache_dir keeping the converted pages between sessions
+        highlight: cache_dir and max_bytes of the highlighted code blocks
+    """
+    import jinja2.exceptions
+    from mkdocs.exceptions import Abort
+
+    logger = get_logger(__name__)
+    build_lock = threading.RLock()
+    projects: List[ServedProject] = []
+    host_server = None
+    try:
+        for name, config_file in config_files.items():
+            projects.append(setup_project(config_file, dev_addr, lang, quiet_period, page_cache_size, lazy,
+                                          name=name, build_lock=build_lock))
+
+        with ExitStack() as caches:
+            cache = enter_build_caches(caches, template_cache, markdown_cache, highlight)
+            started = time.perf_counter()
+            for project in projects:
+                project.start(livereload)
+            logger.info(f"Built {len(projects)} projects in {time.perf_counter() - started:.2f} seconds")
+            cache.report()
+
+            host, port = projects[0].config.dev_addr
+            host_server = ProjectHostServer(projects, host, port)
+            for project in projects:
+                server = project.server
+                if server._watched_paths:
+                    server.observer.start()
+                threading.Thread(target=server._build_loop, name=f'phantom-build-{project.name}',
+                                 daemon=True).start()
+                logger.info(f"Serving {project.name} on http://{host}:{port}{server.mount_path}")
+            try:
+                host_server.serve_forever(poll_interval=0.25)
+            except KeyboardInterrupt:
+                logger.info("Shutting down...")
+            finally:
+                for project in projects:
+                    project.server.shutdown()
+                host_server.server_close()
+    except jinja2.exceptions.TemplateError:
+        raise
+    except OSError as e:
+        raise Abort(f'{type(e).__name__}: {e}')
+    finally:
+        for project in projects:
+            project.close()
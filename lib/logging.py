@@ -106,10 +106,18 @@ class PhantomLogger:
         self.logger = logging.getLogger(name)
         self._setup_logger()
     
+    @classmethod
+    def new_session(cls) -> None:
+        """Start a new session log file on the next setup (e.g. per daemon build)"""
+        cls._session_initialized = False
+        cls._session_log_file = None
+        cls._session_timestamp = None
+    
     @classmethod
     def load_config(cls, config: Dict[str, Any]) -> None:
         """Load logging configuration"""
-        cls._config = config.get('logging', {
+        # Copy, the validated configuration is read-only
+        cls._config = dict(config.get('logging', {
             'enabled': True,
             'console_level': 'INFO',
             'file_level': 'DEBUG',
@@ -117,7 +125,7 @@ class PhantomLogger:
             'max_file_size': '10MB',
             'backup_count': 5,
             'timestamp_format': '%Y-%m-%d %H:%M:%S'
-        })
+        }))
         
         # Disable file logging in Docker container mode
         if os.environ.get('DOCKER_MODE') == '1':
@@ -323,6 +331,11 @@ def init_logging(config: Dict[str, Any]) -> None:
         logger._setup_logger()
 
 
+def new_log_session() -> None:
+    """Write the following output to a new session log file"""
+    PhantomLogger.new_session()
+
+
 # Convenience function for backward compatibility
 def log_info(msg: str, extra: Optional[Dict[str, Any]] = None) -> None:
     """Log info message using default logger"""
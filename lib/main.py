@@ -16,24 +16,36 @@ import subprocess
 import shutil
 import json
 import platform
+import hashlib
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable, Iterator, Set
 import logging
 from textwrap import dedent
 
+from .config import Config, ConfigError, read_config
+
 # 1. Configuration Management
-def load_config(config_file: str = 'config.json') -> Dict:
-    """Load and validate configuration"""
-    config_path = Path(config_file)
-    if not config_path.exists():
+def load_config(config_file: str = 'config.json', reload: bool = False) -> Config:
+    """Load and validate configuration
+    
+    The validated, read-only config is cached and only re-read when config.json
+    changes on disk. PHANTOM_<SECTION>__<KEY> environment variables override keys.
+    """
+    try:
+        return read_config(config_file, reload=reload)
+    except FileNotFoundError:
         # Can't use logger here as it depends on config being loaded
         # So we keep print for bootstrap errors
         print(f"Configuration file '{config_file}' not found!")
         print("Please ensure config.json exists in the project root.")
         sys.exit(1)
-    
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    except ConfigError as config_err:
+        print(f"Invalid configuration in '{config_file}':")
+        for line in str(config_err).splitlines():
+            print(f"  - {line}")
+        sys.exit(1)
 
 # 2. Colors Class
 class Colors:
@@ -210,74 +222,210 @@ def check_mutagen() -> bool:
     return shutil.which('mutagen') is not None
 
 # 5. Vendor Management
+# Bump when the vendor.lock layout changes
+VENDOR_LOCK_VERSION = 1
+
+# Built-in entry of build.js (Font Awesome CSS and webfonts)
+FONT_AWESOME_ENTRY = 'fontawesome'
+FONT_AWESOME_PACKAGE = '@fortawesome/fontawesome-free'
+
 class VendorManager:
-    """Handles vendor dependency checking and building"""
+    """Handles vendor dependency checking and building
+    
+    vendor.lock (next to dependencies.json) records the inputs of every
+    dependency (package, version range, source path, minify flag) and the
+    sha256 of each file it produced. Checking the vendor directory only hashes
+    those files, and a build re-runs build.js just for the stale entries.
+    """
     def __init__(self, config: Dict):
         self.config = config
         self.vendor_dir = Path(config['paths']['vendor_dir'])
         self.vendor_builder_dir = Path(config['paths']['vendor_builder_dir'])
         self.dependencies_file = self.vendor_builder_dir / "dependencies.json"
+        self.lock_file = self.vendor_builder_dir / "vendor.lock"
         
     def check_dependencies(self) -> bool:
-        """Check if vendor files exist"""
-        if not self.vendor_dir.exists():
-            return False
-            
-        if not self.dependencies_file.exists():
-            return False
-            
+        """Check if vendor files exist and match vendor.lock"""
+        return not self.stale_entries()
+
+    def _load_json(self, path: Path) -> Dict:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def get_entries(self) -> Dict[str, Dict[str, Any]]:
+        """Inputs of every vendor entry, keyed by target name ('to', or 'fontawesome')
+        
+        Raises:
+            OSError, ValueError: When dependencies.json is missing or invalid
+        """
+        deps = self._load_json(self.dependencies_file)
+        package_file = self.vendor_builder_dir / "package.json"
+        package = self._load_json(package_file) if package_file.exists() else {}
+        specs = {**package.get('devDependencies', {}), **package.get('dependencies', {})}
+        builder_file = self.vendor_builder_dir / "build.js"
+        # Minify options and path fixes live in build.js, so it is an input of every entry
+        builder = hash_file(builder_file) if builder_file.exists() else None
+
+        entries = {}
+        for dep in deps.get('dependencies', []):
+            entries[dep['to']] = {
+                'package': dep.get('package'),
+                'spec': specs.get(dep.get('package')),
+                'from': dep['from'],
+                'type': dep['type'],
+                'minify': dep.get('minify', False),
+                'builder': builder
+            }
+        entries[FONT_AWESOME_ENTRY] = {
+            'package': FONT_AWESOME_PACKAGE,
+            'spec': specs.get(FONT_AWESOME_PACKAGE),
+            'from': f"node_modules/{FONT_AWESOME_PACKAGE}",
+            'type': 'css',
+            'minify': False,
+            'builder': builder
+        }
+        return entries
+
+    def get_entry_files(self, key: str, dep: Optional[Dict] = None) -> List[str]:
+        """Files an entry writes, relative to the vendor directory"""
+        if key != FONT_AWESOME_ENTRY:
+            return [VendorManager.get_expected_filename({**(dep or {}), 'to': key})]
+        files = ['fontawesome-all.min.css']
+        webfonts_dir = self.vendor_dir / 'webfonts'
+        if webfonts_dir.is_dir():
+            files.extend(sorted(f"webfonts/{path.name}" for path in webfonts_dir.iterdir() if path.is_file()))
+        return files
+
+    def load_lock(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Locked entries, None when vendor.lock is missing or outdated"""
+        if not self.lock_file.exists():
+            return None
         try:
-            with open(self.dependencies_file, 'r', encoding='utf-8') as deps_file:
-                deps = json.load(deps_file)
-                
-            for dep in deps.get('dependencies', []):
-                expected_filename = VendorManager.get_expected_filename(dep)
-                file_path = self.vendor_dir / expected_filename
-                if not file_path.exists():
-                    return False
-                    
-            # Check for webfonts directory
-            if not (self.vendor_dir / 'webfonts').exists():
-                return False
-                
-            return True
-            
+            lock = self._load_json(self.lock_file)
         except (json.JSONDecodeError, IOError, OSError):
-            return False
+            return None
+        if lock.get('version') != VENDOR_LOCK_VERSION:
+            return None
+        return lock.get('entries', {})
+
+    def stale_entries(self) -> Dict[str, str]:
+        """Vendor entries that need a rebuild, mapped to the reason
+        
+        Without a vendor.lock the existing files are trusted as long as they
+        are all present and a lock is created for them.
+        """
+        from .logging import get_logger
+        logger = get_logger(__name__)
+
+        if not self.dependencies_file.exists():
+            return {'dependencies.json': f"{self.dependencies_file} not found"}
+        try:
+            entries = self.get_entries()
+        except (json.JSONDecodeError, KeyError, IOError, OSError) as e:
+            return {'dependencies.json': f"cannot be read: {e}"}
+
+        lock = self.load_lock()
+        stale = {}
+        for key, inputs in entries.items():
+            locked = (lock or {}).get(key)
+            if lock is not None and locked is None:
+                stale[key] = "not in vendor.lock"
+                continue
+            if locked is not None:
+                changed = [name for name, value in inputs.items() if locked.get(name) != value]
+                if changed:
+                    stale[key] = f"{', '.join(changed)} changed"
+                    continue
+                files = locked.get('files', {})
+            else:
+                files = dict.fromkeys(self.get_entry_files(key, inputs))
+            for name, digest in files.items():
+                file_path = self.vendor_dir / name
+                if not file_path.is_file():
+                    stale[key] = f"{name} is missing"
+                    break
+                if digest is not None and hash_file(file_path) != digest:
+                    stale[key] = f"{name} does not match vendor.lock"
+                    break
+            else:
+                if key == FONT_AWESOME_ENTRY and len(files) < 2:
+                    stale[key] = "webfonts directory is missing"
+
+        if lock is None and not stale:
+            logger.info(f"Creating {self.lock_file} from the existing vendor files")
+            self.update_lock(list(entries))
+        return stale
+
+    def update_lock(self, keys: Optional[List[str]] = None) -> None:
+        """Record the current inputs and file hashes of the given entries (all by default)"""
+        entries = self.get_entries()
+        locked = self.load_lock() or {}
+        for key in keys if keys is not None else list(entries):
+            inputs = entries[key]
+            package_file = self.vendor_builder_dir / 'node_modules' / str(inputs['package']) / 'package.json'
+            version = self._load_json(package_file).get('version') if package_file.exists() else None
+            files = {
+                name: hash_file(self.vendor_dir / name)
+                for name in self.get_entry_files(key, inputs)
+                if (self.vendor_dir / name).is_file()
+            }
+            # Keep the installed version of the previous lock when node_modules is absent
+            if version is None and locked.get(key, {}).get('spec') == inputs['spec']:
+                version = locked[key].get('version')
+            locked[key] = {**inputs, 'version': version, 'files': files}
+
+        lock = {
+            'version': VENDOR_LOCK_VERSION,
+            'entries': {key: locked[key] for key in sorted(locked) if key in entries}
+        }
+        tmp_file = self.lock_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(lock, f, indent=2, sort_keys=True)
+            f.write('\n')
+        os.replace(tmp_file, self.lock_file)
+        
+    def build_dependencies(self, entries: Optional[List[str]] = None) -> bool:
+        """Build vendor files
         
-    def build_dependencies(self) -> bool:
-        """Build vendor files"""
+        Args:
+            entries: Entries to rebuild (defaults to the stale ones)
+        """
+        from .logging import get_logger
+        logger = get_logger(__name__)
+
         if not self.vendor_builder_dir.exists():
-            from .logging import get_logger
-            logger = get_logger(__name__)
             logger.error("Vendor builder directory not found")
             return False
+
+        if entries is None:
+            entries = list(self.stale_entries())
+        if not entries:
+            return True
+        if 'dependencies.json' in entries:
+            logger.error(f"Cannot build vendor files without a valid {self.dependencies_file}")
+            return False
             
         if not check_node():
-            from .logging import get_logger
-            logger = get_logger(__name__)
             logger.error("Node.js is required for vendor build")
             return False
             
-        original_dir = os.getcwd()
         try:
-            os.chdir(self.vendor_builder_dir)
-            
             # Install dependencies if needed
-            if not Path("node_modules").exists():
-                result = run_command(['npm', 'install'])
-                if result and result.returncode != 0:
-                    os.chdir(original_dir)
+            if not (self.vendor_builder_dir / "node_modules").exists():
+                result = run_command(['npm', 'install'], cwd=str(self.vendor_builder_dir))
+                if not result or result.returncode != 0:
                     return False
                     
-            # Build vendor files
-            result = run_command(['npm', 'run', 'build'])
-            os.chdir(original_dir)
-            
-            return result and result.returncode == 0
+            # Build only the stale entries
+            logger.info(f"Building vendor entries: {', '.join(entries)}")
+            result = run_command(['npm', 'run', 'build', '--', *entries], cwd=str(self.vendor_builder_dir))
+            if not result or result.returncode != 0:
+                return False
+
+            self.update_lock(entries)
+            return True
             
-        except (subprocess.SubprocessError, OSError, IOError):
-            os.chdir(original_dir)
+        except (subprocess.SubprocessError, OSError, IOError, json.JSONDecodeError):
             return False
 
     @staticmethod
@@ -327,6 +475,30 @@ def setup_mkdocs_logging():
         sub_logger.setLevel(logging.INFO)
         sub_logger.propagate = False  # Prevent duplicate logs
 
+@contextmanager
+def patch_function(module: Any, name: str, wrapper: Callable) -> Iterator[None]:
+    """Temporarily wrap a module level function
+    
+    The wrapper receives the original function as its first argument. This is the
+    same technique mkdocs-static-i18n uses for mkdocs.utils.clean_directory; module
+    globals are resolved at call time, so every nested build() call sees the patch.
+    
+    Args:
+        module: Module owning the function (e.g. mkdocs.commands.build)
+        name: Attribute name of the function
+        wrapper: Callable invoked as wrapper(original, *args, **kwargs)
+    """
+    original = getattr(module, name)
+    
+    def patched(*args, **kwargs):
+        return wrapper(original, *args, **kwargs)
+    
+    setattr(module, name, patched)
+    try:
+        yield
+    finally:
+        setattr(module, name, original)
+
 # 7. Banner Display
 def print_banner(mode: str = "build"):
     """Display banner with ASCII art"""
@@ -350,4 +522,92 @@ def print_banner(mode: str = "build"):
         print("Building Phantom Documentation Kit...")
     else:
         print("Starting Phantom Documentation Kit Server...")
-    print()
\ No newline at end of file
+    print()
+
+# 8. Content Hashing
+def hash_bytes(data: bytes) -> str:
+    """Return the sha256 hex digest of a byte string"""
+    return hashlib.sha256(data).hexdigest()
+
+def hash_file(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Return the sha256 hex digest of a file's content"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# 9. Content-Addressed Store
+class ContentStore:
+    """Cache entries on disk, stored as <directory>/<key[:2]>/<key>
+    
+    Used by the minify, template, highlight and Markdown caches. Writes go
+    through a temporary file and os.replace, so parallel locale workers
+    writing the same entry never leave a partial one behind.
+    """
+    
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+    
+    def path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+    
+    def read(self, key: str, touch: bool = False) -> Optional[bytes]:
+        """Bytes of an entry, None when missing; touch marks it as recently used"""
+        entry = self.path(key)
+        try:
+            data = entry.read_bytes()
+            if touch:
+                os.utime(entry)
+        except OSError:
+            return None
+        return data
+    
+    def write(self, key: str, data: bytes) -> bool:
+        """Store an entry atomically, returns False (and logs) when it cannot be written"""
+        entry = self.path(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = entry.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, entry)
+        except OSError as e:
+            from .logging import get_logger
+            get_logger(__name__).debug(f"Could not store cache entry {entry}: {e}")
+            return False
+        return True
+    
+    def prune(self, used: Set[str]) -> int:
+        """Remove the entries not in used, returns how many were removed"""
+        if not self.directory.is_dir():
+            return 0
+        removed = 0
+        for entry in self.directory.glob('*/*'):
+            if entry.name not in used:
+                entry.unlink(missing_ok=True)
+                removed += 1
+        return removed
+    
+    def evict(self, max_bytes: int) -> int:
+        """Remove the least recently used entries until the store fits max_bytes"""
+        if not self.directory.is_dir():
+            return 0
+        entries = []
+        for entry in self.directory.glob('*/*'):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
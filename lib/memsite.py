@@ -0,0 +1,248 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - In-Memory Site
+Keeps the serve output in memory: rendered pages in a size-bounded LRU cache, assets by reference
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+from .main import patch_function
+from .logging import get_logger
+
+# Page cache size when none is configured
+DEFAULT_MAX_PAGE_BYTES = 64 * 1024 * 1024
+
+
+class MemorySite:
+    """Virtual site directory for serve sessions
+
+    While capture() is active, mkdocs writes go here instead of site_dir:
+
+    - rendered pages (written by _build_page) enter an LRU cache bounded by
+      max_page_bytes; an evicted page is rendered again when requested
+    - other generated files (404.html, sitemap.xml, search index) are kept
+      as bytes
+    - copied static files and theme assets are kept as a reference to their
+      source, nothing is copied
+
+    Files written with open() by mkdocs itself (sitemap.xml.gz) still land in
+    site_dir, so directories are created there and lookups fall back to disk.
+
+    A lazy capture only reads the sources (navigation titles come from the
+    markdown) and defers converting and rendering every page to its first
+    request or to warm_up(). on_populate is called with each page converted
+    that way.
+    """
+
+    def __init__(self, site_dir: str, max_page_bytes: int, lock: Optional[threading.RLock] = None):
+        self.site_dir = os.path.abspath(site_dir)
+        self.max_page_bytes = max_page_bytes
+        # Held by builds and on-demand renders, both drive mkdocs on the same config
+        # (and through module globals, which is why projects of one process share it)
+        self.lock = lock or threading.RLock()
+        self.pages: 'OrderedDict[str, bytes]' = OrderedDict()
+        self.page_bytes = 0
+        self.files: Dict[str, Union[bytes, Path]] = {}
+        self.renderers: Dict[str, Tuple[Any, ...]] = {}
+        self.evictions = 0
+        self.renders_on_demand = 0
+        self.on_populate: Optional[Callable[[str, Any], None]] = None
+        # Bumped by clear(), a warm-up of an older build stops when it changes
+        self.generation = 0
+        self._lazy = False
+        self._files = None
+        self._rendering: Optional[str] = None
+        self._created_dirs = set()
+
+    def key(self, path: str) -> Optional[str]:
+        """Site relative POSIX path of an output path, None when outside site_dir"""
+        path = os.path.abspath(path)
+        if not path.startswith(self.site_dir + os.sep):
+            return None
+        return Path(os.path.relpath(path, self.site_dir)).as_posix()
+
+    def clear(self) -> None:
+        with self.lock:
+            self.pages.clear()
+            self.page_bytes = 0
+            self.files.clear()
+            self.renderers.clear()
+            self.generation += 1
+
+    def exists(self, path: str) -> bool:
+        """Whether an output path exists (an evicted page counts, it can be rendered again)"""
+        key = self.key(path)
+        if key is None:
+            return os.path.isfile(path)
+        return key in self.pages or key in self.renderers or key in self.files or os.path.isfile(path)
+
+    def _make_dirs(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+
+    def _store_page(self, key: str, content: bytes) -> None:
+        previous = self.pages.pop(key, None)
+        if previous is not None:
+            self.page_bytes -= len(previous)
+        self.pages[key] = content
+        self.page_bytes += len(content)
+        while self.page_bytes > self.max_page_bytes and len(self.pages) > 1:
+            _, evicted = self.pages.popitem(last=False)
+            self.page_bytes -= len(evicted)
+            self.evictions += 1
+
+    def _write_file(self, original, content: bytes, output_path: str) -> None:
+        key = self.key(output_path)
+        if key is None:
+            return original(content, output_path)
+        self._make_dirs(output_path)
+        if output_path == self._rendering:
+            self._store_page(key, content)
+        else:
+            self.files[key] = content
+
+    def _copy_file(self, original, source_path: str, output_path: str) -> None:
+        key = self.key(output_path)
+        if key is None:
+            return original(source_path, output_path)
+        self._make_dirs(output_path)
+        self.files[key] = Path(source_path)
+
+    def _populate_page(self, original, page, config, files, dirty: bool = False) -> None:
+        self._files = files
+        if not self._lazy:
+            return original(page, config, files, dirty)
+        # The first half of mkdocs' _populate_page, render() does the rest
+        config._current_page = page
+        try:
+            page = config.plugins.on_pre_page(page, config=config, files=files)
+            page.read_source(config)
+            page.markdown = config.plugins.on_page_markdown(page.markdown, page=page, config=config, files=files)
+        finally:
+            config._current_page = None
+
+    def _build_page(self, original, page, config, doc_files, nav, env, dirty: bool = False,
+                    excluded: bool = False) -> None:
+        key = self.key(page.file.abs_dest_path)
+        if key is not None:
+            i18n = config.plugins.get('i18n')
+            locale = getattr(i18n, 'current_language', None) if i18n is not None else None
+            # Everything needed to render the page again after it was evicted
+            self.renderers[key] = (page, config, self._files, doc_files, nav, env, locale)
+            if self._lazy:
+                return None
+        previous, self._rendering = self._rendering, page.file.abs_dest_path
+        try:
+            return original(page, config, doc_files, nav, env, dirty, excluded)
+        finally:
+            self._rendering = previous
+
+    @contextmanager
+    def capture(self, lazy: bool = False) -> Iterator['MemorySite']:
+        """Redirect mkdocs output into the site (enter it inside DirtyPageBuild)"""
+        from mkdocs import utils
+        from mkdocs.commands import build as mkdocs_build
+
+        with self.lock, ExitStack() as stack:
+            stack.enter_context(patch_function(utils, 'write_file', self._write_file))
+            stack.enter_context(patch_function(utils, 'copy_file', self._copy_file))
+            stack.enter_context(patch_function(mkdocs_build, '_populate_page', self._populate_page))
+            stack.enter_context(patch_function(mkdocs_build, '_build_page', self._build_page))
+            previous, self._lazy = self._lazy, lazy
+            try:
+                yield self
+            finally:
+                self._lazy = previous
+
+    def pending(self, key: str) -> bool:
+        """Whether a page of a lazy build was not converted yet"""
+        renderer = self.renderers.get(key)
+        return renderer is not None and renderer[0].content is None
+
+    def render(self, key: str) -> Optional[bytes]:
+        """Render a deferred or evicted page with the objects of the build that produced it"""
+        from mkdocs.commands import build as mkdocs_build
+
+        with self.lock:
+            if key in self.pages:
+                return self.pages[key]
+            if key not in self.renderers:
+                return None
+            page, config, files, doc_files, nav, env, locale = self.renderers[key]
+            i18n = config.plugins.get('i18n')
+            if i18n is not None and locale and i18n.current_language != locale:
+                # Same reconfiguration as the plugin's on_config for this locale;
+                # theme.dirs is kept since the jinja env of the build is reused
+                theme_dirs = list(config.theme.dirs)
+                i18n.current_language = locale
+                i18n.reconfigure_mkdocs_config(config)
+                config.theme.dirs[:] = theme_dirs
+            with self.capture():
+                populate = page.content is None
+                if populate:
+                    mkdocs_build._populate_page(page, config, files)
+                    if self.on_populate is not None:
+                        self.on_populate(key, page)
+                mkdocs_build._build_page(page, config, doc_files, nav, env)
+            self.renders_on_demand += 1
+            get_logger(__name__).debug(f"Rendered {'deferred' if populate else 'evicted'} page on demand: {key}")
+            return self.pages.get(key)
+
+    def warm_up(self, generation: int) -> bool:
+        """Render every deferred page, one at a time so requests get in between
+
+        Returns:
+            True when done, False when a newer build cleared the site meanwhile
+        """
+        with self.lock:
+            keys = list(self.renderers)
+        for key in keys:
+            with self.lock:
+                if self.generation != generation:
+                    return False
+                if self.pending(key):
+                    self.render(key)
+        return True
+
+    def read(self, key: str) -> Optional[bytes]:
+        """Content of a site relative path, None when it does not exist"""
+        with self.lock:
+            if key in self.pages:
+                self.pages.move_to_end(key)
+                return self.pages[key]
+            content = self.files.get(key)
+        if content is None:
+            if key in self.renderers:
+                return self.render(key)
+            path = os.path.join(self.site_dir, *key.split('/'))
+            content = Path(path) if os.path.isfile(path) else None
+        if isinstance(content, Path):
+            try:
+                return content.read_bytes()
+            except OSError:
+                return None
+        return content
+
+    def report(self) -> None:
+        """Log the size of the in-memory site"""
+        logger = get_logger(__name__)
+        logger.info(f"In-memory site: {len(self.pages)} of {len(self.renderers)} pages cached "
+                    f"({self.page_bytes / (1024 * 1024):.1f} of {self.max_page_bytes / (1024 * 1024):.0f} MB), "
+                    f"{len(self.files)} other files, {self.evictions} evicted, "
+                    f"{self.renders_on_demand} rendered on demand")
+        deferred = sum(1 for key in self.renderers if self.pending(key))
+        if deferred:
+            logger.info(f"Deferred {deferred} pages until they are requested, warming up in the background")
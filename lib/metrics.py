@@ -0,0 +1,227 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Serve Metrics
+Rebuild, reload and request metrics of the development server in Prometheus text and JSON form
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Seconds, from a dirty single-page rebuild to a full build of a large site
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+REQUEST_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+PAGE_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# Mutagen sync status written by the host into remote Docker serve containers
+MUTAGEN_STATUS_ENV = 'PHANTOM_MUTAGEN_STATUS'
+
+# Internal endpoints of the development server
+METRICS_PATH = '/__phantom/metrics'
+STATUS_PATH = '/__phantom/status'
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self) -> List[Tuple[str, float]]:
+        """(le, cumulative count) pairs, +Inf last"""
+        samples = []
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            samples.append((_format_value(bound), total))
+        samples.append(('+Inf', self.count))
+        return samples
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'count': self.count, 'sum': round(self.sum, 6),
+                'buckets': {le: count for le, count in self.samples()}}
+
+
+def classify_request(path: str) -> str:
+    """Path class of a request, the label of the request latency histogram"""
+    if path.startswith('/livereload/'):
+        return 'livereload'
+    if path.startswith('/__phantom/'):
+        return 'internal'
+    name = path.rsplit('/', 1)[-1]
+    if not name or name.endswith('.html'):
+        return 'page'
+    if name.endswith('.json') and 'search' in path:
+        return 'search'
+    if '.' not in name:
+        # Directory without a trailing slash, redirected to the page
+        return 'page'
+    return 'asset'
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes, None when unknown"""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Peak instead of current RSS, kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def read_mutagen_status(path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Last Mutagen sync status written by MutagenSessionManager, None outside remote Docker"""
+    path = path or os.environ.get(MUTAGEN_STATUS_ENV)
+    if not path:
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class ServeMetrics:
+    """Counters of a serve session
+
+    The builder records every rebuild (kind, duration, rendered pages), the
+    build loop records the time from the first file event of a burst to the
+    browser reload and the server records each request per path class.
+    Gauges that belong to the server (change queue depth, in-memory site)
+    come from the gauges callback at scrape time.
+    """
+
+    def __init__(self, gauges: Optional[Callable[[], Dict[str, float]]] = None):
+        self.started = time.time()
+        self.gauges = gauges
+        self._lock = threading.Lock()
+        self.rebuilds: Dict[str, int] = {}
+        self.rebuild_seconds = Histogram(DURATION_BUCKETS)
+        self.rebuild_pages = Histogram(PAGE_BUCKETS)
+        self.change_to_reload_seconds = Histogram(DURATION_BUCKETS)
+        self.requests: Dict[str, Histogram] = {}
+        self.responses: Dict[Tuple[str, int], int] = {}
+        self.last_rebuild: Optional[Dict[str, Any]] = None
+
+    def record_rebuild(self, kind: str, seconds: float, pages: Optional[int] = None, reason: str = '') -> None:
+        """Count a rebuild: full, dirty, lazy, cancelled or failed"""
+        with self._lock:
+            self.rebuilds[kind] = self.rebuilds.get(kind, 0) + 1
+            self.rebuild_seconds.observe(seconds)
+            if pages is not None:
+                self.rebuild_pages.observe(pages)
+            self.last_rebuild = {'kind': kind, 'seconds': round(seconds, 3), 'pages': pages,
+                                 'reason': reason, 'finished': round(time.time(), 3)}
+
+    def record_reload(self, seconds: float) -> None:
+        """Time from the first file event of a rebuild to the browser reload"""
+        with self._lock:
+            self.change_to_reload_seconds.observe(seconds)
+
+    def record_request(self, path: str, status: int, seconds: float) -> None:
+        path_class = classify_request(path)
+        with self._lock:
+            if path_class not in self.requests:
+                self.requests[path_class] = Histogram(REQUEST_BUCKETS)
+            self.requests[path_class].observe(seconds)
+            self.responses[(path_class, status)] = self.responses.get((path_class, status), 0) + 1
+
+    def _gauges(self) -> Dict[str, float]:
+        gauges = dict(self.gauges()) if self.gauges is not None else {}
+        rss = current_rss()
+        if rss is not None:
+            gauges['resident_memory_bytes'] = rss
+        gauges['uptime_seconds'] = round(time.time() - self.started, 3)
+        return gauges
+
+    def status(self) -> Dict[str, Any]:
+        """JSON document of /__phantom/status"""
+        with self._lock:
+            status = {
+                'rebuilds': dict(self.rebuilds),
+                'last_rebuild': self.last_rebuild,
+                'rebuild_seconds': self.rebuild_seconds.to_dict(),
+                'rebuild_pages': self.rebuild_pages.to_dict(),
+                'change_to_reload_seconds': self.change_to_reload_seconds.to_dict(),
+                'requests': {path_class: histogram.to_dict() for path_class, histogram in self.requests.items()},
+            }
+        status.update(self._gauges())
+        mutagen = read_mutagen_status()
+        if mutagen is not None:
+            status['mutagen'] = mutagen
+        return status
+
+    def prometheus(self) -> str:
+        """Text exposition format (version 0.0.4) of /__phantom/metrics"""
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP phantom_serve_{name} {help_text}")
+            lines.append(f"# TYPE phantom_serve_{name} {kind}")
+
+        def histogram(name: str, values: Histogram, labels: str = '') -> None:
+            for le, count in values.samples():
+                lines.append(f'phantom_serve_{name}_bucket{{{labels}le="{le}"}} {count}')
+            suffix = f"{{{labels.rstrip(',')}}}" if labels else ''
+            lines.append(f"phantom_serve_{name}_sum{suffix} {_format_value(values.sum)}")
+            lines.append(f"phantom_serve_{name}_count{suffix} {values.count}")
+
+        with self._lock:
+            metric('rebuilds_total', 'counter', 'Rebuilds by kind (full, dirty, lazy, cancelled, failed)')
+            for kind, count in sorted(self.rebuilds.items()):
+                lines.append(f'phantom_serve_rebuilds_total{{kind="{kind}"}} {count}')
+            metric('rebuild_duration_seconds', 'histogram', 'Wall time of each rebuild')
+            histogram('rebuild_duration_seconds', self.rebuild_seconds)
+            metric('rebuild_pages', 'histogram', 'Pages rendered per rebuild')
+            histogram('rebuild_pages', self.rebuild_pages)
+            metric('change_to_reload_seconds', 'histogram', 'Time from the first file change to the browser reload')
+            histogram('change_to_reload_seconds', self.change_to_reload_seconds)
+            metric('request_duration_seconds', 'histogram', 'Request latency by path class')
+            for path_class, values in sorted(self.requests.items()):
+                histogram('request_duration_seconds', values, f'class="{path_class}",')
+            metric('responses_total', 'counter', 'Responses by path class and status code')
+            for (path_class, status), count in sorted(self.responses.items()):
+                lines.append(f'phantom_serve_responses_total{{class="{path_class}",code="{status}"}} {count}')
+
+        for name, value in sorted(self._gauges().items()):
+            metric(name, 'gauge', name.replace('_', ' ').capitalize())
+            lines.append(f"phantom_serve_{name} {_format_value(value)}")
+
+        mutagen = read_mutagen_status()
+        if mutagen is not None:
+            metric('mutagen_status', 'gauge', 'Mutagen sync status of the remote Docker session (1 for the current one)')
+            lines.append(f'phantom_serve_mutagen_status{{status="{mutagen.get("status", "unknown")}"}} 1')
+            for name in ('conflicts', 'problems'):
+                metric(f'mutagen_{name}', 'gauge', f"Mutagen sync {name}")
+                lines.append(f"phantom_serve_mutagen_{name} {int(mutagen.get(name, 0))}")
+        return '\n'.join(lines) + '\n'
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
@@ -0,0 +1,204 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Minification
+Minifies HTML pages, inline scripts and custom JS/CSS on write, cached by content hash
+"""
+
+import os
+import re
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Any
+
+from .main import ContentStore, hash_bytes, patch_function
+from .logging import get_logger
+
+# Part of every cache key, bump when the minifier options change
+MINIFY_VERSION = '1'
+
+# Same options as mkdocs-minify-plugin, plus comment removal
+HTMLMIN_OPTIONS = {
+    'remove_comments': True,
+    'remove_empty_space': False,
+    'remove_all_empty_space': False,
+    'reduce_empty_attributes': True,
+    'reduce_boolean_attributes': False,
+    'remove_optional_attribute_quotes': True,
+    'convert_charrefs': True,
+    'keep_pre': False,
+    'pre_tags': ('pre', 'textarea'),
+    'pre_attr': 'pre',
+}
+
+# Inline <script> blocks without src; the type check below keeps JSON and templates untouched
+INLINE_SCRIPT_PATTERN = re.compile(r'(<script(?![^>]*\bsrc\s*=)([^>]*)>)(.*?)(</script>)', re.DOTALL | re.IGNORECASE)
+SCRIPT_TYPE_PATTERN = re.compile(r'\btype\s*=\s*["\']?([^"\'\s>]+)', re.IGNORECASE)
+JAVASCRIPT_TYPES = {'text/javascript', 'application/javascript', 'module'}
+
+
+def minify_js(source: str) -> str:
+    """Minify JavaScript, template literals are kept intact"""
+    import jsmin
+    return jsmin.jsmin(source, quote_chars='\'"`')
+
+
+def minify_css(source: str) -> str:
+    """Minify CSS"""
+    import csscompressor
+    return csscompressor.compress(source)
+
+
+class MinifyCache:
+    """Content-addressed store of minified outputs under <cache_dir>/minify"""
+
+    def __init__(self, cache_dir: str):
+        self.store = ContentStore(Path(cache_dir) / 'minify')
+        self.used: Set[str] = set()
+        self._inline: Dict[str, str] = {}
+
+    def key(self, kind: str, content: bytes) -> str:
+        return hash_bytes(MINIFY_VERSION.encode() + kind.encode() + b'\0' + content)
+
+    def get(self, kind: str, content: bytes) -> Optional[bytes]:
+        key = self.key(kind, content)
+        self.used.add(key)
+        return self.store.read(key)
+
+    def put(self, kind: str, content: bytes, minified: bytes) -> None:
+        key = self.key(kind, content)
+        self.used.add(key)
+        self.store.write(key, minified)
+
+    def inline_script(self, source: str) -> str:
+        """Minify an inline script, memoized since every page repeats the same ones"""
+        minified = self._inline.get(source)
+        if minified is None:
+            minified = minify_js(source).strip()
+            self._inline[source] = minified
+        return minified
+
+    def prune(self, used: Set[str]) -> int:
+        """Remove the entries the last build did not use"""
+        return self.store.prune(used)
+
+
+class MinifyOutput:
+    """Minify build output on its way to disk
+
+    Patches mkdocs.utils.write_file (HTML pages and theme templates) and
+    mkdocs.utils.copy_file (custom JS/CSS assets). Enter it after
+    LinkUnchangedFiles so minified bytes are compared with the previous output.
+    """
+
+    def __init__(self, cache: MinifyCache, site_dir: str, source_dirs: List[str],
+                 exclude_dirs: Optional[List[str]] = None):
+        self.cache = cache
+        self.site_dir = site_dir
+        self.source_dirs = [os.path.abspath(path) for path in source_dirs if path]
+        self.exclude_dirs = [os.path.abspath(path) for path in exclude_dirs or [] if path]
+        self.files: List[Dict[str, Any]] = []
+        self._stack: Optional[ExitStack] = None
+
+    def __enter__(self) -> 'MinifyOutput':
+        from mkdocs import utils
+
+        self._stack = ExitStack()
+        self._stack.enter_context(patch_function(utils, 'write_file', self._write_file))
+        self._stack.enter_context(patch_function(utils, 'copy_file', self._copy_file))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stack.close()
+
+    def _is_custom_asset(self, source_path: str) -> bool:
+        """Only project JS/CSS is minified, theme bundles and *.min.* files already are"""
+        name = os.path.basename(source_path)
+        if os.path.splitext(name)[1] not in ('.js', '.css') or '.min.' in name:
+            return False
+        source_path = os.path.abspath(source_path)
+        if any(source_path.startswith(path + os.sep) for path in self.exclude_dirs):
+            return False
+        return any(source_path.startswith(path + os.sep) for path in self.source_dirs)
+
+    def _minify_html(self, html: str) -> str:
+        import htmlmin
+
+        def replace_script(match):
+            script_type = SCRIPT_TYPE_PATTERN.search(match.group(2))
+            if script_type and script_type.group(1).lower() not in JAVASCRIPT_TYPES:
+                return match.group(0)
+            if not match.group(3).strip():
+                return match.group(0)
+            return match.group(1) + self.cache.inline_script(match.group(3)) + match.group(4)
+
+        return htmlmin.minify(INLINE_SCRIPT_PATTERN.sub(replace_script, html), **HTMLMIN_OPTIONS)
+
+    def _minify(self, kind: str, content: bytes, output_path: str) -> bytes:
+        """Minify through the cache and record the saving"""
+        minified = self.cache.get(kind, content)
+        cached = minified is not None
+        if not cached:
+            text = content.decode('utf-8')
+            if kind == 'html':
+                text = self._minify_html(text)
+            elif kind == 'js':
+                text = minify_js(text)
+            else:
+                text = minify_css(text)
+            minified = text.encode('utf-8', errors='xmlcharrefreplace')
+            self.cache.put(kind, content, minified)
+        rel_path = Path(os.path.relpath(output_path, self.site_dir)).as_posix()
+        self.files.append({'path': rel_path, 'size': len(content), 'minified': len(minified), 'cached': cached})
+        return minified
+
+    def _write_file(self, original, content: bytes, output_path: str) -> None:
+        if output_path.endswith('.html'):
+            content = self._minify('html', content, output_path)
+        original(content, output_path)
+
+    def _copy_file(self, original, source_path: str, output_path: str) -> None:
+        if not self._is_custom_asset(source_path):
+            return original(source_path, output_path)
+        from mkdocs import utils
+
+        if os.path.isdir(output_path):
+            output_path = os.path.join(output_path, os.path.basename(source_path))
+        with open(source_path, 'rb') as f:
+            content = f.read()
+        kind = os.path.splitext(source_path)[1][1:]
+        # Through the write_file chain so unchanged output can still be linked
+        utils.write_file(self._minify(kind, content, output_path), output_path)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-file sizes and the cache keys used"""
+        return {'files': self.files, 'used': sorted(self.cache.used)}
+
+
+def create_minify_output(mkdocs_config: Any, cache_dir: str, vendor_dir: Optional[str] = None) -> MinifyOutput:
+    """MinifyOutput for the theme overrides and docs assets of a MkDocs config"""
+    return MinifyOutput(MinifyCache(cache_dir), mkdocs_config.site_dir,
+                        [mkdocs_config.theme.custom_dir, mkdocs_config.docs_dir], [vendor_dir])
+
+
+def report_minify(stats: Dict[str, Any]) -> None:
+    """Log the byte savings per file and in total"""
+    logger = get_logger(__name__)
+    files = stats['files']
+    if not files:
+        return
+    for entry in files:
+        saved = entry['size'] - entry['minified']
+        logger.debug(f"Minified {entry['path']}: {entry['size']} -> "
+                     f"{entry['minified']} bytes (-{saved}){' [cached]' if entry['cached'] else ''}")
+    original = sum(entry['size'] for entry in files)
+    minified = sum(entry['minified'] for entry in files)
+    cached = sum(1 for entry in files if entry['cached'])
+    logger.info(f"Minified {len(files)} files ({cached} from cache): {original / 1024:.0f} KB -> "
+                f"{minified / 1024:.0f} KB, saved {(original - minified) / 1024:.0f} KB "
+                f"({(1 - minified / original) * 100:.1f}%)")
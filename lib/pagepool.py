@@ -0,0 +1,241 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Parallel Page Rendering
+Converts and renders the pages of one build in forked worker processes, plugin hooks stay in the parent
+"""
+
+import logging
+import multiprocessing
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List, Optional
+
+from .main import hash_bytes, patch_function
+from .profiler import profile_phase
+from .rendercache import capture_render, restore_render
+from .logging import get_logger
+
+# Fewer pages per worker than this are not worth a fork
+MIN_PAGES_PER_WORKER = 8
+
+# Task of the forked workers, set in the parent right before the pool forks
+_work: Optional[Callable[[int], Any]] = None
+
+
+def _run(index: int) -> Any:
+    try:
+        return _work(index)
+    except Exception:
+        # The parent renders the page itself and reports the error
+        return None
+
+
+def fork_supported() -> bool:
+    """Whether worker processes can inherit the prepared build (not on Windows)"""
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def _mute_logging() -> None:
+    """Drop the log output of a worker, the parent runs the hooks again and logs for real"""
+    for logger in [logging.getLogger(), *logging.Logger.manager.loggerDict.values()]:
+        if isinstance(logger, logging.Logger):
+            # A NullHandler on each, the mkdocs loggers do not propagate and would reach logging.lastResort
+            logger.handlers = [logging.NullHandler()]
+
+
+def _skip_search_index(config) -> None:
+    """Leave the search index to the parent, its page_context still strips data-search attributes"""
+    for name in ('search', 'material/search'):
+        search_index = getattr(config.plugins.get(name), 'search_index', None)
+        if search_index is not None:
+            search_index.add_entry_from_context = lambda page: None
+
+
+class ParallelPageRender:
+    """Prefetch the Markdown conversion and template render of pages in worker processes
+
+    mkdocs builds pages one at a time in two loops: _populate_page (on_pre_page,
+    on_page_markdown, Page.render, on_page_content) and _build_page
+    (on_page_context, template render, on_post_page, write). Before the first
+    page of each loop the prepared build (config, files, nav, env) is forked
+    into a pool that runs the loop for a share of the pages and sends back the
+    expensive parts: the converted HTML, table of contents and title, and the
+    rendered template output. The parent then runs both loops as usual, so
+    every plugin hook runs in the parent and in page order, and only takes a
+    worker result when its input matches: the markdown handed to Page.render
+    and the page content handed to the template. Anything else is rendered
+    in the parent.
+
+    Link warnings a worker recorded are logged again in the parent, strict
+    builds still fail on them. Enter it before CachedMarkdownRender so pages
+    found in the Markdown cache are not taken from the workers.
+    """
+
+    def __init__(self, jobs: int):
+        self.jobs = jobs
+        self.converted = 0
+        self.rendered = 0
+        self.pages = 0
+        self._worker = False
+        self._conversions: Dict[str, Dict[str, Any]] = {}
+        self._outputs: Dict[str, Dict[str, Any]] = {}
+        self._populated: Optional[int] = None
+        self._built: Optional[int] = None
+        self._current: Optional[Any] = None
+        self._stack: Optional[ExitStack] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.jobs > 1 and fork_supported()
+
+    def __enter__(self) -> 'ParallelPageRender':
+        import jinja2
+        from mkdocs.commands import build as mkdocs_build
+        from mkdocs.structure.pages import Page
+
+        self._stack = ExitStack()
+        if self.enabled:
+            self._stack.enter_context(patch_function(mkdocs_build, '_populate_page', self._populate_page))
+            self._stack.enter_context(patch_function(mkdocs_build, '_build_page', self._build_page))
+            self._stack.enter_context(patch_function(Page, 'render', self._page_render))
+            self._stack.enter_context(patch_function(jinja2.Template, 'render', self._template_render))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stack.close()
+
+    def _workers(self, pages: int) -> int:
+        return min(self.jobs, pages // MIN_PAGES_PER_WORKER)
+
+    def _map(self, work: Callable[[int], Any], count: int, workers: int) -> List[Any]:
+        """Run work(0..count-1) in forked workers that see the current state of the build"""
+        global _work
+        _work = work
+        context = multiprocessing.get_context('fork')
+        try:
+            with context.Pool(workers, initializer=self._start_worker) as pool:
+                return pool.map(_run, range(count), chunksize=max(1, count // (workers * 4)))
+        finally:
+            _work = None
+
+    def _start_worker(self) -> None:
+        from .rendercache import MarkdownRenderCache
+
+        self._worker = True
+        _mute_logging()
+        # Workers only read the Markdown cache, the parent stores the entries and counts the hits
+        MarkdownRenderCache.put = lambda *args, **kwargs: None
+
+    # Markdown conversion
+
+    def _populate_page(self, original, page, config, files, dirty: bool = False) -> None:
+        if not self._worker and self._populated != id(files):
+            self._populated = id(files)
+            self._prefetch_conversions(original, config, files, dirty)
+        return original(page, config, files, dirty)
+
+    def _prefetch_conversions(self, populate, config, files, dirty: bool) -> None:
+        pages = [file.page for file in files.documentation_pages() if file.page is not None]
+        self._conversions = {}
+        workers = self._workers(len(pages))
+        if workers < 2:
+            return
+
+        def convert(index: int) -> Optional[Dict[str, Any]]:
+            page = pages[index]
+            self._conversions.clear()
+            populate(page, config, files, dirty)
+            return self._conversions.get(page.file.src_uri)
+
+        with profile_phase('page_pool_convert', pages=len(pages), workers=workers):
+            results = self._map(convert, len(pages), workers)
+        self.pages += len(pages)
+        self._conversions = {page.file.src_uri: result
+                             for page, result in zip(pages, results) if result is not None}
+
+    def _page_render(self, original, page, config, files) -> None:
+        if self._worker:
+            conversion = capture_render(original, page, config, files)
+            conversion['markdown'] = page.markdown
+            self._conversions[page.file.src_uri] = conversion
+            return None
+
+        conversion = self._conversions.pop(page.file.src_uri, None)
+        if conversion is None or page.markdown is None or conversion['markdown'] != page.markdown:
+            return original(page, config, files)
+        restore_render(page, conversion)
+        self.converted += 1
+        return None
+
+    # Template render
+
+    def _build_page(self, original, page, config, doc_files, nav, env, dirty: bool = False,
+                    excluded: bool = False) -> None:
+        if not self._worker and self._built != id(doc_files):
+            self._built = id(doc_files)
+            self._prefetch_outputs(config, doc_files, nav, env)
+        self._current = page
+        try:
+            return original(page, config, doc_files, nav, env, dirty, excluded)
+        finally:
+            self._current = None
+
+    def _prefetch_outputs(self, config, doc_files, nav, env) -> None:
+        from mkdocs.commands.build import get_context
+
+        pages = [file.page for file in doc_files if file.page is not None]
+        self._outputs = {}
+        workers = self._workers(len(pages))
+        if workers < 2:
+            return
+
+        def render(index: int) -> Dict[str, Any]:
+            # The part of mkdocs' _build_page up to the template render
+            page = pages[index]
+            _skip_search_index(config)
+            config._current_page = page
+            try:
+                page.active = True
+                context = get_context(nav, doc_files, config, page)
+                template = env.get_template(page.meta.get('template', 'main.html'))
+                context = config.plugins.on_page_context(context, page=page, config=config, nav=nav)
+                if page.file.inclusion.is_excluded():
+                    page.content = (
+                        '<div class="mkdocs-draft-marker" title="This page will not be included into the '
+                        'built site.">DRAFT</div>' + (page.content or '')
+                    )
+                return {'content': hash_bytes((page.content or '').encode('utf-8')),
+                        'output': template.render(context)}
+            finally:
+                page.active = False
+                config._current_page = None
+
+        with profile_phase('page_pool_render', pages=len(pages), workers=workers):
+            results = self._map(render, len(pages), workers)
+        self._outputs = {page.file.src_uri: result
+                         for page, result in zip(pages, results) if result is not None}
+
+    def _template_render(self, original, template, *args, **kwargs) -> str:
+        page = self._current
+        if page is not None and args and isinstance(args[0], dict) and args[0].get('page') is page:
+            prefetched = self._outputs.pop(page.file.src_uri, None)
+            if prefetched is not None and prefetched['content'] == hash_bytes((page.content or '').encode('utf-8')):
+                self.rendered += 1
+                return prefetched['output']
+        return original(template, *args, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        return {'pages': self.pages, 'converted': self.converted, 'rendered': self.rendered}
+
+
+def report_page_pool(stats: Dict[str, Any], jobs: int) -> None:
+    """Log how many pages the worker processes converted and rendered"""
+    if not stats['pages']:
+        return
+    get_logger(__name__).info(f"Page workers ({jobs}): {stats['converted']} of {stats['pages']} pages converted, "
+                              f"{stats['rendered']} rendered in parallel")
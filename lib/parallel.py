@@ -0,0 +1,425 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Parallel Locale Builds
+Builds every mkdocs-static-i18n locale in its own worker process and merges the results
+"""
+
+import os
+import re
+import gzip
+import json
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
+
+# The build stages are imported where they are used, lib.search and
+# build.py import this module at startup (build.import_budget_ms)
+from .main import setup_mkdocs_logging
+from .profiler import BuildProfiler, get_active_profiler, profile_phase
+from .logging import get_logger
+
+if TYPE_CHECKING:
+    from .incremental import BuildManifest
+
+SITEMAP_URL_PATTERN = re.compile(r'\s*<url>.*?</url>', re.DOTALL)
+
+
+def get_i18n_plugin(mkdocs_config: Any) -> Optional[Any]:
+    """Get the mkdocs-static-i18n plugin instance, if configured"""
+    return mkdocs_config.plugins.get('i18n')
+
+
+def get_build_locales(mkdocs_config: Any) -> List[str]:
+    """List the locales to build, default locale first"""
+    i18n = get_i18n_plugin(mkdocs_config)
+    if i18n is None:
+        return []
+    default = i18n.default_language
+    return [default] + [locale for locale in i18n.build_languages if locale != default]
+
+
+def build_locale(locale: str, site_dir: str, mkdocs_file: str = 'mkdocs.yml',
+                 manifest: Optional['BuildManifest'] = None, full_build: bool = True,
+                 previous_dir: Optional[str] = None, profile: bool = False,
+                 minify: Optional[Dict[str, str]] = None,
+                 template_cache: Optional[str] = None,
+                 highlight: Optional[Dict[str, Any]] = None,
+                 markdown_cache: Optional[str] = None, icon_sprite: bool = False,
+                 search_shards: bool = False, page_jobs: int = 1) -> Dict[str, Any]:
+    """Build a single locale into site_dir (runs in a worker process)
+
+    The i18n plugin is told which locale to build and flagged as already
+    building, so its on_post_build does not chain the remaining locales.
+    Files identical to the previous output are hard-linked from it. With
+    profile set, the recorded trace events are returned to the parent.
+    minify holds the cache_dir and vendor_dir of the minification stage,
+    template_cache the cache_dir of the compiled theme templates and
+    highlight the cache_dir and max_bytes of the code block cache and
+    markdown_cache the cache_dir of the converted pages. icon_sprite moves
+    the inline SVG icons of the pages into a sprite, search_shards makes the
+    pages load the search index shard of their locale and page_jobs forks
+    that many workers converting and rendering the pages of the locale.
+    """
+    from mkdocs.commands.build import build
+    from mkdocs.config import load_config as mkdocs_load_config
+    from .incremental import IncrementalBuild
+    from .staging import LinkUnchangedFiles
+    from .minify import create_minify_output
+    from .highlight import HighlightCache, CachedHighlighting
+    from .rendercache import MarkdownRenderCache, CachedMarkdownRender
+    from .pagepool import ParallelPageRender
+    from .sprite import IconSprite
+    # Imports jinja2, only pay for it once a build runs
+    from .templates import SharedBytecodeCache, share_compiled_templates
+
+    setup_mkdocs_logging()
+
+    result = {'locale': locale, 'site_dir': site_dir, 'pages': {}, 'rendered': 0, 'reused': 0,
+              'staging': None, 'trace': [], 'minify': None, 'templates': None,
+              'highlight': None, 'markdown': None, 'sprite': None, 'page_pool': None}
+    with ExitStack() as stack:
+        profiler = None
+        if profile:
+            profiler = stack.enter_context(BuildProfiler().instrument())
+
+        with profile_phase('mkdocs_load_config', locale=locale):
+            mkdocs_config = mkdocs_load_config(mkdocs_file)
+        mkdocs_config.site_dir = site_dir
+        if search_shards:
+            from .search import enable_search_shards
+            enable_search_shards(mkdocs_config)
+
+        i18n = get_i18n_plugin(mkdocs_config)
+        i18n.current_language = locale
+        i18n.building = True
+
+        link_unchanged = None
+        if previous_dir and os.path.isdir(previous_dir):
+            link_unchanged = stack.enter_context(LinkUnchangedFiles(site_dir, previous_dir))
+
+        incremental_build = None
+        if manifest is not None:
+            incremental_build = stack.enter_context(IncrementalBuild(manifest, site_dir, full_build, previous_dir))
+
+        bytecode_cache = None
+        if template_cache is not None:
+            bytecode_cache = stack.enter_context(share_compiled_templates(SharedBytecodeCache(template_cache)))
+
+        # Entered before the Markdown cache so cached pages are not taken from the workers
+        page_pool = None
+        if page_jobs > 1:
+            page_pool = stack.enter_context(ParallelPageRender(page_jobs))
+
+        markdown_render = None
+        if markdown_cache is not None:
+            markdown_render = stack.enter_context(CachedMarkdownRender(MarkdownRenderCache(markdown_cache)))
+
+        highlighting = None
+        if highlight is not None:
+            highlighting = stack.enter_context(
+                CachedHighlighting(HighlightCache(highlight['cache_dir'], highlight['max_bytes']))
+            )
+
+        # Entered last so the bytes passed on to LinkUnchangedFiles are minified
+        minify_output = None
+        if minify is not None:
+            minify_output = stack.enter_context(
+                create_minify_output(mkdocs_config, minify['cache_dir'], minify.get('vendor_dir'))
+            )
+
+        # Entered after minification so the icons are replaced in the original HTML
+        sprite = None
+        if icon_sprite:
+            sprite = stack.enter_context(IconSprite(site_dir, previous_dir, manifest is not None and not full_build))
+
+        build(mkdocs_config)
+
+    if profiler is not None:
+        result['trace'] = profiler.events
+    if link_unchanged is not None:
+        result['staging'] = link_unchanged.stats()
+    if minify_output is not None:
+        result['minify'] = minify_output.stats()
+    if bytecode_cache is not None:
+        result['templates'] = bytecode_cache.stats()
+    if highlighting is not None:
+        result['highlight'] = highlighting.cache.stats()
+    if markdown_render is not None:
+        result['markdown'] = markdown_render.cache.stats()
+    if sprite is not None:
+        result['sprite'] = sprite.stats()
+    if page_pool is not None:
+        result['page_pool'] = page_pool.stats()
+    if incremental_build is not None:
+        result.update(pages=manifest.pages, rendered=incremental_build.rendered, reused=incremental_build.reused)
+    return result
+
+
+class ParallelLocaleBuilder:
+    """Fans the locale builds out to a process pool and merges them into site_dir"""
+
+    def __init__(self, mkdocs_config: Any, jobs: int, mkdocs_file: str = 'mkdocs.yml'):
+        self.mkdocs_config = mkdocs_config
+        self.mkdocs_file = mkdocs_file
+        self.jobs = jobs
+        self.locales = get_build_locales(mkdocs_config)
+        # Combined template cache stats of the last build
+        self.template_stats: Optional[Dict[str, Any]] = None
+        self.markdown_stats: Optional[Dict[str, Any]] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Parallel builds only pay off with several workers and locales"""
+        return self.jobs > 1 and len(self.locales) > 1
+
+    def build(self, site_dir: str, manifest: Optional['BuildManifest'] = None,
+              full_build: bool = True, previous_dir: Optional[str] = None,
+              minify: Optional[Dict[str, str]] = None,
+              template_cache: Optional[str] = None,
+              highlight: Optional[Dict[str, Any]] = None,
+              markdown_cache: Optional[str] = None, icon_sprite: bool = False,
+              search_shards: bool = False, page_jobs: int = 1) -> Optional[Dict[str, Any]]:
+        """Build all locales in parallel and merge them into site_dir
+
+        Args:
+            site_dir: Directory receiving the merged output
+            manifest: Build manifest when building incrementally
+            full_build: Whether the incremental build must render every page
+            previous_dir: Previous output to reuse unchanged files from (defaults to site_dir)
+            minify: cache_dir and vendor_dir when minifying the output
+            template_cache: cache_dir of the compiled templates, None to compile them in every worker
+            highlight: cache_dir and max_bytes of the code block cache
+            markdown_cache: cache_dir of the converted pages
+            icon_sprite: Replace inline SVG icons with references into a sprite
+            search_shards: Make the pages load the search index shard of their locale
+            page_jobs: Worker processes converting and rendering the pages of each locale
+
+        Returns:
+            Combined minification stats (empty when not minifying), None on failure
+        """
+        from .incremental import report_incremental_build
+        from .staging import report_staged_output
+        from .minify import report_minify
+        from .highlight import report_highlight_cache
+        from .rendercache import report_markdown_cache
+        from .pagepool import report_page_pool
+        from .sprite import report_icon_sprite
+
+        logger = get_logger(__name__)
+        workers = min(self.jobs, len(self.locales))
+        logger.info(f"Building {len(self.locales)} locales with {workers} parallel workers: "
+                    f"{', '.join(self.locales)}")
+
+        # Temp directories live next to site_dir so the merge is a rename
+        parent_dir = Path(site_dir).resolve().parent
+        parent_dir.mkdir(parents=True, exist_ok=True)
+        temp_dirs = {}
+        for locale in self.locales:
+            temp_dir = parent_dir / f'.build-{locale}'
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            temp_dir.mkdir()
+            temp_dirs[locale] = str(temp_dir)
+        previous_dir = str(Path(previous_dir or site_dir).resolve())
+        profiler = get_active_profiler()
+
+        results = {}
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(build_locale, locale, temp_dirs[locale], self.mkdocs_file,
+                                    manifest, full_build, previous_dir, profiler is not None, minify,
+                                    template_cache, highlight, markdown_cache, icon_sprite,
+                                    search_shards, page_jobs): locale
+                    for locale in self.locales
+                }
+                for future in as_completed(futures):
+                    locale = futures[future]
+                    try:
+                        results[locale] = future.result()
+                        if profiler is not None:
+                            profiler.add_events(results[locale]['trace'])
+                        logger.info(f"Locale '{locale}' built")
+                    except Exception as e:
+                        logger.error(f"Build failed for locale '{locale}': {e}")
+
+            if len(results) != len(self.locales):
+                return None
+
+            with profile_phase('merge_locales'):
+                self._merge(site_dir, temp_dirs)
+        finally:
+            for temp_dir in temp_dirs.values():
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+        staging_stats = [result['staging'] for result in results.values() if result['staging']]
+        if staging_stats:
+            report_staged_output({
+                key: sum(stats[key] for stats in staging_stats)
+                for key in ['written', 'linked', 'linked_bytes']
+            })
+
+        if manifest is not None:
+            for result in results.values():
+                manifest.pages.update(result['pages'])
+            report_incremental_build(
+                full_build,
+                sum(result['rendered'] for result in results.values()),
+                sum(result['reused'] for result in results.values())
+            )
+
+        template_stats = [result['templates'] for result in results.values() if result['templates']]
+        if template_stats:
+            from .templates import report_template_cache
+            self.template_stats = {
+                'hits': sum(stats['hits'] for stats in template_stats),
+                'misses': sum(stats['misses'] for stats in template_stats),
+                'used': sorted({key for stats in template_stats for key in stats['used']}),
+            }
+            report_template_cache(self.template_stats)
+
+        markdown_stats = [result['markdown'] for result in results.values() if result['markdown']]
+        if markdown_stats:
+            self.markdown_stats = {
+                'hits': sum(stats['hits'] for stats in markdown_stats),
+                'misses': sum(stats['misses'] for stats in markdown_stats),
+                'used': sorted({key for stats in markdown_stats for key in stats['used']}),
+            }
+            report_markdown_cache(self.markdown_stats)
+
+        sprite_stats = [result['sprite'] for result in results.values() if result['sprite']]
+        if sprite_stats:
+            report_icon_sprite({key: sum(stats[key] for stats in sprite_stats)
+                                for key in ['pages', 'replaced', 'saved_bytes', 'symbols']})
+
+        page_pool_stats = [result['page_pool'] for result in results.values() if result['page_pool']]
+        if page_pool_stats:
+            report_page_pool({key: sum(stats[key] for stats in page_pool_stats)
+                              for key in ['pages', 'converted', 'rendered']}, page_jobs)
+
+        highlight_stats = [result['highlight'] for result in results.values() if result['highlight']]
+        if highlight_stats:
+            report_highlight_cache({key: sum(stats[key] for stats in highlight_stats) for key in ['hits', 'misses']})
+
+        minify_stats = {'files': [], 'used': []}
+        for result in results.values():
+            if result['minify']:
+                minify_stats['files'].extend(result['minify']['files'])
+                minify_stats['used'].extend(result['minify']['used'])
+        if minify_stats['files']:
+            report_minify(minify_stats)
+        return minify_stats
+
+    def _merge(self, site_dir: str, temp_dirs: Dict[str, str]) -> None:
+        """Merge the per-locale trees into site_dir
+
+        The default locale tree becomes the site root; every other locale only
+        contributes its own sub directory. The sitemap and the search index are
+        the only shared files and get their entries concatenated, the icon
+        sprite gets the symbols of every locale.
+        """
+        from .sprite import SPRITE_PATH, read_sprite, render_sprite
+
+        logger = get_logger(__name__)
+        i18n = get_i18n_plugin(self.mkdocs_config)
+        default_locale = self.locales[0]
+        default_dir = Path(temp_dirs[default_locale])
+
+        sitemap_urls = []
+        search_index = None
+        sprite_symbols = {}
+        for locale in self.locales:
+            locale_dir = Path(temp_dirs[locale])
+            sprite_symbols.update(read_sprite(str(locale_dir / SPRITE_PATH)))
+            sitemap_urls.extend(self._read_sitemap_urls(locale_dir))
+            search_index = self._merge_search_index(search_index, locale_dir)
+
+            if locale == default_locale:
+                continue
+            link = i18n.get_language_config(locale).link.strip('/') or locale
+            source = locale_dir / link
+            if source.exists():
+                target = default_dir / link
+                if target.exists():
+                    shutil.rmtree(target)
+                os.replace(source, target)
+
+        if sitemap_urls:
+            self._write_sitemap(default_dir, sitemap_urls)
+
+        if sprite_symbols:
+            sprite_file = default_dir / SPRITE_PATH
+            sprite_file.parent.mkdir(parents=True, exist_ok=True)
+            # The worker may have hard-linked the file to the previous output
+            if sprite_file.exists():
+                sprite_file.unlink()
+            sprite_file.write_bytes(render_sprite(sprite_symbols))
+
+        if search_index is not None:
+            # Remove default locale duplicates like the sequential i18n build does
+            i18n.reconfigure_search_duplicates(search_index['docs'])
+            search_file = default_dir / 'search' / 'search_index.json'
+            search_file.parent.mkdir(parents=True, exist_ok=True)
+            # The worker may have hard-linked the file to the previous output
+            if search_file.exists():
+                search_file.unlink()
+            search_file.write_text(json.dumps(search_index, separators=(',', ':'), default=str),
+                                   encoding='utf-8')
+
+        site_path = Path(site_dir)
+        if site_path.exists():
+            shutil.rmtree(site_path)
+        os.replace(default_dir, site_path)
+        logger.info(f"Merged {len(self.locales)} locale builds into {site_dir}")
+
+    @staticmethod
+    def _read_sitemap_urls(locale_dir: Path) -> List[str]:
+        """Extract the <url> entries of a locale sitemap"""
+        sitemap = locale_dir / 'sitemap.xml'
+        if not sitemap.exists():
+            return []
+        return SITEMAP_URL_PATTERN.findall(sitemap.read_text(encoding='utf-8'))
+
+    @staticmethod
+    def _write_sitemap(site_dir: Path, urls: List[str]) -> None:
+        """Write the merged sitemap.xml and its gzipped copy"""
+        from mkdocs import utils
+
+        sitemap = site_dir / 'sitemap.xml'
+        if not sitemap.exists():
+            return
+        content = sitemap.read_text(encoding='utf-8')
+        if '<url>' not in content:
+            return
+        head = content[:content.index('<url>')].rstrip()
+        tail = content[content.rindex('</url>') + len('</url>'):]
+        output = (head + ''.join(urls) + tail).encode('utf-8')
+        # The worker may have hard-linked the file to the previous output
+        sitemap.unlink()
+        sitemap.write_bytes(output)
+
+        gz_file = site_dir / 'sitemap.xml.gz'
+        with open(gz_file, 'wb') as f:
+            with gzip.GzipFile(fileobj=f, filename=str(gz_file), mode='wb',
+                               mtime=utils.get_build_timestamp()) as gz_buf:
+                gz_buf.write(output)
+
+    @staticmethod
+    def _merge_search_index(search_index: Optional[Dict], locale_dir: Path) -> Optional[Dict]:
+        """Append the search entries of a locale build"""
+        index_file = locale_dir / 'search' / 'search_index.json'
+        if not index_file.exists():
+            return search_index
+        with open(index_file, 'r', encoding='utf-8') as f:
+            locale_index = json.load(f)
+        if search_index is None:
+            return locale_index
+        search_index['docs'].extend(locale_index.get('docs', []))
+        return search_index
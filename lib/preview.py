@@ -0,0 +1,400 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Static Preview Server
+asyncio HTTP/1.1 server for the built site with precompressed variants, conditional and range requests
+"""
+
+import os
+import re
+import time
+import asyncio
+import mimetypes
+import posixpath
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from .compression import ENCODINGS
+from .logging import get_logger
+
+# Cloudflare Pages default for files without a _headers rule: always revalidate, ETags make it cheap
+DEFAULT_CACHE_CONTROL = 'public, max-age=0, must-revalidate'
+
+# Cloudflare Pages style header rules, looked up in the served directory
+HEADERS_FILE = '_headers'
+
+# Preferred order when a client accepts several encodings
+ENCODING_PREFERENCE = ('brotli', 'gzip')
+CONTENT_ENCODING = {'brotli': 'br', 'gzip': 'gzip'}
+
+KEEP_ALIVE_TIMEOUT = 15
+MAX_KEEP_ALIVE_REQUESTS = 1000
+MAX_HEADER_SIZE = 64 * 1024
+
+# Chunk size for platforms where loop.sendfile() falls back to reads
+SEND_BUFFER_SIZE = 256 * 1024
+
+REASONS = {
+    200: 'OK', 206: 'Partial Content', 301: 'Moved Permanently', 304: 'Not Modified',
+    400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    412: 'Precondition Failed', 416: 'Range Not Satisfiable', 500: 'Internal Server Error',
+}
+
+RANGE_PATTERN = re.compile(r'bytes=(\d*)-(\d*)')
+
+
+class HeaderRules:
+    """Custom headers from a Cloudflare Pages _headers file
+
+    Each rule is a URL pattern (* matches anything, :name one path segment)
+    followed by indented "Name: value" lines; "! Name" removes a header set by
+    an earlier rule. Rules are applied in file order.
+    """
+
+    def __init__(self, rules: Optional[List[Tuple[re.Pattern, List[Tuple[str, Optional[str]]]]]] = None):
+        self.rules = rules or []
+
+    @classmethod
+    def load(cls, path: Path) -> 'HeaderRules':
+        if not path.is_file():
+            return cls()
+        rules = []
+        for line in path.read_text(encoding='utf-8').splitlines():
+            if not line.strip() or line.lstrip().startswith('#'):
+                continue
+            if not line[0].isspace():
+                pattern = re.escape(line.strip()).replace(r'\*', '.*')
+                pattern = re.sub(r'\\?:[A-Za-z]\w*', '[^/]+', pattern)
+                rules.append((re.compile(pattern), []))
+            elif rules:
+                text = line.strip()
+                if text.startswith('!'):
+                    rules[-1][1].append((text[1:].strip(), None))
+                elif ':' in text:
+                    name, value = text.split(':', 1)
+                    rules[-1][1].append((name.strip(), value.strip()))
+        return cls(rules)
+
+    def apply(self, url_path: str, headers: Dict[str, str]) -> None:
+        for pattern, rule_headers in self.rules:
+            if not pattern.fullmatch(url_path):
+                continue
+            for name, value in rule_headers:
+                for existing in [key for key in headers if key.lower() == name.lower()]:
+                    del headers[existing]
+                if value is not None:
+                    headers[name] = value
+
+
+class StaticFile:
+    """Representation of a file chosen for a request (possibly a precompressed sibling)"""
+
+    def __init__(self, path: Path, encoding: Optional[str], content_type: str, stat: os.stat_result):
+        self.path = path
+        self.encoding = encoding
+        self.content_type = content_type
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime
+        suffix = f"-{CONTENT_ENCODING[encoding]}" if encoding else ''
+        self.etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{suffix}"'
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Map codings of an Accept-Encoding header to their q-values"""
+    accepted = {}
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        quality = 1.0
+        match = re.search(r'q=([0-9.]+)', params)
+        if match:
+            try:
+                quality = float(match.group(1))
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = quality
+    return accepted
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """First and last byte of a single-range Range header
+
+    Returns:
+        (start, end) inclusive, or None when the header is not a valid single
+        byte range (ignored, the full file is sent)
+
+    Raises:
+        ValueError: When the range cannot be satisfied
+    """
+    match = RANGE_PATTERN.fullmatch(header.strip())
+    if not match or match.group(1) == match.group(2) == '':
+        return None
+    first, last = match.groups()
+    if first == '':
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError(header)
+        return max(size - length, 0), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        # Invalid, not unsatisfiable (RFC 9110 14.1.1)
+        return None
+    if start >= size:
+        raise ValueError(header)
+    return start, min(int(last), size - 1) if last else size - 1
+
+
+class StaticPreviewServer:
+    """Serves a built site the way the production CDN does
+
+    - .br/.gz siblings written by the precompress stage are served when the
+      client accepts them (Vary: Accept-Encoding)
+    - ETag/Last-Modified with If-None-Match, If-Modified-Since and If-Range
+    - single byte ranges (206/416)
+    - persistent HTTP/1.1 connections
+    - Cache-Control like Cloudflare Pages, overridable with a _headers file
+    - directory URLs resolve to index.html, 404.html for missing files
+
+    Every request is logged through lib.logging.
+    """
+
+    def __init__(self, root: str, host: str = 'localhost', port: int = 8000):
+        self.root = Path(root).resolve()
+        self.host = host
+        self.port = port
+        self.header_rules = HeaderRules.load(self.root / HEADERS_FILE)
+        self.requests = 0
+
+    def resolve(self, url_path: str) -> Tuple[Optional[Path], bool]:
+        """File for a URL path and whether a trailing-slash redirect is needed"""
+        normalized = posixpath.normpath('/' + url_path.lstrip('/'))
+        if '\0' in normalized:
+            return None, False
+        path = self.root.joinpath(*[part for part in normalized.split('/') if part])
+        if path.is_dir():
+            if not url_path.endswith('/'):
+                return path, True
+            path = path / 'index.html'
+        return (path if path.is_file() else None), False
+
+    def select_variant(self, path: Path, accept_encoding: str) -> Tuple[StaticFile, bool]:
+        """Pick the best precompressed sibling, returns it and whether variants exist"""
+        content_type, _ = mimetypes.guess_type(path.name)
+        content_type = content_type or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type in ('application/javascript', 'image/svg+xml',
+                                                               'application/json'):
+            content_type += '; charset=utf-8'
+
+        accepted = parse_accept_encoding(accept_encoding)
+        has_variants = False
+        chosen = None
+        for encoding in ENCODING_PREFERENCE:
+            sibling = path.with_name(path.name + ENCODINGS[encoding])
+            try:
+                stat = sibling.stat()
+            except OSError:
+                continue
+            has_variants = True
+            token = CONTENT_ENCODING[encoding]
+            quality = accepted[token] if token in accepted else accepted.get('*', 0.0)
+            if chosen is None and quality > 0:
+                chosen = StaticFile(sibling, encoding, content_type, stat)
+        return chosen or StaticFile(path, None, content_type, path.stat()), has_variants
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        peer = writer.get_extra_info('peername')
+        client = peer[0] if peer else '-'
+        try:
+            for _ in range(MAX_KEEP_ALIVE_REQUESTS):
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                keep_alive = await self.handle_request(head, client, writer)
+                if not keep_alive:
+                    break
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, head: bytes, client: str, writer: asyncio.StreamWriter) -> bool:
+        """Answer one request, returns whether the connection stays open"""
+        started = time.perf_counter()
+        try:
+            request_line, *header_lines = head.decode('latin-1').split('\r\n')
+            method, target, version = request_line.split(' ')
+        except ValueError:
+            await self.send(writer, 400, {}, b'Bad Request', False)
+            return False
+        headers = {}
+        for line in header_lines:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+        status, size, encoding = await self.respond(method, target, headers, writer, keep_alive)
+
+        self.requests += 1
+        get_logger(__name__).info(
+            f'{client} "{method} {target} {version}" {status} {size} '
+            f'{CONTENT_ENCODING.get(encoding, "-")} {(time.perf_counter() - started) * 1000:.1f}ms'
+        )
+        return keep_alive and status not in (400, 405)
+
+    async def respond(self, method: str, target: str, headers: Dict[str, str], writer: asyncio.StreamWriter,
+                      keep_alive: bool) -> Tuple[int, int, Optional[str]]:
+        if method not in ('GET', 'HEAD'):
+            # The request body is not read, close so it is not parsed as the next request
+            await self.send(writer, 405, {'Allow': 'GET, HEAD'}, b'Method Not Allowed', False)
+            return 405, 0, None
+
+        url_path = unquote(urlsplit(target).path)
+        path, redirect = self.resolve(url_path)
+        if redirect:
+            location = urlsplit(target)._replace(path=urlsplit(target).path + '/').geturl()
+            await self.send(writer, 301, {'Location': location}, b'', keep_alive)
+            return 301, 0, None
+
+        status = 200
+        if path is None:
+            status = 404
+            path = self.root / '404.html'
+            if not path.is_file():
+                await self.send(writer, 404, {}, b'Not Found', keep_alive, method == 'HEAD')
+                return 404, 0, None
+
+        variant, has_variants = self.select_variant(path, headers.get('accept-encoding', ''))
+        response_headers = {
+            'Content-Type': variant.content_type,
+            'Last-Modified': formatdate(variant.mtime, usegmt=True),
+            'ETag': variant.etag,
+            'Cache-Control': DEFAULT_CACHE_CONTROL,
+            'Accept-Ranges': 'bytes',
+        }
+        if variant.encoding:
+            response_headers['Content-Encoding'] = CONTENT_ENCODING[variant.encoding]
+        if has_variants:
+            response_headers['Vary'] = 'Accept-Encoding'
+        self.header_rules.apply(url_path, response_headers)
+
+        if status == 200 and self.not_modified(headers, variant):
+            await self.send(writer, 304, response_headers, b'', keep_alive, True)
+            return 304, 0, variant.encoding
+
+        start, end = 0, variant.size - 1
+        range_header = headers.get('range')
+        if status == 200 and range_header and self.range_applies(headers, variant):
+            try:
+                byte_range = parse_range(range_header, variant.size)
+            except ValueError:
+                response_headers['Content-Range'] = f'bytes */{variant.size}'
+                await self.send(writer, 416, response_headers, b'', keep_alive)
+                return 416, 0, variant.encoding
+            if byte_range is not None:
+                status = 206
+                start, end = byte_range
+                response_headers['Content-Range'] = f'bytes {start}-{end}/{variant.size}'
+
+        length = end - start + 1 if variant.size else 0
+        response_headers['Content-Length'] = str(length)
+        await self.send_head(writer, status, response_headers, keep_alive)
+        if method == 'GET' and length:
+            await self.send_file(writer, variant.path, start, length)
+        return status, length if method == 'GET' else 0, variant.encoding
+
+    @staticmethod
+    def not_modified(headers: Dict[str, str], variant: StaticFile) -> bool:
+        if 'if-none-match' in headers:
+            tags = [tag.strip() for tag in headers['if-none-match'].split(',')]
+            # Weak comparison, as for GET/HEAD
+            tags = [tag[2:] if tag.startswith('W/') else tag for tag in tags]
+            return '*' in tags or variant.etag in tags
+        if 'if-modified-since' in headers:
+            try:
+                since = parsedate_to_datetime(headers['if-modified-since']).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(variant.mtime) <= since
+        return False
+
+    @staticmethod
+    def range_applies(headers: Dict[str, str], variant: StaticFile) -> bool:
+        """If-Range: only send a partial response when the client's copy is current"""
+        if_range = headers.get('if-range')
+        if not if_range:
+            return True
+        if if_range.startswith('"') or if_range.startswith('W/'):
+            return if_range == variant.etag
+        try:
+            return int(variant.mtime) <= parsedate_to_datetime(if_range).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+    async def send_head(self, writer: asyncio.StreamWriter, status: int, headers: Dict[str, str],
+                        keep_alive: bool) -> None:
+        lines = [f'HTTP/1.1 {status} {REASONS.get(status, "")}',
+                 f'Date: {formatdate(usegmt=True)}',
+                 'Server: phantom-preview']
+        lines += [f'{name}: {value}' for name, value in headers.items()]
+        if keep_alive:
+            lines.append(f'Keep-Alive: timeout={KEEP_ALIVE_TIMEOUT}')
+        else:
+            lines.append('Connection: close')
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        await writer.drain()
+
+    async def send(self, writer: asyncio.StreamWriter, status: int, headers: Dict[str, str], body: bytes,
+                   keep_alive: bool, head_only: bool = False) -> None:
+        headers = dict(headers)
+        if status != 304:
+            headers.setdefault('Content-Type', 'text/plain; charset=utf-8')
+            headers['Content-Length'] = str(len(body))
+        await self.send_head(writer, status, headers, keep_alive)
+        if body and not head_only:
+            writer.write(body)
+            await writer.drain()
+
+    @staticmethod
+    async def send_file(writer: asyncio.StreamWriter, path: Path, offset: int, count: int) -> None:
+        loop = asyncio.get_running_loop()
+        with open(path, 'rb') as f:
+            try:
+                # Zero-copy os.sendfile() where the transport supports it
+                await loop.sendfile(writer.transport, f, offset, count, fallback=False)
+                return
+            except (NotImplementedError, RuntimeError, asyncio.SendfileNotAvailableError):
+                pass
+            f.seek(offset)
+            while count > 0:
+                chunk = f.read(min(SEND_BUFFER_SIZE, count))
+                if not chunk:
+                    break
+                writer.write(chunk)
+                await writer.drain()
+                count -= len(chunk)
+
+    async def serve_forever(self) -> None:
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port,
+                                            limit=MAX_HEADER_SIZE, backlog=1024)
+        logger = get_logger(__name__)
+        logger.info(f"Serving {self.root} at http://{self.host}:{self.port}/")
+        if self.header_rules.rules:
+            logger.info(f"Applying {len(self.header_rules.rules)} header rules from {HEADERS_FILE}")
+        async with server:
+            await server.serve_forever()
+
+
+def serve_static(root: str, host: str = 'localhost', port: int = 8000) -> None:
+    """Serve a built site until interrupted"""
+    asyncio.run(StaticPreviewServer(root, host, port).serve_forever())
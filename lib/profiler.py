@@ -0,0 +1,275 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Build Profiler
+Records wall and CPU time of every build phase as a Chrome trace (Perfetto compatible)
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import threading
+import subprocess
+from collections import defaultdict
+from contextlib import contextmanager, ExitStack
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterator
+
+from .main import patch_function
+from .logging import get_logger
+
+# Functions of mkdocs.commands.build recorded as build phases
+MKDOCS_BUILD_PHASES = [
+    'build',
+    'get_files',
+    'get_navigation',
+    '_build_theme_template',
+    '_build_extra_template',
+]
+
+# One line of python -X importtime: self and cumulative microseconds, indented module name
+IMPORT_TIME_PATTERN = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+_active_profiler: Optional['BuildProfiler'] = None
+
+
+class BuildProfiler:
+    """Collects timed spans and writes them in the Chrome trace event format"""
+
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, category: str = 'phase', **args) -> Iterator[None]:
+        """Record the wall and CPU time of a block"""
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            args['cpu_ms'] = round(cpu * 1000, 3)
+            event = {
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                # perf_counter is system wide, so worker process spans line up
+                'ts': round(wall_start * 1_000_000, 3),
+                'dur': round(wall * 1_000_000, 3),
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+                'args': args
+            }
+            with self._lock:
+                self.events.append(event)
+
+    def add_events(self, events: List[Dict[str, Any]]) -> None:
+        """Merge spans recorded by a worker process"""
+        with self._lock:
+            self.events.extend(events)
+
+    @contextmanager
+    def instrument(self) -> Iterator['BuildProfiler']:
+        """Activate the profiler and hook it into MkDocs, Jinja and the plugins"""
+        global _active_profiler
+        from jinja2 import Template
+        from mkdocs import utils
+        from mkdocs.commands import build as mkdocs_build
+        from mkdocs.plugins import PluginCollection
+        from mkdocs.structure.pages import Page
+
+        with ExitStack() as stack:
+            for phase in MKDOCS_BUILD_PHASES:
+                stack.enter_context(patch_function(mkdocs_build, phase, self._timed(phase, 'phase')))
+            stack.enter_context(patch_function(mkdocs_build, '_populate_page', self._populate_page))
+            stack.enter_context(patch_function(mkdocs_build, '_build_page', self._build_page))
+            stack.enter_context(patch_function(Page, 'render', self._page_render))
+            stack.enter_context(patch_function(Template, 'render', self._template_render))
+            stack.enter_context(patch_function(utils, 'write_file', self._write_file))
+            stack.enter_context(patch_function(utils, 'copy_file', self._copy_file))
+            stack.enter_context(patch_function(PluginCollection, 'run_event', self._run_event))
+
+            previous_profiler = _active_profiler
+            _active_profiler = self
+            try:
+                yield self
+            finally:
+                _active_profiler = previous_profiler
+
+    def _timed(self, name: str, category: str):
+        """Wrapper factory recording every call of a function"""
+        def wrapper(original, *args, **kwargs):
+            with self.span(name, category):
+                return original(*args, **kwargs)
+        return wrapper
+
+    def _populate_page(self, original, page, *args, **kwargs):
+        with self.span('populate_page', 'page', page=page.file.dest_uri):
+            return original(page, *args, **kwargs)
+
+    def _build_page(self, original, page, *args, **kwargs):
+        with self.span('build_page', 'page', page=page.file.dest_uri):
+            return original(page, *args, **kwargs)
+
+    def _page_render(self, original, page, *args, **kwargs):
+        with self.span('markdown', 'markdown', page=page.file.dest_uri):
+            return original(page, *args, **kwargs)
+
+    def _template_render(self, original, template, *args, **kwargs):
+        with self.span(f"render {template.name or '<string>'}", 'template'):
+            return original(template, *args, **kwargs)
+
+    def _write_file(self, original, content, output_path, *args, **kwargs):
+        with self.span('write_file', 'io', path=str(output_path), bytes=len(content)):
+            return original(content, output_path, *args, **kwargs)
+
+    def _copy_file(self, original, source_path, output_path, *args, **kwargs):
+        with self.span('copy_file', 'io', path=str(source_path)):
+            return original(source_path, output_path, *args, **kwargs)
+
+    def _run_event(self, original, collection, name, item=None, **kwargs):
+        """Same loop as PluginCollection.run_event with one span per plugin method"""
+        pass_item = item is not None
+        for method in collection.events[name]:
+            owner = getattr(method, '__self__', None)
+            owner_name = type(owner).__name__ if owner is not None else getattr(method, '__name__', 'hook')
+            with self.span(f"{owner_name}.on_{name}", 'plugin'):
+                result = method(item, **kwargs) if pass_item else method(**kwargs)
+            if result is not None:
+                item = result
+        return item
+
+    def slowest_pages(self, top_n: int = 10) -> List[Dict[str, Any]]:
+        """Sum populate and build time per page and return the slowest ones"""
+        pages = defaultdict(lambda: {'populate': 0.0, 'build': 0.0})
+        for event in self.events:
+            if event['cat'] != 'page':
+                continue
+            key = 'populate' if event['name'] == 'populate_page' else 'build'
+            pages[event['args']['page']][key] += event['dur'] / 1000
+        ranked = sorted(pages.items(), key=lambda item: item[1]['populate'] + item[1]['build'], reverse=True)
+        return [
+            {'page': page, 'populate_ms': times['populate'], 'build_ms': times['build'],
+             'total_ms': times['populate'] + times['build']}
+            for page, times in ranked[:top_n]
+        ]
+
+    def category_totals(self) -> Dict[str, float]:
+        """Total wall time per span category in milliseconds (nested spans overlap)"""
+        totals = defaultdict(float)
+        for event in self.events:
+            totals[event['cat']] += event['dur'] / 1000
+        return dict(totals)
+
+    def write_trace(self, output_file: str) -> None:
+        """Write the Chrome trace JSON (load in chrome://tracing or ui.perfetto.dev)"""
+        metadata = [
+            {'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': f"phantom-build [{pid}]"}}
+            for pid in sorted({event['pid'] for event in self.events})
+        ]
+        trace = {
+            'traceEvents': metadata + sorted(self.events, key=lambda event: event['ts']),
+            'displayTimeUnit': 'ms',
+            'otherData': {
+                'command': ' '.join(sys.argv),
+                'wall_seconds': round(time.perf_counter() - self.started, 3)
+            }
+        }
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f)
+
+    def report(self, top_n: int = 10) -> None:
+        """Log per-category totals and the slowest pages"""
+        logger = get_logger(__name__)
+        totals = ', '.join(f"{category} {total:.0f}ms" for category, total in sorted(self.category_totals().items()))
+        logger.info(f"Profile totals: {totals}")
+        logger.info(f"Slowest {top_n} pages:")
+        for entry in self.slowest_pages(top_n):
+            logger.info(f"   {entry['total_ms']:8.1f}ms  {entry['page']} "
+                        f"(markdown {entry['populate_ms']:.1f}ms, template {entry['build_ms']:.1f}ms)")
+
+
+@contextmanager
+def profile_phase(name: str, category: str = 'phase', **args) -> Iterator[None]:
+    """Record a span on the active profiler, no-op when profiling is off"""
+    if _active_profiler is None:
+        yield
+        return
+    with _active_profiler.span(name, category, **args):
+        yield
+
+
+def get_active_profiler() -> Optional[BuildProfiler]:
+    """Get the profiler activated by BuildProfiler.instrument(), if any"""
+    return _active_profiler
+
+
+def profile_imports(module: str, cwd: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Import a module in a fresh interpreter with -X importtime
+
+    Returns:
+        One entry per imported module in import order, with its nesting
+        depth below module (0 for module itself) and self / cumulative
+        milliseconds
+
+    Raises:
+        RuntimeError: When the module cannot be imported
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                            cwd=cwd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed: {result.stderr.strip().splitlines()[-1:]}")
+
+    timings = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match:
+            timings.append({'module': match[4], 'depth': len(match[3]) // 2,
+                            'self_ms': int(match[1]) / 1000, 'cumulative_ms': int(match[2]) / 1000})
+    # Modules imported before module itself started belong to the interpreter (site, encodings)
+    end = next((index for index, timing in enumerate(timings)
+                if timing['module'] == module and timing['depth'] == 0), len(timings) - 1)
+    start = next((index + 1 for index in range(end - 1, -1, -1) if timings[index]['depth'] == 0), 0)
+    return timings[start:end + 1]
+
+
+def report_import_profile(module: str, timings: List[Dict[str, Any]], package: str = 'lib',
+                          budget_ms: Optional[int] = None, top_n: int = 15) -> bool:
+    """Log the cumulative import costs of a module and check its package against a budget
+
+    The package cost is the cumulative time of every direct import of the
+    package or one of its submodules, i.e. what the module pays for using it.
+
+    Returns:
+        False when the package cost is over budget_ms
+    """
+    logger = get_logger(__name__)
+    total = timings[-1]['cumulative_ms'] if timings else 0.0
+    logger.info(f"Startup imports of {module}: {total:.1f}ms, {len(timings)} modules")
+    logger.info(f"Slowest {top_n} direct imports (cumulative):")
+    direct = [timing for timing in timings if timing['depth'] == 1]
+    for timing in sorted(direct, key=lambda timing: timing['cumulative_ms'], reverse=True)[:top_n]:
+        logger.info(f"   {timing['cumulative_ms']:8.1f}ms  {timing['module']} (self {timing['self_ms']:.1f}ms)")
+
+    package_ms = sum(timing['cumulative_ms'] for timing in direct
+                     if timing['module'] == package or timing['module'].startswith(package + '.'))
+    if budget_ms is None:
+        logger.info(f"Importing {package}: {package_ms:.1f}ms")
+        return True
+    if package_ms > budget_ms:
+        logger.error(f"Importing {package} took {package_ms:.1f}ms, over the {budget_ms}ms budget")
+        return False
+    logger.info(f"Importing {package}: {package_ms:.1f}ms (budget {budget_ms}ms)")
+    return True
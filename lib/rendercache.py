@@ -0,0 +1,191 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Markdown Render Cache
+Reuses the Markdown conversion of unchanged pages, keyed by source and extension configuration
+"""
+
+import pickle
+import logging
+import threading
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .main import ContentStore, hash_bytes, patch_function
+from .logging import get_logger
+
+# Part of every cache key, bump when the stored entry layout changes
+RENDER_CACHE_VERSION = '1'
+
+# Packages whose upgrade changes the converted HTML
+RENDER_PACKAGES = ('mkdocs', 'mkdocs-material', 'markdown', 'pymdown-extensions', 'pygments')
+
+
+def _stable(value: Any) -> Any:
+    """Process-independent form of a config value (callables by import path)"""
+    if isinstance(value, dict):
+        return sorted((str(key), _stable(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return [_stable(item) for item in value]
+    if callable(value):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', type(value).__name__)}"
+    return value
+
+
+class MarkdownRenderCache:
+    """Converted pages under <cache_dir>/markdown
+
+    An entry holds the HTML, table of contents and title Page.render()
+    produced, plus the link warnings it logged. Keys cover the page
+    markdown (after on_page_markdown), the page URL, the whole
+    markdown_extensions block, use_directory_urls, the URLs of every file
+    the links may point to and the versions of the Markdown packages.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.store = ContentStore(Path(cache_dir) / 'markdown')
+        self.hits = 0
+        self.misses = 0
+        self.used: Set[str] = set()
+        self._lock = threading.Lock()
+        self._environment_keys: Dict[int, Tuple[Any, str]] = {}
+        self._versions: Optional[str] = None
+
+    def _versions_key(self) -> str:
+        if self._versions is None:
+            from importlib.metadata import version
+            self._versions = '|'.join(f"{package}={version(package)}" for package in RENDER_PACKAGES)
+        return self._versions
+
+    def _environment_key(self, config, files) -> str:
+        """Extension configuration and link targets, computed once per build"""
+        cached = self._environment_keys.get(id(files))
+        if cached is not None and cached[0] is files:
+            return cached[1]
+        targets = sorted((file.src_uri, file.url) for file in files)
+        key = hash_bytes(repr((self._versions_key(), _stable(config['markdown_extensions']),
+                               _stable(config['mdx_configs']), config['use_directory_urls'],
+                               targets)).encode('utf-8'))
+        self._environment_keys = {id(files): (files, key)}
+        return key
+
+    def key(self, page, config, files) -> str:
+        return hash_bytes('\0'.join([RENDER_CACHE_VERSION, self._environment_key(config, files),
+                                     page.file.src_uri, page.url, page.markdown]).encode('utf-8'))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self.used.add(key)
+        entry = None
+        data = self.store.read(key)
+        if data is not None:
+            try:
+                entry = pickle.loads(data)
+            except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+                entry = None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        try:
+            data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except pickle.PicklingError as e:
+            get_logger(__name__).debug(f"Could not store the rendered page: {e}")
+            return
+        self.store.write(key, data)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'used': sorted(self.used)}
+
+    def prune(self, used: Set[str]) -> int:
+        """Remove the entries the last build did not use"""
+        return self.store.prune(used)
+
+
+class _RecordWarnings(logging.Handler):
+    """Collects the records mkdocs logs while converting a page"""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records: List[Tuple[int, str]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append((record.levelno, record.getMessage()))
+
+
+def capture_render(original, page, config, files) -> Dict[str, Any]:
+    """Run Page.render and return what restore_render needs to repeat it"""
+    page_logger = logging.getLogger('mkdocs.structure.pages')
+    recorder = _RecordWarnings()
+    page_logger.addHandler(recorder)
+    try:
+        original(page, config, files)
+    finally:
+        page_logger.removeHandler(recorder)
+    return {'content': page.content, 'toc': page.toc,
+            'title': page._title_from_render, 'log': recorder.records}
+
+
+def restore_render(page, entry: Dict[str, Any]) -> None:
+    """Set a captured conversion on the page and log its warnings again"""
+    page.content = entry['content']
+    page.toc = entry['toc']
+    page._title_from_render = entry['title']
+    page_logger = logging.getLogger('mkdocs.structure.pages')
+    for level, message in entry['log']:
+        page_logger.log(level, message)
+
+
+class CachedMarkdownRender:
+    """Serve Page.render() from a MarkdownRenderCache
+
+    Only the Markdown conversion is skipped: on_page_markdown and
+    on_page_content still run, and so does the template render, so
+    navigation changes stay correct. Link warnings recorded with an entry
+    are logged again on every hit, strict builds still fail on them.
+    """
+
+    def __init__(self, cache: MarkdownRenderCache):
+        self.cache = cache
+        self._stack: Optional[ExitStack] = None
+
+    def __enter__(self) -> 'CachedMarkdownRender':
+        from mkdocs.structure.pages import Page
+
+        self._stack = ExitStack()
+        self._stack.enter_context(patch_function(Page, 'render', self._render))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stack.close()
+
+    def _render(self, original, page, config, files) -> None:
+        if page.markdown is None:
+            return original(page, config, files)
+        key = self.cache.key(page, config, files)
+        entry = self.cache.get(key)
+        if entry is not None:
+            restore_render(page, entry)
+            return None
+
+        self.cache.put(key, capture_render(original, page, config, files))
+        return None
+
+
+def report_markdown_cache(stats: Dict[str, Any]) -> None:
+    """Log how many pages skipped the Markdown conversion"""
+    total = stats['hits'] + stats['misses']
+    if total:
+        get_logger(__name__).info(f"Markdown cache: {stats['hits']} of {total} pages reused their conversion, "
+                                  f"{stats['misses']} converted")
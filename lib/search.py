@@ -0,0 +1,104 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Search Shards
+Splits the search index into one shard per locale, loaded by the client instead of the full index
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .parallel import get_i18n_plugin, get_build_locales
+from .staging import link_or_copy
+from .logging import get_logger
+
+# Extra config key that tells overrides/main.html to load assets/javascripts/search-shards.js
+SEARCH_SHARDS_EXTRA = 'search_shards'
+
+
+def enable_search_shards(mkdocs_config: Any) -> List[str]:
+    """Make the pages load the search shard of their locale, returns the locales"""
+    locales = get_build_locales(mkdocs_config)
+    if len(locales) > 1:
+        mkdocs_config.extra[SEARCH_SHARDS_EXTRA] = locales
+    return locales
+
+
+def _locale_prefixes(mkdocs_config: Any) -> Dict[str, str]:
+    """Location prefix of every non-default locale, e.g. {'tr': 'tr/'}"""
+    i18n = get_i18n_plugin(mkdocs_config)
+    locales = get_build_locales(mkdocs_config)
+    prefixes = {}
+    for locale in locales[1:]:
+        link = i18n.get_language_config(locale).link.strip('/') or locale
+        prefixes[locale] = link + '/'
+    return prefixes
+
+
+def write_search_shards(mkdocs_config: Any, site_dir: str, previous_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Write search/search_index.<locale>.json next to the full index
+
+    The full index of the i18n build holds the entries of every locale, so
+    each page downloads and indexes all of them, with the stemmers of every
+    language. A shard only holds the entries of one locale and only names
+    that locale's language, so the Material search worker builds a single
+    language lunr index. search_index.json stays for file:// browsing.
+    A shard whose bytes match the one in previous_dir (the live output of a
+    staged build) is hard-linked to it instead of written.
+
+    Returns:
+        Entry count and size per locale, empty when there is nothing to split
+    """
+    locales = get_build_locales(mkdocs_config)
+    index_file = Path(site_dir) / 'search' / 'search_index.json'
+    if len(locales) < 2 or not index_file.exists():
+        return {}
+    with open(index_file, 'r', encoding='utf-8') as f:
+        search_index = json.load(f)
+
+    prefixes = _locale_prefixes(mkdocs_config)
+    shards: Dict[str, List[Dict[str, Any]]] = {locale: [] for locale in locales}
+    for doc in search_index.get('docs', []):
+        location = doc.get('location', '')
+        locale = next((code for code, prefix in prefixes.items() if location.startswith(prefix)), locales[0])
+        shards[locale].append(doc)
+
+    previous_index = Path(previous_dir) / 'search' / 'search_index.json' if previous_dir else None
+    stats: Dict[str, Any] = {'linked': 0}
+    languages = search_index.get('config', {}).get('lang', [])
+    for locale, docs in shards.items():
+        config = dict(search_index.get('config', {}))
+        if locale in languages:
+            config['lang'] = [locale]
+        content = json.dumps({'config': config, 'docs': docs}, separators=(',', ':'), default=str).encode('utf-8')
+        shard_file = index_file.with_name(f'search_index.{locale}.json')
+        stats[locale] = {'docs': len(docs), 'size': len(content)}
+        previous = previous_index.with_name(shard_file.name) if previous_index else None
+        if previous and previous.is_file() and previous.stat().st_size == len(content) \
+                and previous.read_bytes() == content:
+            link_or_copy(str(previous), str(shard_file))
+            stats['linked'] += 1
+            continue
+        # The file may be hard-linked to the previous output
+        if shard_file.exists():
+            shard_file.unlink()
+        shard_file.write_bytes(content)
+    stats['full_size'] = index_file.stat().st_size
+    return stats
+
+
+def report_search_shards(stats: Dict[str, Any]) -> None:
+    """Log the size of every shard against the full index"""
+    if not stats:
+        return
+    full_size = stats['full_size']
+    shards = ', '.join(f"{locale} {entry['docs']} entries ({entry['size'] // 1024} KB)"
+                       for locale, entry in stats.items() if isinstance(entry, dict))
+    unchanged = f", {stats['linked']} unchanged" if stats.get('linked') else ''
+    get_logger(__name__).info(f"Search shards: {shards}; full index {full_size // 1024} KB{unchanged}")
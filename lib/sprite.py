@@ -0,0 +1,151 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Icon Sprite
+Collects the inline SVG icons of every page into one sprite referenced with <use href>
+"""
+
+import os
+import re
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .main import hash_bytes, patch_function
+from .logging import get_logger
+
+# Sprite location inside the site_dir, the i18n plugin builds every locale into the same one
+SPRITE_PATH = 'assets/images/icons.svg'
+
+INLINE_SVG_PATTERN = re.compile(r'<svg\b([^>]*)>(.*?)</svg>', re.DOTALL | re.IGNORECASE)
+VIEWBOX_PATTERN = re.compile(r'\bviewBox\s*=\s*"([^"]*)"', re.IGNORECASE)
+SYMBOL_PATTERN = re.compile(r'<symbol id="([^"]+)" viewBox="([^"]*)">(.*?)</symbol>', re.DOTALL)
+
+# Icons with these inside are left inline: ids would collide in the sprite, the rest cannot move
+UNSPRITEABLE_PATTERN = re.compile(r'\bid\s*=|<(?:svg|use|script|style|foreignObject)\b', re.IGNORECASE)
+
+
+def read_sprite(path: str) -> Dict[str, Tuple[str, str]]:
+    """Symbols (id -> viewBox, content) of a sprite written by IconSprite"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return {symbol_id: (viewbox, content) for symbol_id, viewbox, content in SYMBOL_PATTERN.findall(f.read())}
+    except OSError:
+        return {}
+
+
+def render_sprite(symbols: Dict[str, Tuple[str, str]]) -> bytes:
+    sprite = ''.join(f'<symbol id="{symbol_id}" viewBox="{viewbox}">{content}</symbol>'
+                     for symbol_id, (viewbox, content) in sorted(symbols.items()))
+    return f'<svg xmlns="http://www.w3.org/2000/svg">{sprite}</svg>\n'.encode('utf-8')
+
+
+class IconSprite:
+    """Replace inline SVG icons of pages with references into a sprite
+
+    pymdownx.emoji (material.extensions.emoji.to_svg) and the theme inline
+    the full SVG of an icon on every use. Page HTML written through
+    mkdocs.utils.write_file keeps each <svg> element with its attributes,
+    so the theme CSS still sizes it, but its content becomes a <use href>
+    into <site_dir>/assets/images/icons.svg, where each distinct icon is
+    stored once as a <symbol>. The i18n plugin builds every locale into the
+    same site_dir, parallel locale builds merge their sprites.
+
+    With keep_previous (incremental builds, pages that were not rendered
+    again still reference the old symbols) the symbols of the sprite in
+    previous_dir are carried over. Enter it after MinifyOutput so it sees
+    the HTML before minification.
+    """
+
+    def __init__(self, site_dir: str, previous_dir: Optional[str] = None, keep_previous: bool = False):
+        self.site_dir = os.path.abspath(site_dir)
+        self.previous_dir = os.path.abspath(previous_dir) if previous_dir else None
+        self.keep_previous = keep_previous
+        # Sprite file -> symbol id -> (viewBox, content)
+        self.sprites: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        self.pages = 0
+        self.replaced = 0
+        self.saved_bytes = 0
+        self._page: Optional[Tuple[str, str]] = None
+        self._stack: Optional[ExitStack] = None
+
+    def __enter__(self) -> 'IconSprite':
+        from mkdocs import utils
+        from mkdocs.commands import build as mkdocs_build
+
+        self._stack = ExitStack()
+        self._stack.enter_context(patch_function(mkdocs_build, '_build_page', self._build_page))
+        self._stack.enter_context(patch_function(utils, 'write_file', self._write_file))
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        try:
+            if exc_type is None:
+                self._write_sprites()
+        finally:
+            self._stack.close()
+
+    def _build_page(self, original, page, config, *args, **kwargs) -> None:
+        # Pages of every locale share the sprite of the build's site_dir
+        self._page = (os.path.abspath(page.file.abs_dest_path), os.path.join(config.site_dir, SPRITE_PATH))
+        try:
+            original(page, config, *args, **kwargs)
+        finally:
+            self._page = None
+
+    def _write_file(self, original, content: bytes, output_path: str) -> None:
+        if self._page is not None and os.path.abspath(output_path) == self._page[0]:
+            content = self._replace_icons(content.decode('utf-8'), *self._page).encode('utf-8')
+        original(content, output_path)
+
+    def _replace_icons(self, html: str, page_path: str, sprite_path: str) -> str:
+        symbols = self.sprites.setdefault(os.path.abspath(sprite_path), {})
+        href = Path(os.path.relpath(sprite_path, os.path.dirname(page_path))).as_posix()
+        replaced = 0
+
+        def replace_svg(match):
+            nonlocal replaced
+            attributes, content = match.group(1), match.group(2)
+            viewbox = VIEWBOX_PATTERN.search(attributes)
+            if viewbox is None or not content.strip() or UNSPRITEABLE_PATTERN.search(content):
+                return match.group(0)
+            symbol_id = 'icon-' + hash_bytes(f"{viewbox.group(1)}\0{content}".encode('utf-8'))[:12]
+            symbols[symbol_id] = (viewbox.group(1), content)
+            replaced += 1
+            return f'<svg{attributes}><use href="{href}#{symbol_id}"></use></svg>'
+
+        output = INLINE_SVG_PATTERN.sub(replace_svg, html)
+        if replaced:
+            self.pages += 1
+            self.replaced += replaced
+            self.saved_bytes += len(html.encode('utf-8')) - len(output.encode('utf-8'))
+        return output
+
+    def _previous_symbols(self, sprite_path: str) -> Dict[str, Tuple[str, str]]:
+        if not self.keep_previous or self.previous_dir is None:
+            return {}
+        return read_sprite(os.path.join(self.previous_dir, os.path.relpath(sprite_path, self.site_dir)))
+
+    def _write_sprites(self) -> None:
+        from mkdocs import utils
+
+        for sprite_path, symbols in self.sprites.items():
+            # Through the write_file chain so an unchanged sprite is linked from the previous output
+            utils.write_file(render_sprite({**self._previous_symbols(sprite_path), **symbols}), sprite_path)
+
+    def stats(self) -> Dict[str, Any]:
+        return {'pages': self.pages, 'replaced': self.replaced, 'saved_bytes': self.saved_bytes,
+                'symbols': sum(len(symbols) for symbols in self.sprites.values())}
+
+
+def report_icon_sprite(stats: Dict[str, Any]) -> None:
+    """Log how many inline icons the sprite replaced"""
+    if not stats['replaced']:
+        return
+    get_logger(__name__).info(f"Icon sprite: {stats['replaced']} inline SVGs on {stats['pages']} pages "
+                              f"replaced by {stats['symbols']} symbols, saved {stats['saved_bytes'] // 1024} KB")
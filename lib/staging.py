@@ -0,0 +1,188 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Staged Build Output
+Builds into a sibling staging directory, hard-links unchanged files and swaps atomically
+"""
+
+import os
+import shutil
+import filecmp
+import platform
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from .main import patch_function
+from .profiler import profile_phase
+from .logging import get_logger
+
+# renameat2() constants, see linux/fs.h
+AT_FDCWD = -100
+RENAME_EXCHANGE = 2
+
+
+def link_or_copy(source: str, target: str) -> bool:
+    """Hard-link source to target, falling back to a copy
+
+    Returns:
+        True if a hard link was created
+    """
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    if os.path.lexists(target):
+        os.unlink(target)
+    try:
+        os.link(source, target)
+        return True
+    except OSError:
+        shutil.copy2(source, target)
+        return False
+
+
+def exchange_directories(source: Path, target: Path) -> bool:
+    """Atomically exchange two directories
+
+    Uses renameat2(RENAME_EXCHANGE) on Linux so target is never missing.
+    Elsewhere the old target is renamed away first, leaving a window of a
+    single rename where target does not exist.
+
+    Returns:
+        True if the exchange was atomic
+    """
+    if not target.exists():
+        os.replace(source, target)
+        return True
+
+    if platform.system().lower() == 'linux':
+        try:
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            renameat2 = getattr(libc, 'renameat2', None)
+            if renameat2 is not None:
+                result = renameat2(AT_FDCWD, os.fsencode(str(source)),
+                                   AT_FDCWD, os.fsencode(str(target)), RENAME_EXCHANGE)
+                if result == 0:
+                    return True
+        except (OSError, AttributeError):
+            pass
+
+    backup = target.with_name(f".{target.name}.old")
+    shutil.rmtree(backup, ignore_errors=True)
+    os.replace(target, backup)
+    os.replace(source, target)
+    os.replace(backup, source)
+    return False
+
+
+class LinkUnchangedFiles:
+    """Hard-link files whose bytes match the previous output instead of writing them
+
+    Patches mkdocs.utils.write_file and mkdocs.utils.copy_file, which every
+    page, theme template, static asset and the search index go through.
+    Changed files are always written to a fresh inode, so a link into the
+    previous output is never modified in place. Counters are per output
+    path: the i18n plugin writes 404.html, sitemap.xml and the search index
+    once per locale, only the last write of each ends up in the output.
+    """
+
+    def __init__(self, site_dir: str, previous_dir: str):
+        self.site_dir = os.path.abspath(site_dir)
+        self.previous_dir = os.path.abspath(previous_dir)
+        self._linked: Dict[str, int] = {}
+        self._written: Set[str] = set()
+        self._stack: Optional[ExitStack] = None
+
+    def __enter__(self) -> 'LinkUnchangedFiles':
+        from mkdocs import utils
+
+        self._stack = ExitStack()
+        self._stack.enter_context(patch_function(utils, 'write_file', self._write_file))
+        self._stack.enter_context(patch_function(utils, 'copy_file', self._copy_file))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stack.close()
+
+    def _previous_path(self, output_path: str) -> Optional[str]:
+        """Path of the same output in the previous build, if it exists"""
+        output_path = os.path.abspath(output_path)
+        if not output_path.startswith(self.site_dir + os.sep):
+            return None
+        previous = os.path.join(self.previous_dir, os.path.relpath(output_path, self.site_dir))
+        return previous if os.path.isfile(previous) else None
+
+    def _link(self, previous: str, output_path: str) -> None:
+        with profile_phase('link_file', 'io', path=output_path):
+            link_or_copy(previous, output_path)
+        self._written.discard(os.path.abspath(output_path))
+        self._linked[os.path.abspath(output_path)] = os.path.getsize(previous)
+
+    def _write_file(self, original, content: bytes, output_path: str) -> None:
+        previous = self._previous_path(output_path)
+        if previous and os.path.getsize(previous) == len(content):
+            with open(previous, 'rb') as f:
+                if f.read() == content:
+                    self._link(previous, output_path)
+                    return
+        if os.path.lexists(output_path):
+            os.unlink(output_path)
+        self._linked.pop(os.path.abspath(output_path), None)
+        self._written.add(os.path.abspath(output_path))
+        original(content, output_path)
+
+    def _copy_file(self, original, source_path: str, output_path: str) -> None:
+        if os.path.isdir(output_path):
+            output_path = os.path.join(output_path, os.path.basename(source_path))
+        previous = self._previous_path(output_path)
+        if (previous and os.path.getsize(previous) == os.path.getsize(source_path)
+                and filecmp.cmp(source_path, previous, shallow=False)):
+            self._link(previous, output_path)
+            return
+        if os.path.lexists(output_path):
+            os.unlink(output_path)
+        self._linked.pop(os.path.abspath(output_path), None)
+        self._written.add(os.path.abspath(output_path))
+        original(source_path, output_path)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters of linked and written files"""
+        return {'linked': len(self._linked), 'linked_bytes': sum(self._linked.values()),
+                'written': len(self._written)}
+
+
+class StagedOutput:
+    """Staging directory next to the output directory, swapped in on success"""
+
+    def __init__(self, output_dir: str):
+        self.output_dir = Path(output_dir)
+        self.staging_dir = self.output_dir.with_name(f".{self.output_dir.name}.staging")
+
+    def prepare(self) -> str:
+        """Create an empty staging directory and return its path"""
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        self.staging_dir.mkdir(parents=True)
+        return str(self.staging_dir)
+
+    def commit(self) -> None:
+        """Swap the staging directory in and drop the previous output"""
+        logger = get_logger(__name__)
+        atomic = exchange_directories(self.staging_dir, self.output_dir)
+        # After the exchange the staging path holds the previous output
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        logger.debug(f"Swapped staged output into {self.output_dir} ({'atomic' if atomic else 'rename'})")
+
+    def discard(self) -> None:
+        """Remove the staging directory after a failed build"""
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+
+def report_staged_output(stats: Dict[str, int]) -> None:
+    """Log how much of the output was linked instead of written"""
+    logger = get_logger(__name__)
+    logger.info(f"Staged output: wrote {stats['written']} files, hard-linked {stats['linked']} unchanged files "
+                f"({stats['linked_bytes'] / (1024 * 1024):.1f} MB)")
@@ -0,0 +1,122 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Template Cache
+Shares compiled Jinja templates between the theme environments of every build, on disk and in memory
+"""
+
+import hashlib
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Set
+
+import jinja2
+from jinja2.bccache import Bucket, BytecodeCache
+
+from .main import ContentStore, patch_function
+from .logging import get_logger
+
+
+class SharedBytecodeCache(BytecodeCache):
+    """Jinja bytecode cache keyed by template content
+
+    mkdocs creates a new Jinja environment for every build, so each build
+    compiles the theme templates again. Buckets here are keyed by the Jinja
+    version, the template name, its source and the environment settings
+    that change the generated code, not by the file path: the same
+    overrides/main.html of several projects is compiled once.
+
+    Compiled templates are kept in memory and, with cache_dir set, under
+    <cache_dir>/templates so later builds skip compiling as well.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.store = ContentStore(Path(cache_dir) / 'templates') if cache_dir else None
+        self._lock = threading.Lock()
+        self._code: Dict[str, bytes] = {}
+        self.hits = 0
+        self.misses = 0
+        self.used: Set[str] = set()
+
+    @staticmethod
+    def _environment_key(environment) -> str:
+        return repr((sorted(environment.extensions), environment.autoescape, environment.optimized,
+                     environment.block_start_string, environment.variable_start_string,
+                     environment.comment_start_string, environment.line_statement_prefix,
+                     environment.trim_blocks, environment.lstrip_blocks, environment.keep_trailing_newline))
+
+    def get_bucket(self, environment, name: str, filename, source: str) -> Bucket:
+        checksum = self.get_source_checksum(source)
+        key = hashlib.sha1(f"{jinja2.__version__}|{self._environment_key(environment)}|{name}|{checksum}"
+                           .encode('utf-8')).hexdigest()
+        bucket = Bucket(environment, key, checksum)
+        self.load_bytecode(bucket)
+        return bucket
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        with self._lock:
+            self.used.add(bucket.key)
+            code = self._code.get(bucket.key)
+        if code is None and self.store is not None:
+            code = self.store.read(bucket.key)
+        with self._lock:
+            if code is None:
+                self.misses += 1
+                return
+            self._code[bucket.key] = code
+            self.hits += 1
+        # Resets the bucket when the magic header or source checksum does not match
+        bucket.bytecode_from_string(code)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        code = bucket.bytecode_to_string()
+        with self._lock:
+            self._code[bucket.key] = code
+        if self.store is not None:
+            self.store.write(bucket.key, code)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._code.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'used': sorted(self.used)}
+
+    def prune(self, used: Set[str]) -> int:
+        """Remove the entries on disk the last build did not use"""
+        if self.store is None:
+            return 0
+        return self.store.prune(used)
+
+    def report(self) -> None:
+        """Log how many template loads skipped compiling"""
+        report_template_cache(self.stats())
+
+
+def report_template_cache(stats: Dict[str, Any]) -> None:
+    """Log the hits and misses of a template cache"""
+    total = stats['hits'] + stats['misses']
+    if total:
+        get_logger(__name__).info(f"Template cache: {stats['hits']} of {total} templates loaded precompiled, "
+                                  f"{stats['misses']} compiled")
+
+
+@contextmanager
+def share_compiled_templates(cache: BytecodeCache) -> Iterator[BytecodeCache]:
+    """Give every theme environment created meanwhile the bytecode cache"""
+    from mkdocs.theme import Theme
+
+    def get_env(original, theme):
+        env = original(theme)
+        env.bytecode_cache = cache
+        return env
+
+    with patch_function(Theme, 'get_env', get_env):
+        yield cache
@@ -0,0 +1,193 @@
+"""
+██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+Phantom Documentation Kit - Artifact Transfer
+Streams build artifacts out of a (remote) container, optionally only the files that changed
+"""
+
+import io
+import os
+import json
+import shutil
+import tarfile
+import inspect
+from pathlib import PurePosixPath, Path
+from typing import Dict, Iterable, Iterator, List, Any
+
+from .logging import get_logger
+
+# Chunk size used to copy archive members to disk
+COPY_BUFFER_SIZE = 1024 * 1024
+
+DELTA_LIST = '/tmp/phantom-delta.list'
+
+
+def output_manifest(root: str) -> Dict[str, str]:
+    """Map every file below root to its sha256 (also runs inside the container)"""
+    import hashlib
+    import os
+
+    manifest = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+            manifest[os.path.relpath(path, root).replace(os.sep, '/')] = digest.hexdigest()
+    return manifest
+
+
+# Self-contained script computing output_manifest() in the container
+MANIFEST_SCRIPT = "import json, os, sys\nfrom typing import Dict\n" + inspect.getsource(output_manifest) + (
+    "\nprint(json.dumps(output_manifest(sys.argv[1]) if os.path.isdir(sys.argv[1]) else {}))\n"
+)
+
+
+class ChunkReader(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks (e.g. container.get_archive)"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._buffer = memoryview(b'')
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def _safe_member_path(root: Path, name: str) -> Path:
+    """Resolve an archive member below root, rejecting absolute and parent paths"""
+    member_path = PurePosixPath(name)
+    if member_path.is_absolute() or '..' in member_path.parts:
+        raise ValueError(f"Refusing to extract unsafe path: {name}")
+    return root.joinpath(*member_path.parts)
+
+
+def _write_stream(source, target: Path) -> int:
+    """Copy a file object to target through a temp file, returns the byte count"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = target.with_name(f".{target.name}.part")
+    with open(tmp_file, 'wb') as f:
+        shutil.copyfileobj(source, f, COPY_BUFFER_SIZE)
+        size = f.tell()
+    # Replaces the directory entry only, hard links of the old file stay intact
+    os.replace(tmp_file, target)
+    return size
+
+
+class ArtifactTransfer:
+    """Copies build results out of a container without buffering them in memory"""
+
+    def __init__(self, container: Any, app_dir: str = '/app'):
+        self.container = container
+        self.app_dir = app_dir
+
+    def _exec(self, cmd: List[str]) -> bytes:
+        """Run a command in the container and return its stdout"""
+        result = self.container.exec_run(cmd, demux=True)
+        stdout, stderr = result.output or (None, None)
+        if result.exit_code != 0:
+            message = (stderr or stdout or b'').decode('utf-8', errors='replace').strip()
+            raise RuntimeError(f"{' '.join(cmd[:2])} failed in container: {message or 'no output'}")
+        return stdout or b''
+
+    def _open_archive(self, remote_path: str) -> tarfile.TarFile:
+        """Open the tar stream of container.get_archive() in streaming mode"""
+        bits, _ = self.container.get_archive(remote_path)
+        return tarfile.open(fileobj=io.BufferedReader(ChunkReader(bits), COPY_BUFFER_SIZE), mode='r|')
+
+    def fetch_file(self, remote_file: str, local_file: Path) -> int:
+        """Stream a single file from the container to local_file
+
+        Returns:
+            Number of bytes written
+        """
+        name = PurePosixPath(remote_file).name
+        with self._open_archive(remote_file) as archive:
+            for member in archive:
+                if member.isfile() and member.name == name:
+                    return _write_stream(archive.extractfile(member), local_file)
+        raise FileNotFoundError(f"{remote_file} not found in container archive")
+
+    def sync_delta(self, remote_dir: str, local_dir: Path) -> Dict[str, int]:
+        """Mirror remote_dir into local_dir, transferring only files whose hash differs
+
+        The container hashes its output, the result is compared with the local
+        copy and only new or changed files are packed (tar.gz) and streamed over.
+        Local files that no longer exist in the container are removed.
+
+        Returns:
+            Counts of transferred, unchanged and deleted files and transferred bytes
+        """
+        logger = get_logger(__name__)
+        remote_path = f"{self.app_dir}/{remote_dir}"
+        local_dir.mkdir(parents=True, exist_ok=True)
+
+        remote = json.loads(self._exec(['python', '-c', MANIFEST_SCRIPT, remote_path]) or b'{}')
+        local = output_manifest(str(local_dir))
+        changed = sorted(path for path, digest in remote.items() if local.get(path) != digest)
+        deleted = sorted(path for path in local if path not in remote)
+        logger.info(f"Delta transfer: {len(changed)} changed, {len(remote) - len(changed)} unchanged, "
+                    f"{len(deleted)} removed")
+
+        transferred_bytes = 0
+        if changed:
+            delta_archive = '/tmp/phantom-delta.tar.gz'
+            self._put_file(DELTA_LIST, '\0'.join(changed).encode('utf-8'))
+            self._exec(['tar', '-czf', delta_archive, '-C', remote_path, '--null', '-T', DELTA_LIST])
+            try:
+                with self._open_archive(delta_archive) as outer:
+                    for member in outer:
+                        if member.isfile() and member.name == PurePosixPath(delta_archive).name:
+                            inner_stream = outer.extractfile(member)
+                            with tarfile.open(fileobj=inner_stream, mode='r|gz') as inner:
+                                for entry in inner:
+                                    if entry.isfile():
+                                        target = _safe_member_path(local_dir, entry.name)
+                                        transferred_bytes += _write_stream(inner.extractfile(entry), target)
+                            break
+            finally:
+                self.container.exec_run(['rm', '-f', delta_archive, DELTA_LIST])
+
+        for path in deleted:
+            target = _safe_member_path(local_dir, path)
+            target.unlink()
+            # Drop directories the removal left empty
+            parent = target.parent
+            while parent != local_dir and not any(parent.iterdir()):
+                parent.rmdir()
+                parent = parent.parent
+
+        return {
+            'transferred': len(changed),
+            'unchanged': len(remote) - len(changed),
+            'deleted': len(deleted),
+            'bytes': transferred_bytes
+        }
+
+    def _put_file(self, remote_file: str, content: bytes) -> None:
+        """Upload a small file into the container"""
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode='w') as archive:
+            info = tarfile.TarInfo(PurePosixPath(remote_file).name)
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+        if not self.container.put_archive(str(PurePosixPath(remote_file).parent), buffer.getvalue()):
+            raise RuntimeError(f"Failed to upload {remote_file} to container")
@@ -0,0 +1,57 @@
+/**
+ * ██████╗ ██╗  ██╗ █████╗ ███╗   ██╗████████╗ ██████╗ ███╗   ███╗
+ * ██╔══██╗██║  ██║██╔══██╗████╗  ██║╚══██╔══╝██╔═══██╗████╗ ████║
+ * ██████╔╝███████║███████║██╔██╗ ██║   ██║   ██║   ██║██╔████╔██║
+ * ██╔═══╝ ██╔══██║██╔══██║██║╚██╗██║   ██║   ██║   ██║██║╚██╔╝██║
+ * ██║     ██║  ██║██║  ██║██║ ╚████║   ██║   ╚██████╔╝██║ ╚═╝ ██║
+ * ╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝    ╚═════╝ ╚═╝     ╚═╝
+ * Copyright (c) 2025 Rıza Emre ARAS <r.emrearas@proton.me>
+ */
+
+(function() {
+    'use strict';
+
+    const INDEX_SUFFIX = '/search/search_index.json';
+
+    const meta = document.querySelector('meta[name="phantom-search-locale"]');
+    if (!meta || !meta.content) return;
+    const locale = meta.content;
+    const otherLocales = (meta.dataset.locales || '').split(' ').filter(function(code) {
+        return code && code !== locale;
+    });
+
+    /**
+     * Shard of a locale next to the full search index
+     */
+    function shardUrl(indexUrl, code) {
+        return indexUrl.slice(0, -INDEX_SUFFIX.length) + '/search/search_index.' + code + '.json';
+    }
+
+    /**
+     * Warm the HTTP cache with the shards of the other locales once the browser is idle
+     */
+    function prefetchOtherShards(indexUrl) {
+        const idle = window.requestIdleCallback || function(callback) { setTimeout(callback, 2000); };
+        idle(function() {
+            otherLocales.forEach(function(code) {
+                const link = document.createElement('link');
+                link.rel = 'prefetch';
+                link.as = 'fetch';
+                link.href = shardUrl(indexUrl, code);
+                document.head.appendChild(link);
+            });
+        });
+    }
+
+    // Material for MkDocs requests the search index with XMLHttpRequest, load
+    // the shard of the page locale instead of every locale
+    const open = XMLHttpRequest.prototype.open;
+    XMLHttpRequest.prototype.open = function(method, url) {
+        const href = String(url);
+        if (href.split(/[?#]/)[0].endsWith(INDEX_SUFFIX)) {
+            arguments[1] = shardUrl(href.split(/[?#]/)[0], locale);
+            prefetchOtherShards(href.split(/[?#]/)[0]);
+        }
+        return open.apply(this, arguments);
+    };
+})();
@@ -65,12 +65,72 @@ Remote Docker modunda Mutagen kritik rol oynar:
 
 Ana Fonksiyonlar:
 ----------------
-- check_vendor_files(): Vendor bağımlılıklarını kontrol eder. (tools/vendor-builder)
-- build_vendor_files(): Eksik vendor dosyalarını derler. (tools/vendor-builder)
+- check_vendor_files(): Vendor dosyalarını vendor.lock özetlerine göre doğrular. (tools/vendor-builder)
+- build_vendor_files(): Yalnızca eksik veya değişmiş vendor girdilerini derler. (tools/vendor-builder)
 - serve_docs(): MkDocs sunucusunu başlatır
+- static_serve(): Derlenmiş çıktıyı statik önizleme sunucusu ile sunar
 - native_serve(): Yerel modda çalıştırır
 - docker_serve(): Docker modunda çalıştırır (local veya remote)
 
+Kirli Sayfa Derlemesi (serve.dirty_rebuild):
+-------------------------------------------
+Sunucu, her derlemede sayfa bağımlılık grafiğini kaydeder: markdown kaynağı → sayfa (fallback
+dahil her dilde), template/partial → tüm sayfalar, navigasyon → aynı dildeki sayfalar. Bir dosya
+değiştiğinde yalnızca etkilenen sayfalar yeniden render edilir ve yalnızca bu sayfaları açık olan
+tarayıcılar yenilenir. mkdocs.yml değişikliği veya sayfa ekleme/silme tam derleme yapar.
+
+Bellek İçi Çıktı (serve.in_memory, serve.page_cache_mb):
+-------------------------------------------------------
+Açıkken derleme çıktısı diske yazılmaz: render edilen sayfalar page_cache_mb ile sınırlı bir LRU
+önbellekte tutulur, önbellekten düşen sayfa istendiğinde yeniden render edilir; kopyalanan statik
+dosyalar kaynaklarına referans olarak tutulur. Yavaş şifreli diskler ve uzak container'lar için.
+
+Tembel Derleme (serve.lazy):
+---------------------------
+İlk derleme yalnızca navigasyonu ve dosya listesini hesaplar; her sayfa ilk istendiğinde render
+edilip önbelleğe alınır, kalan sayfalar arka planda bir iş parçacığı tarafından hazırlanır. İlk
+sayfaya erişim süresi docs/ altındaki sayfa sayısından bağımsız olarak saniyeler içindedir.
+Bellek içi çıktıyı kullanır (serve.in_memory gerekmez).
+
+Çoklu Proje (--projects):
+------------------------
+Komut: python serve.py --projects a/mkdocs.yml,b/mkdocs.yml (veya ad=yol)
+Birden fazla dokümantasyon sitesini tek süreçten /<ad>/ önekleriyle sunar. Import edilen modüller,
+derlenmiş tema template'leri, Markdown ve highlight önbellekleri paylaşılır; her projenin config'i,
+izlenen dosyaları, bağımlılık grafiği ve derleme kuyruğu ayrıdır, derlemeler sırayla çalışır. /
+adresi projeleri listeler.
+
+Metrikler (/__phantom/metrics, /__phantom/status):
+-------------------------------------------------
+Sunucu, derleme sayısını, derleme süresi histogramını, değişiklik başına render edilen sayfa
+sayısını, bekleyen değişiklik kuyruğunu, yol sınıfına göre istek sürelerini, değişiklikten tarayıcı
+yenilemesine geçen süreyi ve RSS'i Prometheus metin formatında (/__phantom/metrics) ve JSON olarak
+(/__phantom/status) sunar. Uzak Docker modunda Mutagen senkronizasyon durumu da eklenir.
+
+Statik Önizleme (--static):
+--------------------------
+Komut: python serve.py --static
+Derlenmiş çıktıyı (paths.output_dir) asyncio tabanlı bir HTTP/1.1 sunucusu ile sunar: .br/.gz
+ön-sıkıştırılmış dosyalar, ETag / If-None-Match / If-Modified-Since, Range istekleri, keep-alive ve
+yayındaki (Cloudflare Pages) ile aynı Cache-Control başlıkları; çıktıdaki _headers dosyası da
+uygulanır. Her istek lib.logging üzerinden loglanır. Yayın öncesi yük testleri için uygundur.
+
+Derleme Zamanlayıcı (serve.quiet_period_ms):
+-------------------------------------------
+git checkout veya Mutagen senkronizasyonu gibi toplu değişiklikler tek bir derlemede birleştirilir:
+son dosya olayından sonra quiet_period_ms kadar sessizlik beklenir, derleme sırasında gelen yeni
+değişiklikler çalışan derlemeyi iptal eder ve en fazla bir derleme kuyrukta bekler. Her derlemenin
+kaç dosya olayını kapsadığı loglanır. Dosya izleyici 0.5 saniyede bir tarama yaptığından değer bu
+sürenin üzerinde olmalıdır (varsayılan 600).
+
+Tek Dil Modu (--lang / serve.lang):
+----------------------------------
+Komut: python serve.py --lang en
+i18n eklentisi yalnızca seçilen dili derler; yenileme süresi derlenen dil sayısıyla orantılı
+olduğundan tek dilde çalışırken canlı yenileme hızlanır. Navigasyon ve dil seçici tam derlemedeki
+gibi hesaplanır, derlenmeyen dillere ait bağlantılar mkdocs.yml'deki site_url'e (yayındaki siteye)
+yönlenir. Varsayılan olmayan bir dilde sitenin kökü o dilin köküne (örn. /tr/) yönlendirilir.
+
 Ortam Değişkenleri:
 ------------------
 - DOCKER_MODE: Docker container içinde çalışıyor mu?
@@ -135,12 +195,72 @@ Mutagen plays a critical role in Remote Docker mode:
 
 Main Functions:
 --------------
-- check_vendor_files(): Checks vendor dependencies (tools/vendor-builder)
-- build_vendor_files(): Compiles missing vendor files (tools/vendor-builder)
+- check_vendor_files(): Verifies vendor files against the vendor.lock hashes (tools/vendor-builder)
+- build_vendor_files(): Compiles only the missing or changed vendor entries (tools/vendor-builder)
 - serve_docs(): Starts MkDocs server
+- static_serve(): Serves the built output with the static preview server
 - native_serve(): Runs in native mode
 - docker_serve(): Runs in Docker mode (local or remote)
 
+Dirty-Page Rebuilds (serve.dirty_rebuild):
+-----------------------------------------
+The server records a page dependency graph on every build: markdown source → pages (in every
+locale, fallbacks included), template/partial → all pages, navigation → pages of the same locale.
+A change re-renders only the affected pages and only browsers showing those pages reload.
+Editing mkdocs.yml or adding/removing a page triggers a full rebuild.
+
+In-Memory Output (serve.in_memory, serve.page_cache_mb):
+-------------------------------------------------------
+When enabled, the build output is not written to disk: rendered pages live in an LRU cache
+bounded by page_cache_mb and an evicted page is rendered again when requested; copied static
+files are kept as references to their sources. Meant for slow encrypted disks and remote containers.
+
+Lazy Builds (serve.lazy):
+------------------------
+The initial build only computes the navigation and the file list; each page is rendered and
+cached the first time it is requested while a background thread warms up the rest. The first
+page is reachable within seconds regardless of how many pages live under docs/. Uses the
+in-memory output (serve.in_memory is not required).
+
+Multiple Projects (--projects):
+------------------------------
+Command: python serve.py --projects a/mkdocs.yml,b/mkdocs.yml (or name=path)
+Serves several documentation sites from one process below /<name>/ prefixes. Imported modules,
+compiled theme templates, Markdown and highlight caches are shared; each project keeps its own
+config, watched files, dependency graph and rebuild queue, and builds run one at a time. / lists
+the projects.
+
+Metrics (/__phantom/metrics, /__phantom/status):
+-----------------------------------------------
+The server exposes the rebuild count, a rebuild latency histogram, pages rendered per change, the
+pending change queue, request latency per path class, the time from a file change to the browser
+reload and its RSS in the Prometheus text format (/__phantom/metrics) and as JSON
+(/__phantom/status). In remote Docker mode the Mutagen sync status is included.
+
+Static Preview (--static):
+-------------------------
+Command: python serve.py --static
+Serves the built output (paths.output_dir) with an asyncio HTTP/1.1 server: precompressed .br/.gz
+files, ETag / If-None-Match / If-Modified-Since, Range requests, keep-alive and the same
+Cache-Control headers as production (Cloudflare Pages); a _headers file in the output is applied.
+Every request is logged through lib.logging. Suitable for load tests before deploying.
+
+Rebuild Scheduler (serve.quiet_period_ms):
+-----------------------------------------
+Bursts of changes such as a git checkout or a Mutagen sync batch are coalesced into one rebuild:
+it starts after quiet_period_ms without file events, newer changes cancel a running rebuild and
+at most one rebuild is queued. The number of file events each rebuild absorbed is logged. The
+file watcher polls every 0.5 seconds, so the value should stay above that (default 600).
+
+Single-Locale Mode (--lang / serve.lang):
+----------------------------------------
+Command: python serve.py --lang en
+The i18n plugin builds only the chosen locale; rebuild time scales with the number of locales,
+so live reload gets faster while working in one language. Navigation and the language switcher
+are computed as in a full build, links to locales that are not built point to site_url of
+mkdocs.yml (the published site). With a non-default locale the site root redirects to the root
+of that locale (e.g. /tr/).
+
 Environment Variables:
 --------------------
 - DOCKER_MODE: Running inside Docker container?
@@ -151,7 +271,6 @@ Environment Variables:
 
 import sys
 import os
-import json
 import argparse
 import platform
 
@@ -173,7 +292,7 @@ from lib import (
 sys.tracebacklimit = 0 if '--verbose' not in sys.argv and '-v' not in sys.argv else None
 
 def check_vendor_files():
-    """Check if all required vendor files exist"""
+    """Check if all required vendor files exist and match vendor.lock"""
     config_data = load_config()
     vendor_manager = VendorManager(config_data)
     logger_ = get_logger(__name__)
@@ -182,38 +301,11 @@ def check_vendor_files():
         logger_.warning("Vendor directory not found")
         return False
     
-    if not vendor_manager.dependencies_file.exists():
-        logger_.warning(f"Dependencies file not found: {vendor_manager.dependencies_file}")
-        return False
+    stale_entries = vendor_manager.stale_entries()
+    for entry, reason in stale_entries.items():
+        logger_.warning(f"Vendor entry {entry}: {reason}")
     
-    # Parse dependencies.json to get required files
-    try:
-        with open(vendor_manager.dependencies_file, 'r', encoding='utf-8') as deps_file:
-            deps = json.load(deps_file)
-            
-        missing_files = []
-        for dep in deps.get('dependencies', []):
-            expected_filename = vendor_manager.get_expected_filename(dep)
-            
-            file_path = vendor_manager.vendor_dir / expected_filename
-            if not file_path.exists():
-                missing_files.append(expected_filename)
-                logger_.warning(f"Missing vendor file: {expected_filename}")
-        
-        # Also check for webfonts directory (special case for Font Awesome)
-        webfonts_dir = vendor_manager.vendor_dir / 'webfonts'
-        if not webfonts_dir.exists():
-            logger_.warning("Missing vendor directory: webfonts")
-            return False
-        
-        return len(missing_files) == 0
-            
-    except json.JSONDecodeError as json_err:
-        logger_.error(f"Error parsing dependencies.json: {json_err}")
-        return False
-    except Exception as err:
-        logger_.error(f"Error reading dependencies: {err}")
-        return False
+    return len(stale_entries) == 0
 
 def build_vendor_files():
     """Build vendor dependencies"""
@@ -235,11 +327,12 @@ def build_vendor_files():
         logger_.error("Failed to build vendor files")
         return False
 
-def serve_docs():
-    """Start MkDocs development server"""
+def serve_docs(lang=None, projects=None):
+    """Start MkDocs development server (lang serves a single locale, projects several sites)"""
     config_data = load_config()
     port = config_data.get('serve', {}).get('port', 8000)
     host = config_data.get('serve', {}).get('host', 'localhost')
+    lang = lang or config_data['serve'].get('lang') or None
     logger_ = get_logger(__name__)
     
     # Check if running in Docker and not using remote Docker
@@ -255,12 +348,47 @@ def serve_docs():
     try:
         # Import MkDocs modules
         from mkdocs.commands.serve import serve
+        from lib import serve_site, serve_projects, parse_projects
         
         # Set up MkDocs logging integration
         setup_mkdocs_logging()
         
         # Start the development server with config file path
-        serve(config_file='mkdocs.yml', dev_addr=dev_addr, livereload=True)
+        if config_data['serve'].get('dirty_rebuild', True):
+            # Only re-render the pages a change affects
+            page_cache_size = None
+            lazy = config_data['serve'].get('lazy', False)
+            if lazy or config_data['serve'].get('in_memory', False):
+                # Keep the output in memory, rendered pages bounded by an LRU cache
+                page_cache_size = config_data['serve'].get('page_cache_mb', 64) * 1024 * 1024
+            quiet_period = config_data['serve'].get('quiet_period_ms', 600) / 1000
+            # Compiled templates, converted pages and highlighted code of earlier builds and serve sessions
+            cache_dir = config_data['paths'].get('cache_dir', 'outputs/.cache')
+            template_cache = cache_dir if config_data['build'].get('template_cache', True) else None
+            markdown_cache = cache_dir if config_data['build'].get('markdown_cache', True) else None
+            highlight = None
+            if config_data['build'].get('highlight_cache_mb', 32) > 0:
+                highlight = {'cache_dir': cache_dir,
+                             'max_bytes': config_data['build'].get('highlight_cache_mb', 32) * 1024 * 1024}
+            if projects:
+                # Several projects in one process, each below /<name>/
+                serve_projects(parse_projects(projects.split(',')), dev_addr=dev_addr, livereload=True,
+                               lang=lang, quiet_period=quiet_period, page_cache_size=page_cache_size, lazy=lazy,
+                               template_cache=template_cache, markdown_cache=markdown_cache,
+                               highlight=highlight)
+            else:
+                serve_site(config_file='mkdocs.yml', dev_addr=dev_addr, livereload=True, lang=lang,
+                           quiet_period=quiet_period, page_cache_size=page_cache_size, lazy=lazy,
+                           template_cache=template_cache, markdown_cache=markdown_cache,
+                           highlight=highlight)
+        else:
+            if projects:
+                logger_.warning("Serving several projects requires serve.dirty_rebuild, serving mkdocs.yml")
+            if lang:
+                logger_.warning("Serving a single locale requires serve.dirty_rebuild, serving every locale")
+            if config_data['serve'].get('lazy', False):
+                logger_.warning("Lazy builds require serve.dirty_rebuild, building every page up front")
+            serve(config_file='mkdocs.yml', dev_addr=dev_addr, livereload=True)
         
     except KeyboardInterrupt:
         logger_.info("Stopping server...")
@@ -273,7 +401,32 @@ def serve_docs():
         logger_.error(f"Error running MkDocs: {mkdocs_err}")
         sys.exit(1)
 
-def native_serve():
+def static_serve():
+    """Serve the built output directory like the production CDN"""
+    config_data = load_config()
+    port = config_data.get('serve', {}).get('port', 8000)
+    host = config_data.get('serve', {}).get('host', 'localhost')
+    output_dir = config_data['paths']['output_dir']
+    logger_ = get_logger(__name__)
+
+    if not os.path.isfile(os.path.join(output_dir, 'index.html')):
+        logger_.critical(f"No built site in {output_dir}")
+        logger_.critical("Build it first with: python build.py")
+        sys.exit(1)
+
+    # Imported here, asyncio is only needed by this mode
+    from lib import serve_static
+
+    logger_.info("Press Ctrl+C to stop")
+    try:
+        serve_static(output_dir, host=host, port=port)
+    except KeyboardInterrupt:
+        logger_.info("Stopping server...")
+    except OSError as server_err:
+        logger_.error(f"Cannot serve on {host}:{port}: {server_err}")
+        sys.exit(1)
+
+def native_serve(lang=None, projects=None):
     """Run serve in native mode"""
     config_data = load_config()
     logger_ = get_logger(__name__)
@@ -302,10 +455,10 @@ def native_serve():
             logger_.info("All vendor files are present")
     
     # Start development server
-    serve_docs()
+    serve_docs(lang, projects)
 
 # noinspection DuplicatedCode
-def docker_serve():
+def docker_serve(lang=None):
     """Run serve in Docker mode"""
     logger_ = get_logger(__name__)
     
@@ -346,7 +499,7 @@ def docker_serve():
     # Run serve in container
     try:
         port = config_data.get('serve', {}).get('port', 8000)
-        docker_manager.run_serve(port=port)
+        docker_manager.run_serve(port=port, lang=lang or '')
     except KeyboardInterrupt:
         logger_.info("Stopping container...")
     finally:
@@ -366,6 +519,21 @@ def main():
         action='store_true',
         help='Run server in Docker container'
     )
+    parser.add_argument(
+        '--static',
+        action='store_true',
+        help='Serve the built output directory (paths.output_dir) instead of a live build'
+    )
+    parser.add_argument(
+        '--lang',
+        metavar='LOCALE',
+        help='Build and serve only this locale (overrides serve.lang in config.json)'
+    )
+    parser.add_argument(
+        '--projects',
+        metavar='[NAME=]CONFIG,...',
+        help='Serve several mkdocs projects from one process, each below /NAME/ (default: its directory)'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -403,7 +571,11 @@ def main():
         init_logging(config)
     
     # Run in appropriate mode
-    if args.docker:
+    if args.static:
+        if args.docker or args.lang or args.projects:
+            logger_.warning("--docker, --lang and --projects do not apply to --static, serving the built output")
+        static_serve()
+    elif args.docker:
         # Check if Windows
         if platform.system().lower() == 'windows':
             logger_.warning("Docker mode is not supported on Windows due to signal handling limitations")
@@ -411,9 +583,11 @@ def main():
             sys.exit(1)
         else:
             logger_.info("Running in Docker mode")
-            docker_serve()
+            if args.projects:
+                logger_.warning("--projects only covers native serving, ignoring it in Docker mode")
+            docker_serve(args.lang)
     else:
-        native_serve()
+        native_serve(args.lang, args.projects)
 
 if __name__ == "__main__":
     try:
@@ -107,6 +107,15 @@
  * ---------------
  * - Otomatik minifikasyon (zaten minified değilse)
  * - Font Awesome özel işleme (webfonts dizini)
+ * - Seçici derleme: "npm run build -- chart.umd.js fontawesome" yalnızca verilen girdileri derler
+ *   (dependencies.json'daki "to" adı veya yerleşik "fontawesome")
+ *
+ * vendor.lock:
+ * ------------
+ * VendorManager her girdinin paket sürüm aralığını, kaynak yolunu, minify bayrağını ve ürettiği
+ * dosyaların sha256 özetini vendor.lock dosyasına yazar. Kontrol yalnızca bu özetleri doğrular;
+ * girdisi değişen veya dosyası bozulan girdiler için build.js sadece o girdilerle çalıştırılır.
+ * Dosyalar kilitle eşleşiyorsa Node.js hiç gerekmez.
  * 
  * Entegrasyon Noktaları:
  * ---------------------
@@ -217,6 +226,15 @@
  * ------------
  * - Automatic minification (if not already minified)
  * - Special Font Awesome handling (webfonts directory)
+ * - Selective builds: "npm run build -- chart.umd.js fontawesome" only builds the given entries
+ *   (the "to" name from dependencies.json or the built-in "fontawesome")
+ *
+ * vendor.lock:
+ * ------------
+ * VendorManager records the package version range, source path, minify flag and the sha256 of
+ * every produced file of each entry in vendor.lock. Checking only verifies these hashes; build.js
+ * runs for just the entries whose inputs changed or whose files are corrupt. Node.js is not
+ * needed at all while the files match the lock.
  * 
  * Integration Points:
  * ------------------
@@ -269,12 +287,31 @@ const FONT_AWESOME_CONFIG = {
   }
 };
 
+// Built-in entry name used by vendor.lock and the command line filter
+const FONT_AWESOME_ENTRY = 'fontawesome';
+
+// Optional entry filter: "npm run build -- chart.umd.js fontawesome" rebuilds only
+// those entries (the "to" name of a dependency, or "fontawesome")
+const ONLY_ENTRIES = process.argv.slice(2);
+
 // Load dependencies from JSON file
 let DEPENDENCIES = [];
 try {
   const dependenciesData = JSON.parse(fs.readFileSync(DEPENDENCIES_FILE, 'utf8'));
   DEPENDENCIES = dependenciesData.dependencies;
   console.log(`[INFO] Loaded ${DEPENDENCIES.length} dependencies from dependencies.json`);
+
+  const knownEntries = DEPENDENCIES.map(dep => dep.to).concat(FONT_AWESOME_ENTRY);
+  const unknownEntries = ONLY_ENTRIES.filter(entry => !knownEntries.includes(entry));
+  if (unknownEntries.length > 0) {
+    console.error(`[ERROR] Unknown vendor entries: ${unknownEntries.join(', ')}`);
+    console.error(`   Known entries: ${knownEntries.join(', ')}`);
+    process.exit(1);
+  }
+  if (ONLY_ENTRIES.length > 0) {
+    DEPENDENCIES = DEPENDENCIES.filter(dep => ONLY_ENTRIES.includes(dep.to));
+    console.log(`[INFO] Rebuilding only: ${ONLY_ENTRIES.join(', ')}`);
+  }
 } catch (error) {
   console.error(`[ERROR] Error loading dependencies.json:`, error.message);
   process.exit(1);
@@ -479,6 +516,8 @@ async function build() {
   ensureDirectoryExists(VENDOR_DIR);
 
   let successCount = 0;
+  const buildFontAwesome = ONLY_ENTRIES.length === 0 || ONLY_ENTRIES.includes(FONT_AWESOME_ENTRY);
+  const totalCount = DEPENDENCIES.length + (buildFontAwesome ? 1 : 0);
 
   // Copy each dependency (excluding Font Awesome as it's now built-in)
   for (const dep of DEPENDENCIES) {
@@ -492,17 +531,16 @@ async function build() {
   }
 
   // Process Font Awesome as built-in dependency
-  const fontAwesomeSuccess = await processFontAwesome();
-  if (fontAwesomeSuccess) {
+  if (buildFontAwesome && await processFontAwesome()) {
     successCount++;
   }
 
   // Summary
   console.log(`\n[SUMMARY] Build Summary:`);
-  console.log(`   Successfully copied: ${successCount}/${DEPENDENCIES.length + 1} items`); // +1 for Font Awesome
+  console.log(`   Successfully copied: ${successCount}/${totalCount} items`);
   console.log(`   Output directory: ${path.relative(process.cwd(), VENDOR_DIR)}`);
 
-  if (successCount < DEPENDENCIES.length + 1) { // +1 for Font Awesome
+  if (successCount < totalCount) {
     console.log(`\n[WARNING] Some files could not be copied. Please check the errors above.`);
     process.exit(1);
   } else {